@@ -2,6 +2,7 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
+import asyncio
 
 from routers import (
     ecuaciones_no_lineales,
@@ -9,6 +10,8 @@ from routers import (
     series_taylor,
     sistemas_ecuaciones
 )
+from services.ejecutor import ejecutor
+from services.expresiones import cache_conjuntos, cache_expresiones
 
 # Crear la aplicación FastAPI
 app = FastAPI(
@@ -53,6 +56,15 @@ app.include_router(
     tags=["Sistemas de Ecuaciones"]
 )
 
+@app.on_event("startup")
+async def iniciar_ejecutor():
+    # Pre-calienta los procesos que evalúan las funciones de los usuarios
+    await asyncio.get_running_loop().run_in_executor(None, ejecutor.iniciar)
+
+@app.on_event("shutdown")
+async def cerrar_ejecutor():
+    ejecutor.cerrar()
+
 @app.get("/")
 async def root():
     return {
@@ -64,7 +76,19 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    """
+    Estado del servicio. Las estadísticas de las cachés corresponden solo al
+    proceso principal, que compila las funciones para validarlas y estimar su
+    costo; las resoluciones se ejecutan en los trabajadores del ejecutor, cada
+    uno con sus propias cachés, que no se informan aquí.
+    """
+    return {
+        "status": "healthy",
+        "alcance_caches": "proceso_principal",
+        "cache_expresiones": cache_expresiones.estadisticas(),
+        "cache_conjuntos": cache_conjuntos.estadisticas(),
+        "ejecutor": ejecutor.estadisticas()
+    }
 
 if __name__ == "__main__":
     uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True)
@@ -10,6 +10,24 @@ class BiseccionRequest(BaseModel):
     funcion: str = Field(..., description="Función f(x) como string")
     tipo_error: str = Field(default="absoluto", description="Tipo de error: 'absoluto' o 'relativo'")
 
+class BrentRequest(BaseModel):
+    xi: float = Field(..., description="Extremo izquierdo del intervalo")
+    xs: float = Field(..., description="Extremo derecho del intervalo")
+    tolerancia: float = Field(..., gt=0, description="Tolerancia del método")
+    niter: int = Field(..., gt=0, description="Número máximo de iteraciones")
+    funcion: str = Field(..., description="Función f(x) como string")
+    tipo_error: str = Field(default="absoluto", description="Tipo de error: 'absoluto' o 'relativo'")
+
+class NewtonSeguroRequest(BaseModel):
+    xi: float = Field(..., description="Extremo izquierdo del intervalo")
+    xs: float = Field(..., description="Extremo derecho del intervalo")
+    x0: Optional[float] = Field(default=None, description="Valor inicial dentro del intervalo; por defecto el punto medio")
+    tolerancia: float = Field(..., gt=0, description="Tolerancia del método")
+    niter: int = Field(..., gt=0, description="Número máximo de iteraciones")
+    funcion_f: str = Field(..., description="Función f(x) como string")
+    funcion_df: Optional[str] = Field(default=None, description="Derivada f'(x) como string; si se omite se calcula simbólicamente")
+    tipo_error: str = Field(default="absoluto", description="Tipo de error: 'absoluto' o 'relativo'")
+
 class PuntoFijoRequest(BaseModel):
     x0: float = Field(..., description="Valor inicial")
     tolerancia: float = Field(..., gt=0, description="Tolerancia del método")
@@ -17,6 +35,7 @@ class PuntoFijoRequest(BaseModel):
     funcion_f: str = Field(..., description="Función f(x) original")
     funcion_g: str = Field(..., description="Función de iteración g(x)")
     tipo_error: str = Field(default="absoluto", description="Tipo de error: 'absoluto' o 'relativo'")
+    aceleracion: str = Field(default="ninguna", description="Aceleración: 'ninguna', 'aitken' o 'steffensen'")
 
 class ReglaFalsaRequest(BaseModel):
     x0: float = Field(..., description="Extremo izquierdo del intervalo")
@@ -25,27 +44,99 @@ class ReglaFalsaRequest(BaseModel):
     niter: int = Field(..., gt=0, description="Número máximo de iteraciones")
     funcion: str = Field(..., description="Función f(x) como string")
     tipo_error: str = Field(default="absoluto", description="Tipo de error: 'absoluto' o 'relativo'")
+    variante: str = Field(default="clasica", description="Variante: 'clasica', 'illinois', 'pegasus' o 'anderson-bjorck'")
 
 class BusquedaIncrementalRequest(BaseModel):
     x0: float = Field(..., description="Valor inicial")
     delta: float = Field(..., gt=0, description="Incremento")
     niter: int = Field(..., gt=0, description="Número máximo de iteraciones")
     funcion: str = Field(..., description="Función f(x) como string")
+    todos: bool = Field(default=False, description="Devolver todos los intervalos con cambio de signo en [x0, x0 + niter·delta]")
+    adaptativo: bool = Field(default=False, description="Con 'todos', descartar regiones sin raíces con pasos crecientes")
+
+class TodasLasRaicesRequest(BaseModel):
+    xi: float = Field(..., description="Extremo izquierdo del intervalo")
+    xs: float = Field(..., description="Extremo derecho del intervalo")
+    funcion: str = Field(..., description="Función f(x) como string")
+    tolerancia: float = Field(default=1e-10, gt=0, description="Tolerancia del refinamiento de cada raíz")
+    niter: int = Field(default=100, gt=0, description="Número máximo de iteraciones por raíz")
+    subintervalos: int = Field(default=1000, gt=0, description="Pasos de la malla de búsqueda de cambios de signo")
+    adaptativo: bool = Field(default=True, description="Descartar regiones sin raíces con aritmética de intervalos")
+
+class RaicesPolinomioRequest(BaseModel):
+    funcion: str = Field(..., description="Polinomio p(x) como string")
+    tolerancia: float = Field(default=1e-12, gt=0, description="Tolerancia del pulido con Newton")
+    niter: int = Field(default=50, gt=0, description="Pasos de Newton máximos por raíz")
+
+class CuencaNewtonRequest(BaseModel):
+    funcion_f: str = Field(..., description="Función f(z) como string (en la variable x)")
+    funcion_df: Optional[str] = Field(default=None, description="Derivada f'(z) como string; si se omite se calcula simbólicamente")
+    re_min: float = Field(default=-2.0, description="Parte real mínima de la región")
+    re_max: float = Field(default=2.0, description="Parte real máxima de la región")
+    im_min: float = Field(default=-2.0, description="Parte imaginaria mínima de la región")
+    im_max: float = Field(default=2.0, description="Parte imaginaria máxima de la región")
+    ancho: int = Field(default=400, gt=0, le=1000, description="Píxeles de la malla en el eje real")
+    alto: int = Field(default=400, gt=0, le=1000, description="Píxeles de la malla en el eje imaginario")
+    tolerancia: float = Field(default=1e-10, gt=0, description="Tolerancia relativa del paso de Newton")
+    niter: int = Field(default=50, gt=0, le=1000, description="Número máximo de iteraciones por píxel")
+    formato: str = Field(default="ambos", description="Salida: 'png', 'arreglo' (mapas uint8/uint16 en base64) o 'ambos'")
+
+class MullerRequest(BaseModel):
+    x0: float = Field(..., description="Primer valor inicial")
+    x1: float = Field(..., description="Segundo valor inicial")
+    x2: float = Field(..., description="Tercer valor inicial")
+    tolerancia: float = Field(..., gt=0, description="Tolerancia del método")
+    niter: int = Field(..., gt=0, description="Número máximo de iteraciones")
+    funcion: str = Field(..., description="Función f(x) como string")
+    tipo_error: str = Field(default="absoluto", description="Tipo de error: 'absoluto' o 'relativo'")
+
+class SistemaNoLinealRequest(BaseModel):
+    funciones: List[str] = Field(..., description="Una función por ecuación F_i(variables) = 0, como strings")
+    variables: List[str] = Field(default=["x", "y"], description="Nombres de las variables, en el orden de x0")
+    x0: List[float] = Field(..., description="Valor inicial de cada variable")
+    tolerancia: float = Field(..., gt=0, description="Tolerancia del método")
+    niter: int = Field(..., gt=0, description="Número máximo de iteraciones")
+    metodo: str = Field(default="newton", description="Método: 'newton' o 'broyden' (reutiliza el jacobiano con actualizaciones de rango uno)")
+    jacobiano: str = Field(default="automatico", description="Jacobiano: 'automatico' (derivadas simbólicas) o 'diferencias' (diferencias finitas)")
+    tipo_pivoteo: int = Field(default=1, description="Pivoteo de Gauss en cada paso: 0 = sin pivoteo, 1 = parcial, 2 = total")
+    tipo_error: str = Field(default="absoluto", description="Tipo de error: 'absoluto' o 'relativo'")
+
+class ContinuacionRequest(BaseModel):
+    funcion: str = Field(..., description="Función f(x; p) como string, en x y en el parámetro")
+    parametro: str = Field(default="p", description="Nombre del parámetro en la función")
+    valores_parametro: List[float] = Field(..., description="Valores del parámetro, en el orden en que se resuelven")
+    x0: float = Field(..., description="Valor inicial para el primer valor del parámetro")
+    tolerancia: float = Field(..., gt=0, description="Tolerancia del método")
+    niter: int = Field(..., gt=0, description="Número máximo de iteraciones por valor del parámetro")
+    predictor: str = Field(default="ninguno", description="Punto de partida: 'ninguno' (raíz anterior), 'secante' o 'tangente'")
+    tipo_error: str = Field(default="absoluto", description="Tipo de error: 'absoluto' o 'relativo'")
+
+class ResolverRequest(BaseModel):
+    funcion: str = Field(..., description="Función f(x) como string")
+    funcion_df: Optional[str] = Field(default=None, description="Derivada f'(x) para Newton; si se omite se calcula simbólicamente")
+    xi: Optional[float] = Field(default=None, description="Extremo izquierdo de un intervalo con cambio de signo")
+    xs: Optional[float] = Field(default=None, description="Extremo derecho de un intervalo con cambio de signo")
+    x0: Optional[float] = Field(default=None, description="Valor inicial (Newton y secante)")
+    x1: Optional[float] = Field(default=None, description="Segundo valor inicial (secante)")
+    tolerancia: float = Field(..., gt=0, description="Tolerancia del método")
+    niter: int = Field(..., gt=0, description="Número máximo de iteraciones")
+    tipo_error: str = Field(default="absoluto", description="Tipo de error: 'absoluto' o 'relativo'")
+    metodos: Optional[List[str]] = Field(default=None, description="Métodos que compiten; por defecto todos los aplicables")
 
 class NewtonRaphsonRequest(BaseModel):
-    x0: float = Field(..., description="Valor inicial")
+    x0: Union[float, List[float]] = Field(..., description="Valor inicial, o lista de valores iniciales para arranques múltiples")
     tolerancia: float = Field(..., gt=0, description="Tolerancia del método")
     niter: int = Field(..., gt=0, description="Número máximo de iteraciones")
     funcion_f: str = Field(..., description="Función f(x) como string")
-    funcion_df: str = Field(..., description="Derivada f'(x) como string")
+    funcion_df: Optional[str] = Field(default=None, description="Derivada f'(x) como string; si se omite se calcula simbólicamente")
     incluir_error: bool = Field(default=True, description="Incluir columna de error en la tabla")
     tipo_error: str = Field(default="absoluto", description="Tipo de error: 'absoluto' o 'relativo'")
     tipo_precision: str = Field(default="decimales", description="Tipo de precisión: 'decimales' o 'significativas'")
     precision: int = Field(default=6, gt=0, description="Número de decimales o cifras significativas")
 
 class SecanteRequest(BaseModel):
-    x0: float = Field(..., description="Primer valor inicial")
-    x1: float = Field(..., description="Segundo valor inicial")
+    x0: Union[float, List[float]] = Field(..., description="Primer valor inicial, o lista para arranques múltiples")
+    x1: Union[float, List[float]] = Field(..., description="Segundo valor inicial, o lista de la misma longitud que x0")
     tolerancia: float = Field(..., gt=0, description="Tolerancia del método")
     niter: int = Field(..., gt=0, description="Número máximo de iteraciones")
     funcion: str = Field(..., description="Función f(x) como string")
@@ -59,8 +150,8 @@ class RaicesMultiplesRequest(BaseModel):
     tolerancia: float = Field(..., gt=0, description="Tolerancia del método")
     niter: int = Field(..., gt=0, description="Número máximo de iteraciones")
     funcion_f: str = Field(..., description="Función f(x) como string")
-    funcion_df: str = Field(..., description="Primera derivada f'(x) como string")
-    funcion_ddf: str = Field(..., description="Segunda derivada f''(x) como string")
+    funcion_df: Optional[str] = Field(default=None, description="Primera derivada f'(x) como string; si se omite se calcula simbólicamente")
+    funcion_ddf: Optional[str] = Field(default=None, description="Segunda derivada f''(x) como string; si se omite se calcula simbólicamente")
     tipo_error: str = Field(default="absoluto", description="Tipo de error: 'absoluto' o 'relativo'")
     modo: str = Field(default="dc", description="Modo de error: 'cs' (cifras significativas) o 'dc' (decimales correctos)")
 
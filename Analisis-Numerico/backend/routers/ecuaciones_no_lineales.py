@@ -1,14 +1,73 @@
 from fastapi import APIRouter, HTTPException
 from models.schemas import (
-    BiseccionRequest, PuntoFijoRequest, ReglaFalsaRequest, 
+    BiseccionRequest, BrentRequest, NewtonSeguroRequest, PuntoFijoRequest, ReglaFalsaRequest, 
     BusquedaIncrementalRequest, NewtonRaphsonRequest, SecanteRequest, 
-    RaicesMultiplesRequest, MetodoResponse
+    RaicesMultiplesRequest, RaicesPolinomioRequest, CuencaNewtonRequest, ContinuacionRequest, ResolverRequest, MullerRequest, SistemaNoLinealRequest, TodasLasRaicesRequest, MetodoResponse
 )
-from services.ecuaciones_service import EcuacionesService
+from services.complejidad import evaluaciones_vectoriales, limites_complejidad
+from services.ejecutor import EjecutorSaturadoError, ejecutor
+import math
 import time
+from typing import Any, Dict, List
 
 router = APIRouter()
-service = EcuacionesService()
+
+async def _ejecutar_metodo(metodo: str, funciones: List[str | None], evaluaciones: int, /,
+                           **argumentos: Any) -> Dict[str, Any]:
+    """
+    Valida la complejidad de las funciones antes de resolver y ejecuta el método
+    en el carril que corresponda; el costo estimado se agrega al resumen.
+    """
+    costo = limites_complejidad.verificar(funciones, evaluaciones)
+    resultado = await ejecutor.ejecutar(
+        "ecuaciones", metodo, lento=costo["carril"] == "lento", **argumentos
+    )
+    resultado["resumen"] = {**(resultado.get("resumen") or {}), "costo_estimado": costo}
+    return resultado
+
+# Métodos que compiten en /resolver, en orden de preferencia ante empates
+METODOS_RESOLVER = ("biseccion", "regla_falsa", "secante", "newton_raphson")
+
+def _participantes_resolver(request: ResolverRequest) -> Dict[str, tuple[str, str, Dict[str, Any]]]:
+    """Arma los métodos que pueden competir con los datos enviados"""
+    metodos = METODOS_RESOLVER if request.metodos is None else tuple(m.lower() for m in request.metodos)
+    desconocidos = [m for m in metodos if m not in METODOS_RESOLVER]
+    if desconocidos:
+        raise ValueError(
+            f"Métodos desconocidos: {', '.join(desconocidos)}. Use: {', '.join(METODOS_RESOLVER)}"
+        )
+    intervalo = request.xi is not None and request.xs is not None
+    if not intervalo and request.x0 is None:
+        raise ValueError("Indique un intervalo [xi, xs], un valor inicial x0, o ambos")
+    
+    comunes = {"tolerancia": request.tolerancia, "niter": request.niter, "tipo_error": request.tipo_error}
+    participantes = {}
+    if intervalo:
+        participantes["biseccion"] = {"xi": request.xi, "xs": request.xs, "funcion": request.funcion}
+        # Illinois: mismo intervalo que la clásica pero sin el extremo estancado
+        participantes["regla_falsa"] = {"x0": request.xi, "x1": request.xs, "funcion": request.funcion,
+                                        "variante": "illinois"}
+    if request.x0 is not None and request.x1 is not None:
+        participantes["secante"] = {"x0": request.x0, "x1": request.x1, "funcion": request.funcion}
+    elif intervalo:
+        participantes["secante"] = {"x0": request.xi, "x1": request.xs, "funcion": request.funcion}
+    participantes["newton_raphson"] = {
+        "x0": request.x0 if request.x0 is not None else (request.xi + request.xs) / 2,
+        "funcion_f": request.funcion,
+        "funcion_df": request.funcion_df,
+    }
+    
+    participantes = {
+        metodo: ("ecuaciones", metodo, {**argumentos, **comunes})
+        for metodo, argumentos in participantes.items() if metodo in metodos
+    }
+    if not participantes:
+        raise ValueError("Ninguno de los métodos indicados puede usarse con los datos enviados")
+    return participantes
+
+def _convergio(resultado: Dict[str, Any]) -> bool:
+    raiz = resultado.get("resultado")
+    return bool(resultado.get("exito")) and raiz is not None and math.isfinite(raiz)
 
 @router.post("/biseccion", response_model=MetodoResponse)
 async def metodo_biseccion(request: BiseccionRequest):
@@ -23,7 +82,43 @@ async def metodo_biseccion(request: BiseccionRequest):
     """
     try:
         start_time = time.time()
-        resultado = service.biseccion(
+        resultado = await _ejecutar_metodo(
+            "biseccion", [request.funcion], request.niter,
+            xi=request.xi,
+            xs=request.xs,
+            tolerancia=request.tolerancia,
+            niter=request.niter,
+            funcion=request.funcion,
+            tipo_error=request.tipo_error
+        )
+        end_time = time.time()
+        
+        resultado["tiempo_ejecucion"] = end_time - start_time
+        return resultado
+    
+    except EjecutorSaturadoError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/brent", response_model=MetodoResponse)
+async def metodo_brent(request: BrentRequest):
+    """
+    Implementa el método de Brent: interpolación cuadrática inversa y secante con respaldo de bisección.
+    
+    Requiere el mismo intervalo con cambio de signo que la bisección, pero suele converger en
+    muchas menos evaluaciones (ver resumen.nfev).
+    
+    - **xi**: Extremo izquierdo del intervalo
+    - **xs**: Extremo derecho del intervalo
+    - **tolerancia**: Tolerancia del método
+    - **niter**: Número máximo de iteraciones
+    - **funcion**: Función f(x) como string (usar 'x' como variable)
+    """
+    try:
+        start_time = time.time()
+        resultado = await _ejecutar_metodo(
+            "brent", [request.funcion], request.niter,
             xi=request.xi,
             xs=request.xs,
             tolerancia=request.tolerancia,
@@ -36,6 +131,48 @@ async def metodo_biseccion(request: BiseccionRequest):
         resultado["tiempo_ejecucion"] = end_time - start_time
         return resultado
     
+    except EjecutorSaturadoError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/newton-seguro", response_model=MetodoResponse)
+async def metodo_newton_seguro(request: NewtonSeguroRequest):
+    """
+    Implementa Newton-Raphson con salvaguarda de bisección (rtsafe).
+    
+    Mantiene un intervalo con cambio de signo y toma el paso de Newton solo cuando queda
+    dentro de él; en otro caso biseca. Converge siempre, como la bisección, y cerca de la
+    raíz lo hace con la velocidad de Newton.
+    
+    - **xi**: Extremo izquierdo del intervalo
+    - **xs**: Extremo derecho del intervalo
+    - **x0**: Valor inicial dentro del intervalo (opcional; por defecto el punto medio)
+    - **tolerancia**: Tolerancia del método
+    - **niter**: Número máximo de iteraciones
+    - **funcion_f**: Función f(x) como string (usar 'x' como variable)
+    - **funcion_df**: Derivada f'(x) como string (opcional; si se omite se deriva f(x) simbólicamente)
+    """
+    try:
+        start_time = time.time()
+        resultado = await _ejecutar_metodo(
+            "newton_seguro", [request.funcion_f, request.funcion_df], request.niter,
+            xi=request.xi,
+            xs=request.xs,
+            tolerancia=request.tolerancia,
+            niter=request.niter,
+            funcion_f=request.funcion_f,
+            funcion_df=request.funcion_df,
+            x0=request.x0,
+            tipo_error=request.tipo_error
+        )
+        end_time = time.time()
+        
+        resultado["tiempo_ejecucion"] = end_time - start_time
+        return resultado
+    
+    except EjecutorSaturadoError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -49,22 +186,27 @@ async def metodo_punto_fijo(request: PuntoFijoRequest):
     - **niter**: Número máximo de iteraciones
     - **funcion_f**: Función f(x) original
     - **funcion_g**: Función de iteración g(x)
+    - **aceleracion**: 'ninguna', 'aitken' o 'steffensen'
     """
     try:
         start_time = time.time()
-        resultado = service.punto_fijo(
+        resultado = await _ejecutar_metodo(
+            "punto_fijo", [request.funcion_f, request.funcion_g], request.niter,
             x0=request.x0,
             tolerancia=request.tolerancia,
             niter=request.niter,
             funcion_f=request.funcion_f,
             funcion_g=request.funcion_g,
-            tipo_error=request.tipo_error
+            tipo_error=request.tipo_error,
+            aceleracion=request.aceleracion
         )
         end_time = time.time()
         
         resultado["tiempo_ejecucion"] = end_time - start_time
         return resultado
     
+    except EjecutorSaturadoError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -78,22 +220,27 @@ async def metodo_regla_falsa(request: ReglaFalsaRequest):
     - **tolerancia**: Tolerancia del método
     - **niter**: Número máximo de iteraciones
     - **funcion**: Función f(x) como string
+    - **variante**: 'clasica', 'illinois', 'pegasus' o 'anderson-bjorck'
     """
     try:
         start_time = time.time()
-        resultado = service.regla_falsa(
+        resultado = await _ejecutar_metodo(
+            "regla_falsa", [request.funcion], request.niter,
             x0=request.x0,
             x1=request.x1,
             tolerancia=request.tolerancia,
             niter=request.niter,
             funcion=request.funcion,
-            tipo_error=request.tipo_error
+            tipo_error=request.tipo_error,
+            variante=request.variante
         )
         end_time = time.time()
         
         resultado["tiempo_ejecucion"] = end_time - start_time
         return resultado
     
+    except EjecutorSaturadoError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -106,20 +253,327 @@ async def busqueda_incremental(request: BusquedaIncrementalRequest):
     - **delta**: Incremento
     - **niter**: Número máximo de iteraciones
     - **funcion**: Función f(x) como string
+    - **todos**: Devolver todos los intervalos con cambio de signo del rango
+    - **adaptativo**: Con todos, saltar regiones sin raíces con pasos crecientes
     """
     try:
         start_time = time.time()
-        resultado = service.busqueda_incremental(
+        resultado = await _ejecutar_metodo(
+            "busqueda_incremental", [request.funcion], request.niter,
             x0=request.x0,
             delta=request.delta,
             niter=request.niter,
+            funcion=request.funcion,
+            todos=request.todos,
+            adaptativo=request.adaptativo
+        )
+        end_time = time.time()
+        
+        resultado["tiempo_ejecucion"] = end_time - start_time
+        return resultado
+    
+    except EjecutorSaturadoError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/todas-las-raices", response_model=MetodoResponse)
+async def metodo_todas_las_raices(request: TodasLasRaicesRequest):
+    """
+    Encuentra todas las raíces de f(x) en un intervalo.
+    
+    Escanea la malla en busca de cambios de signo, refina cada intervalo con
+    Brent repartiendo los intervalos entre los trabajadores y descarta polos y
+    raíces duplicadas.
+    
+    - **xi**: Extremo izquierdo del intervalo
+    - **xs**: Extremo derecho del intervalo
+    - **funcion**: Función f(x) como string
+    - **tolerancia**: Tolerancia del refinamiento de cada raíz
+    - **niter**: Número máximo de iteraciones por raíz
+    - **subintervalos**: Pasos de la malla de búsqueda
+    - **adaptativo**: Descartar regiones sin raíces con aritmética de intervalos
+    """
+    try:
+        start_time = time.time()
+        costo = limites_complejidad.verificar([request.funcion], request.subintervalos + request.niter)
+        lento = costo["carril"] == "lento"
+        escaneo = await ejecutor.ejecutar(
+            "ecuaciones", "escanear_cambios_signo", lento=lento,
+            xi=request.xi,
+            xs=request.xs,
+            subintervalos=request.subintervalos,
+            funcion=request.funcion,
+            adaptativo=request.adaptativo
+        )
+        refinados = await ejecutor.repartir(
+            "ecuaciones", "refinar_intervalos", "intervalos", escaneo["intervalos"], lento=lento,
+            tolerancia=request.tolerancia,
+            niter=request.niter,
             funcion=request.funcion
         )
+        resultado = await ejecutor.ejecutar(
+            "ecuaciones", "resumir_todas_las_raices", lento=lento,
+            xi=request.xi,
+            xs=request.xs,
+            funcion=request.funcion,
+            tolerancia=request.tolerancia,
+            escaneo={**escaneo, "hallazgos": []},
+            refinados=refinados,
+            tareas=ejecutor.numero_de_lotes(len(escaneo["intervalos"]), lento) if escaneo["intervalos"] else 0
+        )
+        resultado["resumen"] = {**(resultado.get("resumen") or {}), "costo_estimado": costo}
+        end_time = time.time()
+        
+        resultado["tiempo_ejecucion"] = end_time - start_time
+        return resultado
+    
+    except EjecutorSaturadoError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/raices-polinomio", response_model=MetodoResponse)
+async def metodo_raices_polinomio(request: RaicesPolinomioRequest):
+    """
+    Calcula todas las raíces reales y complejas de un polinomio con los valores
+    propios de su matriz compañera, pulidas con Newton.
+    
+    - **funcion**: Polinomio p(x) como string
+    - **tolerancia**: Tolerancia del pulido con Newton
+    - **niter**: Pasos de Newton máximos por raíz
+    """
+    try:
+        start_time = time.time()
+        resultado = await _ejecutar_metodo(
+            "raices_polinomio", [request.funcion], request.niter,
+            funcion=request.funcion,
+            tolerancia=request.tolerancia,
+            niter=request.niter
+        )
+        end_time = time.time()
+        
+        resultado["tiempo_ejecucion"] = end_time - start_time
+        return resultado
+    
+    except EjecutorSaturadoError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/cuenca-newton", response_model=MetodoResponse)
+async def metodo_cuenca_newton(request: CuencaNewtonRequest):
+    """
+    Aplica Newton desde cada punto de una malla de valores iniciales complejos y
+    devuelve, por píxel, a qué raíz convergió y en cuántas iteraciones.
+    
+    - **funcion_f**: Función f(z) como string (usar 'x' como variable)
+    - **funcion_df**: Derivada (opcional; se calcula simbólicamente si se omite)
+    - **re_min**, **re_max**, **im_min**, **im_max**: Región del plano complejo
+    - **ancho**, **alto**: Píxeles de la malla
+    - **tolerancia**: Tolerancia relativa del paso de Newton
+    - **niter**: Número máximo de iteraciones por píxel
+    - **formato**: 'png', 'arreglo' o 'ambos'
+    """
+    try:
+        start_time = time.time()
+        resultado = await _ejecutar_metodo(
+            "cuenca_newton", [request.funcion_f, request.funcion_df],
+            evaluaciones_vectoriales(request.niter, request.ancho * request.alto),
+            funcion_f=request.funcion_f,
+            funcion_df=request.funcion_df,
+            re_min=request.re_min,
+            re_max=request.re_max,
+            im_min=request.im_min,
+            im_max=request.im_max,
+            ancho=request.ancho,
+            alto=request.alto,
+            tolerancia=request.tolerancia,
+            niter=request.niter,
+            formato=request.formato
+        )
+        end_time = time.time()
+        
+        resultado["tiempo_ejecucion"] = end_time - start_time
+        return resultado
+    
+    except EjecutorSaturadoError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/muller", response_model=MetodoResponse)
+async def metodo_muller(request: MullerRequest):
+    """
+    Implementa el método de Muller en aritmética compleja: encuentra raíces
+    reales y complejas sin derivadas. Si la raíz es compleja, ``resultado`` es
+    nulo y la raíz se informa en resumen.raiz como [real, imaginaria].
+    
+    - **x0**, **x1**, **x2**: Valores iniciales distintos
+    - **tolerancia**: Tolerancia del método
+    - **niter**: Número máximo de iteraciones
+    - **funcion**: Función f(x) como string (usar 'x' como variable)
+    """
+    try:
+        start_time = time.time()
+        resultado = await _ejecutar_metodo(
+            "muller", [request.funcion], request.niter + 3,
+            x0=request.x0,
+            x1=request.x1,
+            x2=request.x2,
+            tolerancia=request.tolerancia,
+            niter=request.niter,
+            funcion=request.funcion,
+            tipo_error=request.tipo_error
+        )
+        end_time = time.time()
+        
+        resultado["tiempo_ejecucion"] = end_time - start_time
+        return resultado
+    
+    except EjecutorSaturadoError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/sistema-no-lineal", response_model=MetodoResponse)
+async def metodo_sistema_no_lineal(request: SistemaNoLinealRequest):
+    """
+    Resuelve un sistema de ecuaciones no lineales F(x) = 0 con Newton o Broyden;
+    cada paso se resuelve con eliminación de Gauss con pivoteo. La solución se
+    informa en resumen.solucion (variable -> valor).
+    
+    - **funciones**: Una función por ecuación, en las variables indicadas
+    - **variables**: Nombres de las variables
+    - **x0**: Valor inicial de cada variable
+    - **tolerancia**: Tolerancia del método
+    - **niter**: Número máximo de iteraciones
+    - **metodo**: 'newton' o 'broyden'
+    - **jacobiano**: 'automatico' o 'diferencias'
+    - **tipo_pivoteo**: 0 = sin pivoteo, 1 = parcial, 2 = total
+    """
+    try:
+        start_time = time.time()
+        n = len(request.funciones)
+        costo = limites_complejidad.verificar(request.funciones, request.niter * (n + 1), request.variables)
+        resultado = await ejecutor.ejecutar(
+            "ecuaciones", "sistema_no_lineal", lento=costo["carril"] == "lento",
+            funciones=request.funciones,
+            variables=request.variables,
+            x0=request.x0,
+            tolerancia=request.tolerancia,
+            niter=request.niter,
+            metodo=request.metodo,
+            jacobiano=request.jacobiano,
+            tipo_pivoteo=request.tipo_pivoteo,
+            tipo_error=request.tipo_error
+        )
+        resultado["resumen"] = {**(resultado.get("resumen") or {}), "costo_estimado": costo}
+        end_time = time.time()
+        
+        resultado["tiempo_ejecucion"] = end_time - start_time
+        return resultado
+    
+    except EjecutorSaturadoError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/continuacion", response_model=MetodoResponse)
+async def metodo_continuacion(request: ContinuacionRequest):
+    """
+    Resuelve f(x; p) = 0 para muchos valores de un parámetro en una sola solicitud.
+    
+    Los valores se recorren en orden y cada resolución (Newton) parte de la raíz del
+    valor anterior, opcionalmente extrapolada con un predictor. Las raíces, iteraciones
+    y estados se devuelven como listas paralelas en el resumen.
+    
+    - **funcion**: Función f(x; p) como string
+    - **parametro**: Nombre del parámetro (por defecto 'p')
+    - **valores_parametro**: Valores del parámetro, en orden
+    - **x0**: Valor inicial para el primer valor
+    - **tolerancia**: Tolerancia del método
+    - **niter**: Número máximo de iteraciones por valor
+    - **predictor**: 'ninguno', 'secante' o 'tangente'
+    """
+    try:
+        start_time = time.time()
+        costo = limites_complejidad.verificar(
+            [request.funcion], request.niter * len(request.valores_parametro), ("x", request.parametro)
+        )
+        resultado = await ejecutor.ejecutar(
+            "ecuaciones", "continuacion_parametrica", lento=costo["carril"] == "lento",
+            funcion=request.funcion,
+            valores_parametro=request.valores_parametro,
+            x0=request.x0,
+            tolerancia=request.tolerancia,
+            niter=request.niter,
+            parametro=request.parametro,
+            predictor=request.predictor,
+            tipo_error=request.tipo_error
+        )
+        resultado["resumen"] = {**(resultado.get("resumen") or {}), "costo_estimado": costo}
         end_time = time.time()
         
         resultado["tiempo_ejecucion"] = end_time - start_time
         return resultado
     
+    except EjecutorSaturadoError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/resolver", response_model=MetodoResponse)
+async def metodo_resolver(request: ResolverRequest):
+    """
+    Ejecuta a la vez bisección, regla falsa, secante y Newton-Raphson (los que
+    apliquen a los datos enviados) y devuelve el primero que converge; los demás
+    se cancelan. El resumen indica el método ganador y el estado de cada uno.
+    
+    - **funcion**: Función f(x) como string (usar 'x' como variable)
+    - **funcion_df**: Derivada para Newton (opcional)
+    - **xi**, **xs**: Intervalo con cambio de signo (bisección, regla falsa, secante)
+    - **x0**, **x1**: Valores iniciales (Newton y secante); sin x0, Newton parte del punto medio
+    - **tolerancia**: Tolerancia del método
+    - **niter**: Número máximo de iteraciones
+    - **metodos**: Subconjunto de métodos que compiten (opcional)
+    """
+    try:
+        start_time = time.time()
+        participantes = _participantes_resolver(request)
+        costo = limites_complejidad.verificar(
+            [request.funcion, request.funcion_df], request.niter * len(participantes)
+        )
+        ganador, resultados, estados = await ejecutor.competir(
+            participantes, _convergio, lento=costo["carril"] == "lento"
+        )
+        if ganador is not None:
+            resultado = resultados[ganador]
+            resultado["mensaje"] = f"{resultado['mensaje']} (método ganador: {ganador})"
+        elif resultados:
+            # Nadie convergió: se informa el primero que terminó, en orden de preferencia
+            ganador = next(metodo for metodo in participantes if metodo in resultados)
+            resultado = resultados[ganador]
+            resultado["mensaje"] = f"Ningún método convergió. {ganador}: {resultado['mensaje']}"
+        elif all(estado == "rechazado" for estado in estados.values()):
+            raise EjecutorSaturadoError(
+                "El servidor está procesando demasiadas solicitudes. Intente de nuevo en unos segundos."
+            )
+        else:
+            raise ValueError("; ".join(f"{metodo}: {estado}" for metodo, estado in estados.items()))
+        resultado["resumen"] = {
+            **(resultado.get("resumen") or {}),
+            "metodo_ganador": ganador if resultado["exito"] else None,
+            "carrera": estados,
+            "costo_estimado": costo,
+        }
+        end_time = time.time()
+        
+        resultado["tiempo_ejecucion"] = end_time - start_time
+        return resultado
+    
+    except EjecutorSaturadoError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -130,33 +584,49 @@ async def metodo_newton_raphson(request: NewtonRaphsonRequest):
     
     El método utiliza la fórmula: x_{i+1} = x_i - f(x_i)/f'(x_i)
     
-    - **x0**: Valor inicial
+    - **x0**: Valor inicial, o lista de valores iniciales (arranques múltiples vectorizados)
     - **tolerancia**: Tolerancia del método
     - **niter**: Número máximo de iteraciones
     - **funcion_f**: Función f(x) como string (usar 'x' como variable)
-    - **funcion_df**: Derivada f'(x) como string (usar 'x' como variable)
+    - **funcion_df**: Derivada f'(x) como string (opcional; si se omite se deriva f(x) simbólicamente)
     - **incluir_error**: Si incluir columna de error en la tabla (opcional, por defecto True)
     
     La tabla de salida incluye: i, xi, f(xi), f'(xi) y opcionalmente E (error)
     """
     try:
         start_time = time.time()
-        resultado = service.newton_raphson(
-            x0=request.x0,
-            tolerancia=request.tolerancia,
-            niter=request.niter,
-            funcion_f=request.funcion_f,
-            funcion_df=request.funcion_df,
-            incluir_error=request.incluir_error,
-            tipo_error=request.tipo_error,
-            tipo_precision=request.tipo_precision,
-            precision=request.precision
-        )
+        if isinstance(request.x0, list):
+            resultado = await _ejecutar_metodo(
+                "newton_raphson_multiple", [request.funcion_f, request.funcion_df],
+                evaluaciones_vectoriales(request.niter, len(request.x0)),
+                x0=request.x0,
+                tolerancia=request.tolerancia,
+                niter=request.niter,
+                funcion_f=request.funcion_f,
+                funcion_df=request.funcion_df,
+                incluir_error=request.incluir_error,
+                tipo_error=request.tipo_error
+            )
+        else:
+            resultado = await _ejecutar_metodo(
+                "newton_raphson", [request.funcion_f, request.funcion_df], request.niter,
+                x0=request.x0,
+                tolerancia=request.tolerancia,
+                niter=request.niter,
+                funcion_f=request.funcion_f,
+                funcion_df=request.funcion_df,
+                incluir_error=request.incluir_error,
+                tipo_error=request.tipo_error,
+                tipo_precision=request.tipo_precision,
+                precision=request.precision
+            )
         end_time = time.time()
         
         resultado["tiempo_ejecucion"] = end_time - start_time
         return resultado
     
+    except EjecutorSaturadoError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -167,8 +637,8 @@ async def metodo_secante(request: SecanteRequest):
     
     El método utiliza la fórmula: x_{i+1} = x_i - f(x_i) * (x_i - x_{i-1}) / (f(x_i) - f(x_{i-1}))
     
-    - **x0**: Primer valor inicial
-    - **x1**: Segundo valor inicial
+    - **x0**: Primer valor inicial, o lista (arranques múltiples vectorizados)
+    - **x1**: Segundo valor inicial, o lista de la misma longitud que x0
     - **tolerancia**: Tolerancia del método
     - **niter**: Número máximo de iteraciones
     - **funcion**: Función f(x) como string (usar 'x' como variable)
@@ -180,22 +650,112 @@ async def metodo_secante(request: SecanteRequest):
     """
     try:
         start_time = time.time()
-        resultado = service.secante(
+        if isinstance(request.x0, list) or isinstance(request.x1, list):
+            arranques = max(len(x) if isinstance(x, list) else 1 for x in (request.x0, request.x1))
+            resultado = await _ejecutar_metodo(
+                "secante_multiple", [request.funcion], evaluaciones_vectoriales(request.niter, arranques),
+                x0=request.x0,
+                x1=request.x1,
+                tolerancia=request.tolerancia,
+                niter=request.niter,
+                funcion=request.funcion,
+                incluir_error=request.incluir_error,
+                tipo_error=request.tipo_error
+            )
+        else:
+            resultado = await _ejecutar_metodo(
+                "secante", [request.funcion], request.niter,
+                x0=request.x0,
+                x1=request.x1,
+                tolerancia=request.tolerancia,
+                niter=request.niter,
+                funcion=request.funcion,
+                incluir_error=request.incluir_error,
+                tipo_error=request.tipo_error,
+                tipo_precision=request.tipo_precision,
+                precision=request.precision
+            )
+        end_time = time.time()
+        
+        resultado["tiempo_ejecucion"] = end_time - start_time
+        return resultado
+    
+    except EjecutorSaturadoError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/halley", response_model=MetodoResponse)
+async def metodo_halley(request: RaicesMultiplesRequest):
+    """
+    Implementa el método de Halley: x_{i+1} = x_i - 2·f·f' / (2·f'^2 - f·f''),
+    con convergencia cúbica en raíces simples.
+    
+    Usa la misma solicitud que raíces múltiples (el campo modo no se usa).
+    
+    - **x0**: Valor inicial X₀
+    - **tolerancia**: Tolerancia del método
+    - **niter**: Número máximo de iteraciones
+    - **funcion_f**: Función f(x) como string (usar 'x' como variable)
+    - **funcion_df**: Primera derivada f'(x) como string (opcional; si se omite se deriva f(x) simbólicamente)
+    - **funcion_ddf**: Segunda derivada f''(x) como string (opcional; si se omite se deriva f(x) simbólicamente)
+    """
+    try:
+        start_time = time.time()
+        resultado = await _ejecutar_metodo(
+            "halley", [request.funcion_f, request.funcion_df, request.funcion_ddf], request.niter,
             x0=request.x0,
-            x1=request.x1,
             tolerancia=request.tolerancia,
             niter=request.niter,
-            funcion=request.funcion,
-            incluir_error=request.incluir_error,
-            tipo_error=request.tipo_error,
-            tipo_precision=request.tipo_precision,
-            precision=request.precision
+            funcion_f=request.funcion_f,
+            funcion_df=request.funcion_df,
+            funcion_ddf=request.funcion_ddf,
+            tipo_error=request.tipo_error
+        )
+        end_time = time.time()
+        
+        resultado["tiempo_ejecucion"] = end_time - start_time
+        return resultado
+    
+    except EjecutorSaturadoError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/householder", response_model=MetodoResponse)
+async def metodo_householder(request: RaicesMultiplesRequest):
+    """
+    Implementa el método de Householder de orden 3 (convergencia de orden 4 en
+    raíces simples); f''' se obtiene derivando simbólicamente f''.
+    
+    Usa la misma solicitud que raíces múltiples (el campo modo no se usa).
+    
+    - **x0**: Valor inicial X₀
+    - **tolerancia**: Tolerancia del método
+    - **niter**: Número máximo de iteraciones
+    - **funcion_f**: Función f(x) como string (usar 'x' como variable)
+    - **funcion_df**: Primera derivada f'(x) como string (opcional; si se omite se deriva f(x) simbólicamente)
+    - **funcion_ddf**: Segunda derivada f''(x) como string (opcional; si se omite se deriva f(x) simbólicamente)
+    """
+    try:
+        start_time = time.time()
+        resultado = await _ejecutar_metodo(
+            "householder", [request.funcion_f, request.funcion_df, request.funcion_ddf], request.niter,
+            x0=request.x0,
+            tolerancia=request.tolerancia,
+            niter=request.niter,
+            funcion_f=request.funcion_f,
+            funcion_df=request.funcion_df,
+            funcion_ddf=request.funcion_ddf,
+            tipo_error=request.tipo_error
         )
         end_time = time.time()
         
         resultado["tiempo_ejecucion"] = end_time - start_time
         return resultado
     
+    except EjecutorSaturadoError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -213,15 +773,16 @@ async def metodo_raices_multiples(request: RaicesMultiplesRequest):
     - **tolerancia**: Tolerancia del método
     - **niter**: Número máximo de iteraciones
     - **funcion_f**: Función f(x) como string (usar 'x' como variable)
-    - **funcion_df**: Primera derivada f'(x) como string (usar 'x' como variable)
-    - **funcion_ddf**: Segunda derivada f''(x) como string (usar 'x' como variable)
+    - **funcion_df**: Primera derivada f'(x) como string (opcional; si se omite se deriva f(x) simbólicamente)
+    - **funcion_ddf**: Segunda derivada f''(x) como string (opcional; si se omite se deriva f(x) simbólicamente)
     - **modo**: Modo de cálculo de error: 'cs' (cifras significativas) o 'dc' (decimales correctos)
     
     La tabla de salida incluye: Iteración, xi, f(xi), f'(xi), f''(xi), Denominador, Error
     """
     try:
         start_time = time.time()
-        resultado = service.raices_multiples(
+        resultado = await _ejecutar_metodo(
+            "raices_multiples", [request.funcion_f, request.funcion_df, request.funcion_ddf], request.niter,
             x0=request.x0,
             tolerancia=request.tolerancia,
             niter=request.niter,
@@ -236,5 +797,7 @@ async def metodo_raices_multiples(request: RaicesMultiplesRequest):
         resultado["tiempo_ejecucion"] = end_time - start_time
         return resultado
     
+    except EjecutorSaturadoError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,219 @@
+"""
+Estimación estática del costo de las funciones enviadas por los usuarios.
+
+Antes de iniciar una resolución se analiza cada función (longitud, número de
+nodos, profundidad de anidamiento, magnitud de los exponentes y un costo
+estimado por evaluación). Las que superan los límites se rechazan con un error
+400; las que son caras pero admisibles se envían al carril lento del ejecutor
+para que no acaparen todos los trabajadores.
+
+Configuración por variables de entorno:
+    ANALISIS_MAX_LONGITUD        caracteres por función
+    ANALISIS_MAX_NODOS           nodos del árbol (ya plegado) por función
+    ANALISIS_MAX_PROFUNDIDAD     niveles de anidamiento por función
+    ANALISIS_MAX_EXPONENTE       valor absoluto máximo de un exponente constante
+    ANALISIS_MAX_COSTO           costo estimado máximo por evaluación
+    ANALISIS_COSTO_LENTO         costo total estimado a partir del cual se usa el carril lento
+"""
+
+import ast
+import math
+import os
+from typing import Any, Dict, Sequence
+
+from services.expresiones import ExpresionInvalidaError, compilar_expresion, normalizar_expresion
+
+
+class ExpresionDemasiadoCostosaError(ExpresionInvalidaError):
+    """La función supera los límites de complejidad configurados"""
+
+
+# Costo relativo aproximado de cada operación (una suma = 1)
+_PESOS_OPERADORES: Dict[type, int] = {
+    ast.Add: 1,
+    ast.Sub: 1,
+    ast.Mult: 1,
+    ast.Div: 2,
+    ast.Mod: 3,
+    ast.Pow: 6,
+}
+
+_PESOS_FUNCIONES: Dict[str, int] = {
+    'abs': 1,
+    'sqrt': 3,
+    'exp': 8,
+    'ln': 8,
+    'log10': 8,
+    'pow': 6,
+    'sin': 10,
+    'cos': 10,
+    'tan': 12,
+}
+
+_PESO_NEGACION = 1
+
+# Puntos de una evaluación vectorial (NumPy) que cuestan aproximadamente lo mismo
+# que una evaluación escalar compilada: el sobrecosto del intérprete se paga por
+# pasada y no por punto
+ELEMENTOS_POR_EVALUACION = 256
+
+
+def _exponente_constante(nodo: ast.expr) -> float | None:
+    if isinstance(nodo, ast.BinOp) and isinstance(nodo.op, ast.Pow):
+        exponente = nodo.right
+    elif isinstance(nodo, ast.Call) and nodo.func.id == "pow":
+        exponente = nodo.args[1]
+    else:
+        return None
+    return exponente.value if isinstance(exponente, ast.Constant) else None
+
+
+def _hijos(nodo: ast.expr) -> Sequence[ast.expr]:
+    if isinstance(nodo, ast.BinOp):
+        return (nodo.left, nodo.right)
+    if isinstance(nodo, ast.UnaryOp):
+        return (nodo.operand,)
+    if isinstance(nodo, ast.Call):
+        return nodo.args
+    return ()
+
+
+def estimar_costo(funcion: str, variables: Sequence[str] = ("x",)) -> Dict[str, Any]:
+    """
+    Analiza una función y devuelve sus métricas de complejidad.
+
+    El costo se calcula sobre los subárboles distintos, igual que la evaluación
+    compilada, que reutiliza las subexpresiones repetidas.
+    """
+    arbol = compilar_expresion(funcion, variables).arbol
+    nodos = 0
+    profundidad = 0
+    exponente_maximo = 0.0
+    costo = 0
+    vistos: set[str] = set()
+    # Recorrido iterativo: un árbol muy anidado no debe agotar la pila de Python
+    pendientes = [(arbol, 1)]
+    while pendientes:
+        nodo, nivel = pendientes.pop()
+        nodos += 1
+        profundidad = max(profundidad, nivel)
+        pendientes.extend((hijo, nivel + 1) for hijo in _hijos(nodo))
+
+        exponente = _exponente_constante(nodo)
+        if exponente is not None:
+            exponente_maximo = max(exponente_maximo, abs(exponente))
+
+        clave = ast.dump(nodo)
+        if clave in vistos:
+            continue
+        vistos.add(clave)
+        if isinstance(nodo, ast.BinOp):
+            costo += _PESOS_OPERADORES[type(nodo.op)]
+        elif isinstance(nodo, ast.UnaryOp):
+            costo += _PESO_NEGACION
+        elif isinstance(nodo, ast.Call):
+            costo += _PESOS_FUNCIONES[nodo.func.id]
+
+    return {
+        "longitud": len(normalizar_expresion(funcion)),
+        "nodos": nodos,
+        "profundidad": profundidad,
+        "exponente_maximo": exponente_maximo,
+        "costo": max(costo, 1),
+    }
+
+
+def evaluaciones_vectoriales(iteraciones: int, elementos: int) -> int:
+    """
+    Evaluaciones escalares equivalentes a ``iteraciones`` pasadas vectoriales
+    sobre ``elementos`` puntos (arranques múltiples, cuencas de atracción):
+    cada pasada cuesta una evaluación más una por cada ELEMENTOS_POR_EVALUACION puntos.
+    """
+    return iteraciones * (1 + math.ceil(elementos / ELEMENTOS_POR_EVALUACION))
+
+
+def _numero_entorno(nombre: str, defecto: float) -> float:
+    try:
+        return float(os.environ.get(nombre, defecto))
+    except ValueError:
+        return defecto
+
+
+class LimitesComplejidad:
+    """Presupuestos de complejidad por función y umbral del carril lento"""
+
+    def __init__(self, max_longitud: int = 2000, max_nodos: int = 400, max_profundidad: int = 60,
+                 max_exponente: float = 1e6, max_costo: int = 2000, costo_lento: float = 2e6):
+        self.max_longitud = max_longitud
+        self.max_nodos = max_nodos
+        self.max_profundidad = max_profundidad
+        self.max_exponente = max_exponente
+        self.max_costo = max_costo
+        self.costo_lento = costo_lento
+
+    @classmethod
+    def desde_entorno(cls) -> "LimitesComplejidad":
+        defecto = cls()
+        return cls(
+            max_longitud=int(_numero_entorno("ANALISIS_MAX_LONGITUD", defecto.max_longitud)),
+            max_nodos=int(_numero_entorno("ANALISIS_MAX_NODOS", defecto.max_nodos)),
+            max_profundidad=int(_numero_entorno("ANALISIS_MAX_PROFUNDIDAD", defecto.max_profundidad)),
+            max_exponente=_numero_entorno("ANALISIS_MAX_EXPONENTE", defecto.max_exponente),
+            max_costo=int(_numero_entorno("ANALISIS_MAX_COSTO", defecto.max_costo)),
+            costo_lento=_numero_entorno("ANALISIS_COSTO_LENTO", defecto.costo_lento),
+        )
+
+    def _verificar_funcion(self, funcion: str, variables: Sequence[str] = ("x",)) -> Dict[str, Any]:
+        # La longitud se comprueba antes de analizar, para no gastar CPU en el parser
+        if len(funcion) > self.max_longitud:
+            raise ExpresionDemasiadoCostosaError(
+                f"La función tiene {len(funcion)} caracteres; el máximo permitido es {self.max_longitud}"
+            )
+        metricas = estimar_costo(funcion, variables)
+        fuente = normalizar_expresion(funcion)
+        if metricas["nodos"] > self.max_nodos:
+            raise ExpresionDemasiadoCostosaError(
+                f"La función '{fuente}' tiene {metricas['nodos']} nodos; el máximo permitido es {self.max_nodos}"
+            )
+        if metricas["profundidad"] > self.max_profundidad:
+            raise ExpresionDemasiadoCostosaError(
+                f"La función '{fuente}' está anidada {metricas['profundidad']} niveles; "
+                f"el máximo permitido es {self.max_profundidad}"
+            )
+        if metricas["exponente_maximo"] > self.max_exponente:
+            raise ExpresionDemasiadoCostosaError(
+                f"La función '{fuente}' usa un exponente de magnitud {metricas['exponente_maximo']:g}; "
+                f"el máximo permitido es {self.max_exponente:g}"
+            )
+        if metricas["costo"] > self.max_costo:
+            raise ExpresionDemasiadoCostosaError(
+                f"El costo estimado de evaluar '{fuente}' es {metricas['costo']}; "
+                f"el máximo permitido es {self.max_costo}"
+            )
+        return metricas
+
+    def verificar(self, funciones: Sequence[str | None], evaluaciones: int,
+                  variables: Sequence[str] = ("x",)) -> Dict[str, Any]:
+        """
+        Valida las funciones de una solicitud antes de resolverla.
+
+        ``evaluaciones`` es el máximo de evaluaciones esperadas (normalmente
+        niter); el costo total estimado decide el carril de ejecución.
+        ``variables`` son los nombres admitidos en las funciones. Lanza
+        ExpresionDemasiadoCostosaError si alguna función supera los límites.
+        """
+        metricas = [self._verificar_funcion(f, variables) for f in funciones if f is not None and f.strip()]
+        costo_evaluacion = sum(m["costo"] for m in metricas)
+        costo_total = costo_evaluacion * max(1, evaluaciones)
+        return {
+            "costo_evaluacion": costo_evaluacion,
+            "costo_total": costo_total,
+            "nodos": sum(m["nodos"] for m in metricas),
+            "profundidad": max((m["profundidad"] for m in metricas), default=0),
+            "exponente_maximo": max((m["exponente_maximo"] for m in metricas), default=0.0),
+            "carril": "lento" if costo_total > self.costo_lento else "normal",
+        }
+
+
+# Límites globales usados por los routers
+limites_complejidad = LimitesComplejidad.desde_entorno()
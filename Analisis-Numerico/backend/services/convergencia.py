@@ -0,0 +1,175 @@
+"""
+Estimación en línea del orden de convergencia y detención temprana.
+
+Los métodos iterativos registran en cada paso el error que comparan con la
+tolerancia (normalmente |x_{k+1} - x_k|). Con la sucesión de errores e_k se
+estiman el orden p ≈ ln(e_{k+1}/e_k) / ln(e_k/e_{k-1}) y la constante
+asintótica C ≈ e_{k+1} / e_k^p, y con ellos se predice cuántas iteraciones
+faltan para alcanzar la tolerancia.
+
+El método se detiene antes de agotar ``niter`` cuando la traza muestra que la
+ejecución no tiene remedio:
+
+- divergencia: el error crece en cada una de las últimas iteraciones;
+- estancamiento: el error no se contrae y no mejora su mínimo durante una ventana larga;
+- convergencia lineal lenta: la razón e_{k+1}/e_k es estable y la predicción
+  supera las iteraciones que quedan. Solo en métodos de orden teórico 1: los
+  de orden mayor (Newton, secante, ...) pasan a menudo por una fase lineal
+  lejos de la raíz y después se aceleran, así que en ellos solo se informa.
+
+Las ejecuciones superlineales nunca se detienen antes de tiempo.
+"""
+
+import math
+from typing import Any, Dict, List
+
+# Razones consecutivas que deben coincidir antes de diagnosticar divergencia o lentitud
+VENTANA = 5
+# Iteraciones sin mejorar el menor error antes de diagnosticar estancamiento
+VENTANA_ESTANCAMIENTO = 8
+# Crecimiento total mínimo del error en la ventana para declarar divergencia
+CRECIMIENTO_DIVERGENCIA = 2.0
+# Variación máxima (cociente máximo/mínimo) de las razones para considerarlas estables
+ESTABILIDAD_RAZON = 1.25
+# Órdenes por encima de este valor se consideran superlineales
+ORDEN_SUPERLINEAL = 1.2
+# Tope de la predicción de iteraciones
+MAX_PREDICCION = 10**6
+
+DIAGNOSTICOS = ("sin_datos", "superlineal", "lineal", "lineal_lenta", "estancado", "divergente")
+
+
+def _mediana(valores: List[float]) -> float:
+    ordenados = sorted(valores)
+    medio = len(ordenados) // 2
+    return ordenados[medio] if len(ordenados) % 2 else (ordenados[medio - 1] + ordenados[medio]) / 2
+
+
+class MonitorConvergencia:
+    """
+    Acompaña la iteración de un método y decide si conviene detenerla.
+
+    ``estado`` es un diccionario que se actualiza en cada registro; los
+    métodos lo agregan al resumen de la respuesta como ``convergencia``. Con
+    ``detener=False`` solo se informa (bisección y Brent, cuya convergencia
+    está garantizada). Con ``acotado=True`` no se diagnostica divergencia: en
+    un método que conserva el cambio de signo los pasos pueden crecer durante
+    un tramo (regla falsa modificada) sin salir del intervalo. ``orden`` es el
+    orden teórico del método; si es mayor que 1 la lentitud lineal no detiene.
+    """
+
+    __slots__ = ("tolerancia", "niter", "detener", "acotado", "orden", "errores", "estado")
+
+    def __init__(self, tolerancia: float, niter: int, detener: bool = True, acotado: bool = False,
+                 orden: float = 1.0):
+        self.tolerancia = tolerancia
+        self.niter = niter
+        self.detener = detener
+        self.acotado = acotado
+        self.orden = orden
+        self.errores: List[float] = []
+        self.estado: Dict[str, Any] = {
+            "orden_estimado": None,
+            "constante_asintotica": None,
+            "razon_lineal": None,
+            "iteraciones_restantes_estimadas": None,
+            "diagnostico": "sin_datos",
+            "detencion_temprana": False,
+        }
+
+    def _predecir(self, error: float, orden: float | None, constante: float | None, razon: float) -> int | None:
+        """Iteraciones que faltan para que el error baje de la tolerancia (None si no bajará)"""
+        if error <= self.tolerancia:
+            return 0
+        if orden is not None and constante is not None and orden > ORDEN_SUPERLINEAL:
+            pasos = 0
+            while error > self.tolerancia and pasos < MAX_PREDICCION:
+                siguiente = constante * error ** orden
+                if not siguiente < error:
+                    break
+                error, pasos = siguiente, pasos + 1
+            if error <= self.tolerancia:
+                return pasos
+        if razon >= 1:
+            return None
+        return min(MAX_PREDICCION, math.ceil(math.log(self.tolerancia / error) / math.log(razon)))
+
+    def registrar(self, error: float | None, iteracion: int) -> str | None:
+        """
+        Registra el error de la iteración ``iteracion`` y actualiza las
+        estimaciones. Devuelve un mensaje de diagnóstico si el método debe
+        detenerse, o None para continuar.
+        """
+        if error is None or not math.isfinite(error) or error <= 0:
+            return None
+        self.errores.append(error)
+        e = self.errores
+        if len(e) < 3:
+            return None
+
+        razones = [e[k] / e[k - 1] for k in range(1, len(e))]
+        recientes = razones[-VENTANA:]
+        ordenes = [
+            math.log(razones[k]) / math.log(razones[k - 1])
+            for k in range(max(1, len(razones) - 3), len(razones))
+            if razones[k - 1] != 1 and razones[k] > 0
+        ]
+        orden = _mediana(ordenes) if ordenes else None
+        if orden is not None and orden <= 0:
+            # Razones que alternan alrededor de 1: el orden no está definido
+            orden = None
+        constante = None
+        if orden is not None:
+            try:
+                constante = e[-1] / e[-2] ** orden
+            except (OverflowError, ZeroDivisionError):
+                constante = None
+            if constante is not None and not math.isfinite(constante):
+                constante = None
+        razon = math.exp(sum(math.log(r) for r in recientes) / len(recientes))
+        restantes = self.niter - iteracion
+        prediccion = self._predecir(e[-1], orden, constante, razon)
+
+        superlineal = orden is not None and orden > ORDEN_SUPERLINEAL and razones[-1] < 1
+        if superlineal:
+            diagnostico = "superlineal"
+        elif razon >= 1:
+            diagnostico = "estancado"
+        elif prediccion is not None and prediccion > restantes:
+            diagnostico = "lineal_lenta"
+        else:
+            diagnostico = "lineal"
+
+        mensaje = None
+        ventana_llena = len(recientes) == VENTANA
+        crecimiento = math.prod(recientes)
+        if not self.acotado and ventana_llena and all(r > 1 for r in recientes) and crecimiento >= CRECIMIENTO_DIVERGENCIA:
+            diagnostico = "divergente"
+            mensaje = (
+                f"El método diverge: el error creció en cada una de las últimas {VENTANA} iteraciones "
+                f"(factor {crecimiento:.3g})."
+            )
+        elif diagnostico == "estancado" and not self.acotado and len(e) > VENTANA_ESTANCAMIENTO and \
+                min(e[-VENTANA_ESTANCAMIENTO:]) >= min(e[:-VENTANA_ESTANCAMIENTO]):
+            mensaje = (
+                f"El método está estancado: el menor error no mejoró en las últimas "
+                f"{VENTANA_ESTANCAMIENTO} iteraciones."
+            )
+        elif diagnostico == "lineal_lenta" and self.orden <= 1 and ventana_llena and \
+                max(recientes) <= ESTABILIDAD_RAZON * min(recientes):
+            mensaje = (
+                f"Convergencia lineal lenta (razón ≈ {razon:.3g}): se necesitarían unas {prediccion} "
+                f"iteraciones más y quedan {restantes}."
+            )
+
+        self.estado.update({
+            "orden_estimado": orden,
+            "constante_asintotica": constante,
+            "razon_lineal": razon,
+            "iteraciones_restantes_estimadas": prediccion,
+            "diagnostico": diagnostico,
+        })
+        if mensaje is None or not self.detener:
+            return None
+        self.estado["detencion_temprana"] = True
+        return mensaje
@@ -0,0 +1,189 @@
+"""
+Derivación simbólica sobre el AST canónico producido por services.expresiones.
+
+El árbol de entrada ya está validado: solo contiene constantes float, nombres de
+variables, operadores aritméticos y llamadas a funciones de la lista blanca. Los
+constructores auxiliares simplifican sobre la marcha (0·u = 0, 1·u = u, u + 0 = u,
+plegado de constantes) para que las derivadas compiladas no arrastren términos
+muertos.
+"""
+
+import ast
+import math
+
+
+class DerivadaNoDisponibleError(ValueError):
+    """La expresión contiene una operación que no se sabe derivar simbólicamente"""
+
+
+def constante(valor: float) -> ast.Constant:
+    return ast.Constant(value=float(valor))
+
+
+def es_constante(nodo: ast.AST, valor: float | None = None) -> bool:
+    if not isinstance(nodo, ast.Constant):
+        return False
+    return valor is None or nodo.value == valor
+
+
+def llamada(nombre: str, *argumentos: ast.expr) -> ast.expr:
+    return ast.Call(func=ast.Name(id=nombre, ctx=ast.Load()), args=list(argumentos), keywords=[])
+
+
+def negativo(u: ast.expr) -> ast.expr:
+    if es_constante(u):
+        return constante(-u.value)
+    if isinstance(u, ast.UnaryOp) and isinstance(u.op, ast.USub):
+        return u.operand
+    return ast.UnaryOp(op=ast.USub(), operand=u)
+
+
+def suma(u: ast.expr, v: ast.expr) -> ast.expr:
+    if es_constante(u, 0.0):
+        return v
+    if es_constante(v, 0.0):
+        return u
+    if es_constante(u) and es_constante(v):
+        return constante(u.value + v.value)
+    if isinstance(v, ast.UnaryOp) and isinstance(v.op, ast.USub):
+        return ast.BinOp(left=u, op=ast.Sub(), right=v.operand)
+    return ast.BinOp(left=u, op=ast.Add(), right=v)
+
+
+def resta(u: ast.expr, v: ast.expr) -> ast.expr:
+    if es_constante(v, 0.0):
+        return u
+    if es_constante(u, 0.0):
+        return negativo(v)
+    if es_constante(u) and es_constante(v):
+        return constante(u.value - v.value)
+    return ast.BinOp(left=u, op=ast.Sub(), right=v)
+
+
+def producto(u: ast.expr, v: ast.expr) -> ast.expr:
+    if es_constante(u, 0.0) or es_constante(v, 0.0):
+        return constante(0.0)
+    if es_constante(u, 1.0):
+        return v
+    if es_constante(v, 1.0):
+        return u
+    if es_constante(u, -1.0):
+        return negativo(v)
+    if es_constante(v, -1.0):
+        return negativo(u)
+    if es_constante(u) and es_constante(v):
+        return constante(u.value * v.value)
+    if es_constante(u) and isinstance(v, ast.BinOp) and isinstance(v.op, ast.Mult) and es_constante(v.left):
+        return producto(constante(u.value * v.left.value), v.right)
+    return ast.BinOp(left=u, op=ast.Mult(), right=v)
+
+
+def division(u: ast.expr, v: ast.expr) -> ast.expr:
+    if es_constante(u, 0.0):
+        return constante(0.0)
+    if es_constante(v, 1.0):
+        return u
+    if es_constante(u) and es_constante(v) and v.value != 0:
+        return constante(u.value / v.value)
+    return ast.BinOp(left=u, op=ast.Div(), right=v)
+
+
+def potencia(u: ast.expr, v: ast.expr) -> ast.expr:
+    if es_constante(v, 0.0):
+        return constante(1.0)
+    if es_constante(v, 1.0):
+        return u
+    return ast.BinOp(left=u, op=ast.Pow(), right=v)
+
+
+def depende_de(nodo: ast.AST, variable: str) -> bool:
+    return any(isinstance(n, ast.Name) and n.id == variable for n in ast.walk(nodo))
+
+
+def _derivar_potencia(base: ast.expr, exponente: ast.expr, variable: str) -> ast.expr:
+    db = derivar(base, variable)
+    if not depende_de(exponente, variable):
+        # d(u^c) = c·u^(c-1)·u'
+        nuevo_exponente = resta(exponente, constante(1.0))
+        return producto(producto(exponente, potencia(base, nuevo_exponente)), db)
+
+    de = derivar(exponente, variable)
+    if not depende_de(base, variable):
+        # d(a^v) = a^v·ln(a)·v'
+        return producto(producto(potencia(base, exponente), llamada("ln", base)), de)
+
+    # d(u^v) = u^v·(v'·ln(u) + v·u'/u)
+    return producto(
+        potencia(base, exponente),
+        suma(producto(de, llamada("ln", base)), division(producto(exponente, db), base)),
+    )
+
+
+def _derivar_llamada(nodo: ast.Call, variable: str) -> ast.expr:
+    nombre = nodo.func.id
+    if nombre == "pow":
+        return _derivar_potencia(nodo.args[0], nodo.args[1], variable)
+
+    u = nodo.args[0]
+    du = derivar(u, variable)
+    if es_constante(du, 0.0):
+        return constante(0.0)
+
+    if nombre == "sin":
+        externa = llamada("cos", u)
+    elif nombre == "cos":
+        externa = negativo(llamada("sin", u))
+    elif nombre == "tan":
+        externa = division(constante(1.0), potencia(llamada("cos", u), constante(2.0)))
+    elif nombre == "exp":
+        externa = llamada("exp", u)
+    elif nombre == "ln":
+        return division(du, u)
+    elif nombre == "log10":
+        return division(du, producto(u, constante(math.log(10.0))))
+    elif nombre == "sqrt":
+        return division(du, producto(constante(2.0), llamada("sqrt", u)))
+    elif nombre == "abs":
+        externa = division(u, llamada("abs", u))
+    else:
+        raise DerivadaNoDisponibleError(f"No se sabe derivar la función '{nombre}'")
+
+    return producto(externa, du)
+
+
+def derivar(nodo: ast.expr, variable: str = "x") -> ast.expr:
+    """Devuelve el AST (simplificado) de la derivada de ``nodo`` respecto a ``variable``"""
+    if isinstance(nodo, ast.Constant):
+        return constante(0.0)
+
+    if isinstance(nodo, ast.Name):
+        return constante(1.0 if nodo.id == variable else 0.0)
+
+    if isinstance(nodo, ast.UnaryOp):
+        return negativo(derivar(nodo.operand, variable))
+
+    if isinstance(nodo, ast.BinOp):
+        u, v = nodo.left, nodo.right
+        if isinstance(nodo.op, ast.Add):
+            return suma(derivar(u, variable), derivar(v, variable))
+        if isinstance(nodo.op, ast.Sub):
+            return resta(derivar(u, variable), derivar(v, variable))
+        if isinstance(nodo.op, ast.Mult):
+            return suma(producto(derivar(u, variable), v), producto(u, derivar(v, variable)))
+        if isinstance(nodo.op, ast.Div):
+            du, dv = derivar(u, variable), derivar(v, variable)
+            if es_constante(dv, 0.0):
+                return division(du, v)
+            return division(resta(producto(du, v), producto(u, dv)), potencia(v, constante(2.0)))
+        if isinstance(nodo.op, ast.Pow):
+            return _derivar_potencia(u, v, variable)
+        if isinstance(nodo.op, ast.Mod):
+            # u % c tiene derivada u' en casi todo punto; con divisor variable no es derivable
+            if depende_de(v, variable):
+                raise DerivadaNoDisponibleError("No se puede derivar el operador % con divisor variable")
+            return derivar(u, variable)
+
+    if isinstance(nodo, ast.Call):
+        return _derivar_llamada(nodo, variable)
+
+    raise DerivadaNoDisponibleError(f"No se puede derivar la construcción {type(nodo).__name__}")
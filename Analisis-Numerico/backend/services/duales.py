@@ -0,0 +1,265 @@
+"""
+Diferenciación automática hacia adelante (números duales / jets de Taylor).
+
+A partir del AST canónico de services.expresiones se genera una función de
+Python en línea recta que, en una sola pasada, calcula f(x), f'(x) y
+opcionalmente f''(x). Cada nodo se representa por sus componentes
+(u, u', u''); los componentes que se saben nulos en tiempo de generación
+(constantes, variables ajenas) se omiten del código emitido.
+"""
+
+import ast
+import math
+from typing import Callable, Dict, List, Sequence
+
+from services.derivadas import DerivadaNoDisponibleError
+
+_CERO = "0.0"
+_UNO = "1.0"
+
+
+def _es_literal(codigo: str) -> bool:
+    try:
+        float(codigo)
+        return True
+    except ValueError:
+        return False
+
+
+class _GeneradorJet:
+    """Emite el código de la función jet nodo por nodo"""
+
+    def __init__(self, variable: str, orden: int):
+        self.variable = variable
+        self.orden = orden
+        self.lineas: List[str] = []
+        self.funciones: set[str] = set()
+        self.constantes: Dict[str, float] = {}
+        self._contador = 0
+
+    # --- utilidades de emisión -------------------------------------------------
+
+    def _temporal(self, codigo: str) -> str:
+        if _es_literal(codigo) or codigo.isidentifier():
+            return codigo
+        nombre = f"_t{self._contador}"
+        self._contador += 1
+        self.lineas.append(f"{nombre} = {codigo}")
+        return nombre
+
+    def _literal(self, valor: float) -> str:
+        if math.isfinite(valor):
+            return repr(float(valor))
+        # inf/nan no tienen literal en Python: se pasan como celdas de clausura
+        nombre = f"_k{len(self.constantes)}"
+        self.constantes[nombre] = valor
+        return nombre
+
+    def _llamar(self, funcion: str, argumento: str) -> str:
+        self.funciones.add(funcion)
+        return self._temporal(f"{funcion}({argumento})")
+
+    @staticmethod
+    def _suma(a: str, b: str) -> str:
+        if a == _CERO:
+            return b
+        if b == _CERO:
+            return a
+        return f"({a} + {b})"
+
+    @staticmethod
+    def _resta(a: str, b: str) -> str:
+        if b == _CERO:
+            return a
+        if a == _CERO:
+            return f"(-{b})"
+        return f"({a} - {b})"
+
+    @staticmethod
+    def _producto(a: str, b: str) -> str:
+        if a == _CERO or b == _CERO:
+            return _CERO
+        if a == _UNO:
+            return b
+        if b == _UNO:
+            return a
+        return f"({a} * {b})"
+
+    @staticmethod
+    def _cociente(a: str, b: str) -> str:
+        if a == _CERO:
+            return _CERO
+        if b == _UNO:
+            return a
+        return f"({a} / {b})"
+
+    def _materializar(self, componentes: List[str]) -> List[str]:
+        return [self._temporal(c) for c in componentes]
+
+    def _cadena(self, u: List[str], g0: str, g1: str, g2: str | None) -> List[str]:
+        """Regla de la cadena para g(u): (g(u0), g'(u0)·u1, g''(u0)·u1² + g'(u0)·u2)"""
+        resultado = [g0, self._producto(g1, u[1])]
+        if self.orden >= 2:
+            termino = self._producto(g2, self._producto(u[1], u[1])) if g2 is not None else _CERO
+            resultado.append(self._suma(termino, self._producto(g1, u[2])))
+        return self._materializar(resultado)
+
+    # --- reglas por tipo de nodo ------------------------------------------------
+
+    def visitar(self, nodo: ast.expr) -> List[str]:
+        if isinstance(nodo, ast.Constant):
+            return [self._literal(nodo.value)] + [_CERO] * self.orden
+        if isinstance(nodo, ast.Name):
+            primera = _UNO if nodo.id == self.variable else _CERO
+            return ([nodo.id, primera] + [_CERO] * (self.orden - 1))
+        if isinstance(nodo, ast.UnaryOp):
+            u = self.visitar(nodo.operand)
+            return self._materializar([f"(-{c})" if c != _CERO else _CERO for c in u])
+        if isinstance(nodo, ast.BinOp):
+            return self._binario(nodo)
+        if isinstance(nodo, ast.Call):
+            return self._llamada(nodo)
+        raise DerivadaNoDisponibleError(f"No se puede derivar la construcción {type(nodo).__name__}")
+
+    def _binario(self, nodo: ast.BinOp) -> List[str]:
+        u = self.visitar(nodo.left)
+        v = self.visitar(nodo.right)
+        if isinstance(nodo.op, ast.Add):
+            return self._materializar([self._suma(a, b) for a, b in zip(u, v)])
+        if isinstance(nodo.op, ast.Sub):
+            return self._materializar([self._resta(a, b) for a, b in zip(u, v)])
+        if isinstance(nodo.op, ast.Mult):
+            return self._multiplicar(u, v)
+        if isinstance(nodo.op, ast.Div):
+            return self._dividir(u, v)
+        if isinstance(nodo.op, ast.Pow):
+            return self._potencia(u, v)
+        if isinstance(nodo.op, ast.Mod):
+            if any(c != _CERO for c in v[1:]):
+                raise DerivadaNoDisponibleError("No se puede derivar el operador % con divisor variable")
+            return self._materializar([f"({u[0]} % {v[0]})"] + u[1:])
+        raise DerivadaNoDisponibleError(f"Operador no soportado: {type(nodo.op).__name__}")
+
+    def _multiplicar(self, u: List[str], v: List[str]) -> List[str]:
+        p, s, c = self._producto, self._suma, _CERO
+        resultado = [p(u[0], v[0]), s(p(u[1], v[0]), p(u[0], v[1]))]
+        if self.orden >= 2:
+            cruzado = p("2.0", p(u[1], v[1])) if p(u[1], v[1]) != c else c
+            resultado.append(s(s(p(u[2], v[0]), cruzado), p(u[0], v[2])))
+        return self._materializar(resultado)
+
+    def _dividir(self, u: List[str], v: List[str]) -> List[str]:
+        w0 = self._temporal(self._cociente(u[0], v[0]))
+        if all(c == _CERO for c in v[1:]):
+            # Denominador constante respecto a la variable
+            return self._materializar([w0] + [self._cociente(c, v[0]) for c in u[1:]])
+        w1 = self._temporal(self._cociente(self._resta(u[1], self._producto(w0, v[1])), v[0]))
+        resultado = [w0, w1]
+        if self.orden >= 2:
+            numerador = self._resta(
+                self._resta(u[2], self._producto("2.0", self._producto(w1, v[1]))),
+                self._producto(w0, v[2]),
+            )
+            resultado.append(self._cociente(numerador, v[0]))
+        return self._materializar(resultado)
+
+    def _potencia(self, u: List[str], v: List[str]) -> List[str]:
+        exponente_constante = all(c == _CERO for c in v[1:])
+        if exponente_constante:
+            if v[0] == _UNO:
+                return u
+            if v[0] == "2.0":
+                return self._multiplicar(u, u)
+            w0 = f"(({u[0]}) ** ({v[0]}))"
+            g1 = f"({v[0]} * ({u[0]}) ** ({v[0]} - 1.0))"
+            g2 = f"({v[0]} * ({v[0]} - 1.0) * ({u[0]}) ** ({v[0]} - 2.0))" if self.orden >= 2 else None
+            return self._cadena(u, w0, self._temporal(g1), self._temporal(g2) if g2 else None)
+
+        if all(c == _CERO for c in u[1:]):
+            # a^v = exp(v·ln a) con base constante
+            w0 = self._temporal(f"(({u[0]}) ** ({v[0]}))")
+            logaritmo = self._llamar("ln", u[0])
+            g1 = self._temporal(self._producto(w0, logaritmo))
+            g2 = self._temporal(self._producto(g1, logaritmo)) if self.orden >= 2 else None
+            return self._cadena(v, w0, g1, g2)
+
+        # u^v = exp(v·ln u)
+        return self._exponencial(self._multiplicar(v, self._logaritmo(u)))
+
+    def _exponencial(self, u: List[str]) -> List[str]:
+        g = self._llamar("exp", u[0])
+        return self._cadena(u, g, g, g if self.orden >= 2 else None)
+
+    def _logaritmo(self, u: List[str]) -> List[str]:
+        g0 = self._llamar("ln", u[0])
+        g1 = self._temporal(f"(1.0 / {u[0]})")
+        g2 = self._temporal(f"(-{g1} * {g1})") if self.orden >= 2 else None
+        return self._cadena(u, g0, g1, g2)
+
+    def _llamada(self, nodo: ast.Call) -> List[str]:
+        nombre = nodo.func.id
+        if nombre == "pow":
+            return self._potencia(self.visitar(nodo.args[0]), self.visitar(nodo.args[1]))
+
+        u = self.visitar(nodo.args[0])
+        segunda = self.orden >= 2
+
+        if nombre == "exp":
+            return self._exponencial(u)
+        if nombre == "ln":
+            return self._logaritmo(u)
+        if nombre == "sin":
+            s, c = self._llamar("sin", u[0]), self._llamar("cos", u[0])
+            return self._cadena(u, s, c, f"(-{s})" if segunda else None)
+        if nombre == "cos":
+            s, c = self._llamar("sin", u[0]), self._llamar("cos", u[0])
+            return self._cadena(u, c, self._temporal(f"(-{s})"), f"(-{c})" if segunda else None)
+        if nombre == "tan":
+            t = self._llamar("tan", u[0])
+            g1 = self._temporal(f"(1.0 + {t} * {t})")
+            return self._cadena(u, t, g1, f"(2.0 * {t} * {g1})" if segunda else None)
+        if nombre == "log10":
+            g0 = self._llamar("log10", u[0])
+            g1 = self._temporal(f"(1.0 / ({u[0]} * {math.log(10.0)!r}))")
+            return self._cadena(u, g0, g1, f"(-{g1} / {u[0]})" if segunda else None)
+        if nombre == "sqrt":
+            r = self._llamar("sqrt", u[0])
+            g1 = self._temporal(f"(0.5 / {r})")
+            return self._cadena(u, r, g1, f"(-{g1} / (2.0 * {u[0]}))" if segunda else None)
+        if nombre == "abs":
+            a = self._llamar("abs", u[0])
+            return self._cadena(u, a, self._temporal(f"({u[0]} / {a})"), _CERO if segunda else None)
+        raise DerivadaNoDisponibleError(f"No se sabe derivar la función '{nombre}'")
+
+
+def construir_jet(
+    cuerpo: ast.expr,
+    variables: Sequence[str],
+    funciones: Dict[str, Callable[..., float]],
+    orden: int = 1,
+    variable: str | None = None,
+) -> Callable[..., tuple]:
+    """
+    Compila una función que devuelve ``(f, f')`` u ``(f, f', f'')`` en una sola pasada.
+
+    La derivada es respecto a ``variable`` (por defecto la primera); el resto de
+    variables se tratan como constantes.
+    """
+    if orden not in (1, 2):
+        raise ValueError("El orden del jet debe ser 1 o 2")
+    generador = _GeneradorJet(variable or variables[0], orden)
+    componentes = generador.visitar(cuerpo)
+
+    cierres = sorted(generador.funciones) + sorted(generador.constantes)
+    cuerpo_codigo = "\n".join(f"        {linea}" for linea in generador.lineas)
+    codigo = (
+        f"def _fabrica({', '.join(cierres)}):\n"
+        f"    def _jet({', '.join(variables)}):\n"
+        f"{cuerpo_codigo}\n"
+        f"        return ({', '.join(componentes)},)\n"
+        f"    return _jet\n"
+    )
+    espacio: Dict[str, object] = {"__builtins__": {}}
+    exec(compile(codigo, "<jet>", "exec"), espacio)
+    valores = {**funciones, **generador.constantes}
+    return espacio["_fabrica"](*(valores[nombre] for nombre in cierres))
@@ -1,7 +1,8 @@
 import base64
+import cmath
 import io
 import math
-from typing import Dict, List, Any, Iterable
+from typing import Callable, Dict, List, Any, Iterable
 
 import matplotlib
 matplotlib.use("Agg")
@@ -10,36 +11,140 @@ import numpy as np
 import pandas as pd
 
 from models.schemas import IteracionData, MetodoResponse
+from services.convergencia import MonitorConvergencia
+# Los límites de CPU y memoria del ejecutor deben llegar al router (error 400): los
+# manejadores amplios de los métodos los relanzan en lugar de convertirlos en respuestas
+from services.ejecutor import LimiteExcedidoError
+from services.expresiones import (
+    EvaluacionesMemorizadas,
+    ExpresionInvalidaError,
+    compilar_conjunto,
+    compilar_expresion,
+    derivar_expresion,
+    normalizar_expresion,
+    validar_variables,
+)
+from services.polinomios import GRADO_MAXIMO, calcular_raices
+from services.sistemas_service import GaussPiv
+
+# Aceleraciones disponibles para punto fijo
+ACELERACIONES_PUNTO_FIJO = ("ninguna", "aitken", "steffensen")
+
+# Búsqueda de todos los cambios de signo: pasos de malla evaluados por bloque
+# (acota la memoria) y bloque mínimo del modo adaptativo
+BLOQUE_VECTORIAL = 65536
+BLOQUE_ADAPTATIVO_MINIMO = 256
+MAX_INTERVALOS_BUSQUEDA = 1000
+
+# Arranques múltiples (Newton y secante vectorizados): máximo de valores
+# iniciales por solicitud y códigos de estado de cada arranque
+MAX_ARRANQUES = 100_000
+ESTADOS_ARRANQUE = ("convergio", "no_convergio", "derivada_nula", "fuera_de_dominio")
+_CONVERGIO, _NO_CONVERGIO, _DERIVADA_NULA, _FUERA_DE_DOMINIO = range(len(ESTADOS_ARRANQUE))
+
+# Cuencas de atracción de Newton: píxeles máximos de la malla compleja y formatos de salida
+MAX_PIXELES_CUENCA = 1_000_000
+FORMATOS_CUENCA = ("png", "arreglo", "ambos")
+
+# Sistemas de ecuaciones no lineales: métodos, cálculo del jacobiano y tamaño máximo
+METODOS_SISTEMA = ("newton", "broyden")
+MODOS_JACOBIANO = ("automatico", "diferencias")
+MAX_ECUACIONES_SISTEMA = 20
+
+# Continuación paramétrica: predictores del punto de partida y valores máximos del parámetro
+PREDICTORES_CONTINUACION = ("ninguno", "secante", "tangente")
+MAX_VALORES_CONTINUACION = 100_000
+
+# Variantes de regla falsa: cómo se escala f en el extremo que se conserva dos veces seguidas
+VARIANTES_REGLA_FALSA = ("clasica", "illinois", "pegasus", "anderson-bjorck")
 
 class EcuacionesService:
     
     def _evaluar_funcion(self, funcion: str, x: float) -> float:
-        """Evalúa una función string de manera segura"""
+        """Evalúa una función string de manera segura usando la caché de expresiones compiladas"""
+        # Las construcciones no permitidas se rechazan al compilar, antes de evaluar
+        expresion = compilar_expresion(funcion)
         try:
-            # Preparar el namespace para eval
-            namespace = {
-                'x': x,
-                'sin': math.sin,
-                'cos': math.cos,
-                'tan': math.tan,
-                'exp': math.exp,
-                'log10': math.log10,
-                'ln': math.log,
-                'sqrt': math.sqrt,
-                'pi': math.pi,
-                'e': math.e,
-                'abs': abs,
-                'pow': pow,
-                'math': math,
-                'np': np
-            }
-            
-            # Reemplazar ^ por **
-            funcion = funcion.replace('^', '**')
-            
-            return eval(funcion, {"__builtins__": {}}, namespace)
+            return expresion.evaluar(x)
+        except (LimiteExcedidoError, MemoryError):
+            raise
         except Exception as e:
-            raise ValueError(f"Error evaluando función '{funcion}' en x={x}: {str(e)}")
+            raise ValueError(f"Error evaluando función '{normalizar_expresion(funcion)}' en x={x}: {str(e)}")
+    
+    def _funcion_memorizada(self, funcion: str) -> EvaluacionesMemorizadas:
+        """Devuelve f(x) memorizada para una resolución: cada punto distinto se evalúa una vez"""
+        expresion = compilar_expresion(funcion)
+        evaluar = expresion.evaluar
+
+        def evaluar_seguro(x: float) -> float:
+            try:
+                return evaluar(x)
+            except (LimiteExcedidoError, MemoryError):
+                raise
+            except Exception as e:
+                raise ValueError(f"Error evaluando función '{expresion.fuente}' en x={x}: {str(e)}")
+
+        return EvaluacionesMemorizadas(evaluar_seguro)
+    
+    def _evaluar_funcion_vector(self, funcion: str, valores: Any) -> np.ndarray:
+        """Evalúa una función string sobre un arreglo de puntos; NaN donde no está definida"""
+        return compilar_expresion(funcion).evaluar_vector(valores)
+    
+    def _resolver_derivada(self, funcion: str, derivada: str | None, orden: int = 1) -> tuple[str, bool]:
+        """
+        Devuelve la derivada a usar y si fue calculada automáticamente.
+
+        Si el cliente no envía la derivada (o la envía vacía) se deriva
+        simbólicamente ``funcion``; el resultado queda compilado en la caché.
+        """
+        if derivada is not None and derivada.strip():
+            return derivada, False
+        return derivar_expresion(funcion, orden).fuente, True
+    
+    def _evaluador_con_derivadas(
+        self,
+        funcion: str,
+        derivadas: List[str],
+        automaticas: bool,
+    ) -> EvaluacionesMemorizadas:
+        """
+        Devuelve un callable memorizado x -> (f(x), f'(x)[, f''(x)[, f'''(x)]]).
+
+        Cuando las derivadas son automáticas (hasta f'') se usa diferenciación
+        automática (una sola pasada sobre la expresión); en otro caso las
+        derivadas se compilan junto a f como un único DAG, de modo que los
+        subtérminos compartidos se calculan una sola vez.
+        """
+        expresion = compilar_expresion(funcion)
+        if automaticas and len(derivadas) <= 2:
+            evaluar = expresion.jet(len(derivadas))
+        else:
+            evaluar = compilar_conjunto([funcion, *derivadas]).evaluar
+
+        def evaluar_seguro(x: float) -> tuple:
+            try:
+                return evaluar(x)
+            except (LimiteExcedidoError, MemoryError):
+                raise
+            except Exception as e:
+                raise ValueError(f"Error evaluando función '{expresion.fuente}' o sus derivadas en x={x}: {str(e)}")
+
+        return EvaluacionesMemorizadas(evaluar_seguro)
+    
+    def _region_sin_raices(self, funcion: str, a: float, b: float) -> bool:
+        """
+        Indica si la aritmética de intervalos garantiza que f no se anula en [a, b].
+
+        Una respuesta negativa no afirma que haya raíz: solo que la cota obtenida
+        no permite descartarla (o que f no se pudo acotar en la región).
+        """
+        try:
+            cota = compilar_expresion(funcion).evaluar_intervalo((a, b))
+        except (LimiteExcedidoError, MemoryError):
+            raise
+        except (ValueError, ArithmeticError):
+            return False
+        return not cota.contiene(0.0)
     
     def _calcular_error(self, x_actual: float, x_anterior: float, tipo_error: str = "absoluto") -> float:
         """
@@ -127,6 +232,8 @@ class EcuacionesService:
         puntos: List[float],
         titulo: str,
         raiz: float | None = None,
+        f_raiz: Callable[[float], float] | None = None,
+        otras_raices: Iterable[float] = (),
     ) -> str | None:
         if not puntos:
             # Si no hay puntos, intentamos un rango genérico
@@ -146,18 +253,9 @@ class EcuacionesService:
             xmax += margen
 
         x_vals = np.linspace(xmin, xmax, 400)
-        y_vals = []
-        todo_nan = True
-        for x in x_vals:
-            try:
-                valor = self._evaluar_funcion(funcion, float(x))
-                y_vals.append(valor)
-                if np.isfinite(valor):
-                    todo_nan = False
-            except Exception:
-                y_vals.append(np.nan)
+        y_vals = self._evaluar_funcion_vector(funcion, x_vals)
 
-        if todo_nan:
+        if not np.isfinite(y_vals).any():
             return None
 
         plt.figure(figsize=(7, 4))
@@ -166,11 +264,19 @@ class EcuacionesService:
 
         if raiz is not None and np.isfinite(raiz):
             try:
-                plt.scatter([raiz], [self._evaluar_funcion(funcion, raiz)], color="#d62728", zorder=5)
+                y_raiz = f_raiz(raiz) if f_raiz is not None else self._evaluar_funcion(funcion, raiz)
+                plt.scatter([raiz], [y_raiz], color="#d62728", zorder=5)
                 plt.scatter([raiz], [0], color="#2ca02c", zorder=6, label=f"Raíz ≈ {raiz:.6f}")
+            except (LimiteExcedidoError, MemoryError):
+                raise
             except Exception:
                 plt.scatter([raiz], [0], color="#2ca02c", zorder=5, label=f"Raíz ≈ {raiz:.6f}")
 
+        otras_raices = [r for r in otras_raices if np.isfinite(r) and r != raiz]
+        if otras_raices:
+            plt.scatter(otras_raices, [0] * len(otras_raices), color="#2ca02c", marker="x", zorder=6,
+                        label=f"Otras raíces ({len(otras_raices)})")
+
         plt.title(titulo)
         plt.xlabel("x")
         plt.ylabel("f(x)")
@@ -185,6 +291,14 @@ class EcuacionesService:
         imagen_base64 = base64.b64encode(buffer.read()).decode("utf-8")
         return f"data:image/png;base64,{imagen_base64}"
 
+    @staticmethod
+    def _f_desde_memo(evaluaciones: EvaluacionesMemorizadas) -> Callable[[float], float]:
+        """f(x) a partir de un memo que puede guardar f o la tupla (f, f', ...)"""
+        def f(x: float) -> float:
+            valor = evaluaciones(x)
+            return valor[0] if isinstance(valor, tuple) else valor
+        return f
+
     def _construir_respuesta_metodo(
         self,
         *,
@@ -196,8 +310,14 @@ class EcuacionesService:
         claves_grafica: Iterable[str] | None = None,
         titulo_grafica: str = "Gráfico del método",
         ayuda: str | None = None,
+        resumen: Dict[str, Any] | None = None,
+        evaluaciones: EvaluacionesMemorizadas | None = None,
+        otras_raices: Iterable[float] = (),
     ) -> Dict[str, Any]:
         tabla_html = self._iteraciones_a_tabla_html(iteraciones)
+        # nfev cuenta solo las evaluaciones del método, no las del gráfico
+        if evaluaciones is not None:
+            resumen = {**(resumen or {}), **evaluaciones.estadisticas()}
 
         grafico = None
         if funcion and claves_grafica:
@@ -208,7 +328,11 @@ class EcuacionesService:
                     puntos_grafica,
                     titulo_grafica,
                     raiz=resultado if exito else None,
+                    f_raiz=self._f_desde_memo(evaluaciones) if evaluaciones is not None else None,
+                    otras_raices=otras_raices,
                 )
+            except (LimiteExcedidoError, MemoryError):
+                raise
             except Exception:
                 grafico = None
 
@@ -223,22 +347,31 @@ class EcuacionesService:
         respuesta["grafico"] = grafico
         if ayuda:
             respuesta["ayuda"] = ayuda
+        if resumen:
+            respuesta["resumen"] = resumen
 
         return respuesta
     
-    def biseccion(self, xi: float, xs: float, tolerancia: float, niter: int, funcion: str, tipo_error: str = "absoluto") -> Dict[str, Any]:
-        """Implementa el método de bisección basado en el código original"""
-        iteraciones = []
-        
-        # Evaluación inicial
-        fi = self._evaluar_funcion(funcion, xi)
-        fs = self._evaluar_funcion(funcion, xs)
-        
-        ayuda_general = (
-            "Recuerde que el intervalo inicial debe cumplir f(a)·f(b) < 0. "
-            "Use la variable x y potencias con ** (ej: x**3)."
-        )
+    def _validar_cambio_signo(
+        self,
+        f: EvaluacionesMemorizadas,
+        xi: float,
+        xs: float,
+        funcion: str,
+        titulo_grafica: str,
+        ayuda: str,
+    ) -> Dict[str, Any] | None:
+        """
+        Comprueba los extremos de un método de intervalo.
 
+        Devuelve la respuesta final si un extremo ya es raíz o si no hay cambio
+        de signo en [xi, xs]; None si el intervalo es válido para iterar.
+        """
+        # El memo puede guardar f o la tupla (f, f', ...)
+        valor_f = self._f_desde_memo(f)
+        fi = valor_f(xi)
+        fs = valor_f(xs)
+        
         if fi == 0:
             iteraciones = [
                 IteracionData(
@@ -254,8 +387,9 @@ class EcuacionesService:
                 mensaje=f"{xi} es raíz de f(x)",
                 funcion=funcion,
                 claves_grafica=["xi", "xs", "xm"],
-                titulo_grafica="Método de Bisección",
-                ayuda=ayuda_general,
+                titulo_grafica=titulo_grafica,
+                ayuda=ayuda,
+                evaluaciones=f,
             )
             
         if fs == 0:
@@ -273,8 +407,9 @@ class EcuacionesService:
                 mensaje=f"{xs} es raíz de f(x)",
                 funcion=funcion,
                 claves_grafica=["xi", "xs", "xm"],
-                titulo_grafica="Método de Bisección",
-                ayuda=ayuda_general,
+                titulo_grafica=titulo_grafica,
+                ayuda=ayuda,
+                evaluaciones=f,
             )
             
         if fs * fi >= 0:
@@ -285,21 +420,44 @@ class EcuacionesService:
                 mensaje="El intervalo es inadecuado. Debe existir cambio de signo en f(a) y f(b).",
                 funcion=funcion,
                 claves_grafica=None,
-                titulo_grafica="Método de Bisección",
+                titulo_grafica=titulo_grafica,
                 ayuda=(
                     "Verifique que f(a) y f(b) tengan signos opuestos. Puede usar la búsqueda incremental "
                     "para localizar un intervalo adecuado."
                 ),
+                evaluaciones=f,
             )
         
+        return None
+    
+    def biseccion(self, xi: float, xs: float, tolerancia: float, niter: int, funcion: str, tipo_error: str = "absoluto") -> Dict[str, Any]:
+        """Implementa el método de bisección basado en el código original"""
+        iteraciones = []
+        f = self._funcion_memorizada(funcion)
+        
+        # Evaluación inicial
+        fi = f(xi)
+        fs = f(xs)
+        
+        ayuda_general = (
+            "Recuerde que el intervalo inicial debe cumplir f(a)·f(b) < 0. "
+            "Use la variable x y potencias con ** (ej: x**3)."
+        )
+
+        respuesta = self._validar_cambio_signo(f, xi, xs, funcion, "Método de Bisección", ayuda_general)
+        if respuesta is not None:
+            return respuesta
+        
         # Algoritmo de bisección - siguiendo la estructura original
         c = 0
         fm = []
         E = [100]  # Error inicial
+        # Solo informa: la bisección no diverge y su razón (1/2) ya se conoce
+        convergencia = MonitorConvergencia(tolerancia, niter, detener=False)
         
         # Primera iteración
         xm = (xi + xs) / 2
-        fe = self._evaluar_funcion(funcion, xm)
+        fe = f(xm)
         fm.append(fe)
         
         iteraciones.append(IteracionData(
@@ -321,14 +479,14 @@ class EcuacionesService:
         while E[c] > tolerancia and fe != 0 and c < niter:
             if fi * fe < 0:
                 xs = xm
-                fs = self._evaluar_funcion(funcion, xs)
+                fs = f(xs)
             else:
                 xi = xm
-                fi = self._evaluar_funcion(funcion, xi)
+                fi = f(xi)
             
             xa = xm
             xm = (xi + xs) / 2
-            fe = self._evaluar_funcion(funcion, xm)
+            fe = f(xm)
             fm.append(fe)
             
             # Calcular ambos tipos de error
@@ -339,6 +497,7 @@ class EcuacionesService:
             error = self._calcular_error(xm, xa, tipo_error)
             E.append(error)
             c = c + 1
+            convergencia.registrar(error, c)
             
             iteraciones.append(IteracionData(
                 iteracion=c + 1,
@@ -376,19 +535,318 @@ class EcuacionesService:
             claves_grafica=["xi", "xs", "xm"],
             titulo_grafica="Método de Bisección",
             ayuda=ayuda_general,
+            resumen={"convergencia": convergencia.estado},
+            evaluaciones=f,
+        )
+    
+    @staticmethod
+    def _nucleo_brent(
+        f: Callable[[float], float],
+        xi: float,
+        xs: float,
+        tolerancia: float,
+        niter: int,
+        tipo_error: str = "absoluto",
+        registrar: Callable[..., None] | None = None,
+    ) -> tuple[float, float, bool]:
+        """
+        Iteración de Brent sobre [xi, xs] (con f(xi)·f(xs) < 0).
+
+        Devuelve (raíz, f(raíz), convergió). ``registrar`` recibe el
+        estado de cada paso: (i, a, fa, b, fb, c, fc, paso, error_absoluto,
+        error_relativo, error).
+        """
+        # b es la mejor aproximación, c el extremo opuesto del intervalo y a el iterado anterior
+        a, b = xi, xs
+        fa, fb = f(a), f(b)
+        c, fc = a, fa
+        d = e = b - a
+        epsilon = np.finfo(float).eps
+        error = float("inf")
+        
+        for i in range(1, niter + 1):
+            if fb * fc > 0:
+                c, fc = a, fa
+                d = e = b - a
+            if abs(fc) < abs(fb):
+                a, b, c = b, c, b
+                fa, fb, fc = fb, fc, fb
+            
+            tolerancia_paso = 2 * epsilon * abs(b) + 0.5 * tolerancia
+            mitad = 0.5 * (c - b)
+            
+            # Error: semiancho del intervalo que contiene la raíz
+            error_absoluto = abs(mitad)
+            error_relativo = error_absoluto / abs(b) if abs(b) > 1e-12 else error_absoluto
+            error = error_relativo if tipo_error == "relativo" else error_absoluto
+            
+            if fb == 0 or error <= tolerancia or abs(mitad) <= tolerancia_paso:
+                break
+            
+            if abs(e) >= tolerancia_paso and abs(fa) > abs(fb):
+                s = fb / fa
+                if a == c:
+                    paso = "Secante"
+                    p = 2 * mitad * s
+                    q = 1 - s
+                else:
+                    paso = "Interpolación cuadrática inversa"
+                    q = fa / fc
+                    r = fb / fc
+                    p = s * (2 * mitad * q * (q - r) - (b - a) * (r - 1))
+                    q = (q - 1) * (r - 1) * (s - 1)
+                if p > 0:
+                    q = -q
+                p = abs(p)
+                if 2 * p < min(3 * mitad * q - abs(tolerancia_paso * q), abs(e * q)):
+                    e, d = d, p / q
+                else:
+                    paso = "Bisección (interpolación rechazada)"
+                    d = e = mitad
+            else:
+                paso = "Bisección"
+                d = e = mitad
+            
+            a, fa = b, fb
+            b += d if abs(d) > tolerancia_paso else math.copysign(tolerancia_paso, mitad)
+            fb = f(b)
+            
+            if registrar is not None:
+                registrar(i, a, fa, b, fb, c, fc, paso, error_absoluto, error_relativo, error)
+        
+        convergio = fb == 0 or error <= tolerancia or abs(mitad) <= tolerancia_paso
+        return b, fb, convergio
+    
+    def brent(self, xi: float, xs: float, tolerancia: float, niter: int, funcion: str,
+              tipo_error: str = "absoluto") -> Dict[str, Any]:
+        """
+        Implementa el método de Brent: interpolación cuadrática inversa y secante
+        con respaldo de bisección.
+
+        Mantiene siempre un intervalo con cambio de signo, de modo que conserva la
+        garantía de convergencia de la bisección pero, cerca de la raíz, converge
+        de forma superlineal. La tabla usa las mismas columnas que la bisección.
+        """
+        iteraciones = []
+        f = self._funcion_memorizada(funcion)
+        
+        ayuda_brent = (
+            "Recuerde que el intervalo inicial debe cumplir f(a)·f(b) < 0. "
+            "Brent combina interpolación y bisección: converge siempre que haya cambio de signo."
+        )
+
+        respuesta = self._validar_cambio_signo(f, xi, xs, funcion, "Método de Brent", ayuda_brent)
+        if respuesta is not None:
+            return respuesta
+        
+        # Solo informa: Brent conserva el cambio de signo y no puede diverger
+        convergencia = MonitorConvergencia(tolerancia, niter, detener=False)
+        
+        def registrar(i, a, fa, b, fb, c, fc, paso, error_absoluto, error_relativo, error):
+            convergencia.registrar(error, i)
+            iteraciones.append(IteracionData(
+                iteracion=i,
+                valores={
+                    "xi": min(a, c),
+                    "xs": max(a, c),
+                    "xm": b,
+                    "fi": fa if a < c else fc,
+                    "fs": fc if a < c else fa,
+                    "fm": fb,
+                    "error_absoluto": error_absoluto,
+                    "error_relativo": error_relativo
+                },
+                error=error,
+                observacion=paso
+            ))
+        
+        b, fb, convergio = self._nucleo_brent(f, xi, xs, tolerancia, niter, tipo_error, registrar)
+        
+        if fb == 0:
+            mensaje = f"{b} es raíz de f(x)"
+            exito = True
+        elif convergio:
+            mensaje = f"{b} es una aproximación de una raíz de f(x) con tolerancia {tolerancia}"
+            exito = True
+        else:
+            mensaje = f"Fracaso en {niter} iteraciones"
+            exito = False
+        
+        return self._construir_respuesta_metodo(
+            exito=exito,
+            resultado=b,
+            iteraciones=iteraciones,
+            mensaje=mensaje,
+            funcion=funcion,
+            claves_grafica=["xi", "xs", "xm"],
+            titulo_grafica="Método de Brent",
+            ayuda=ayuda_brent,
+            resumen={"convergencia": convergencia.estado},
+            evaluaciones=f,
+        )
+    
+    def newton_seguro(self, xi: float, xs: float, tolerancia: float, niter: int, funcion_f: str,
+                      funcion_df: str | None = None, x0: float | None = None,
+                      tipo_error: str = "absoluto") -> Dict[str, Any]:
+        """
+        Implementa Newton-Raphson con salvaguarda de bisección (rtsafe).
+
+        Conserva un intervalo [xi, xs] con cambio de signo. En cada paso toma el
+        paso de Newton si cae dentro del intervalo y reduce |f| lo suficiente
+        (al menos la mitad del paso anterior); en otro caso biseca. Converge
+        siempre que haya cambio de signo y, cerca de la raíz, lo hace con la
+        velocidad cuadrática de Newton. Si no se envía ``x0`` se parte del punto medio.
+        """
+        iteraciones = []
+        funcion_df, df_automatica = self._resolver_derivada(funcion_f, funcion_df)
+        evaluar_f_df = self._evaluador_con_derivadas(funcion_f, [funcion_df], df_automatica)
+        
+        ayuda_seguro = (
+            "El intervalo inicial debe cumplir f(a)·f(b) < 0. Los pasos de Newton que salen del "
+            "intervalo o avanzan poco se reemplazan por bisección, de modo que el método siempre converge."
         )
+        titulo = "Método de Newton con salvaguarda"
+        
+        respuesta = self._validar_cambio_signo(evaluar_f_df, xi, xs, funcion_f, titulo, ayuda_seguro)
+        if respuesta is not None:
+            return respuesta
+        if x0 is not None and not min(xi, xs) < x0 < max(xi, xs):
+            raise ValueError(f"El valor inicial x0 = {x0} debe estar dentro del intervalo [{xi}, {xs}]")
+        
+        # Extremos orientados: f(negativo) < 0 < f(positivo)
+        negativo, positivo = (xi, xs) if evaluar_f_df(xi)[0] < 0 else (xs, xi)
+        x = (xi + xs) / 2 if x0 is None else x0
+        paso_anterior = paso = abs(xs - xi)
+        pasos = {"pasos_newton": 0, "pasos_biseccion": 0}
+        convergencia = MonitorConvergencia(tolerancia, niter, detener=False)
+        
+        def responder(exito: bool, resultado: float, mensaje: str) -> Dict[str, Any]:
+            return self._construir_respuesta_metodo(
+                exito=exito,
+                resultado=resultado,
+                iteraciones=iteraciones,
+                mensaje=mensaje,
+                funcion=funcion_f,
+                claves_grafica=["xi", "xs", "xm"],
+                titulo_grafica=titulo,
+                ayuda=ayuda_seguro,
+                resumen={
+                    "funcion_df": funcion_df,
+                    "derivada_automatica": df_automatica,
+                    **pasos,
+                    "convergencia": convergencia.estado,
+                },
+                evaluaciones=evaluar_f_df,
+            )
+        
+        try:
+            fx, dfx = evaluar_f_df(x)
+        except (LimiteExcedidoError, MemoryError):
+            raise
+        except ValueError as e:
+            return responder(False, x, f"No fue posible evaluar f(x) y f'(x) en el valor inicial. {str(e)}")
+        # x pasa a ser un extremo: así la primera bisección no repite el punto
+        if fx < 0:
+            negativo = x
+        else:
+            positivo = x
+        iteraciones.append(IteracionData(
+            iteracion=0,
+            valores={"xi": min(negativo, positivo), "xs": max(negativo, positivo), "xm": x, "fm": fx, "dfm": dfx,
+                     "error_absoluto": "", "error_relativo": ""},
+            error=None,
+            observacion="Valor inicial"
+        ))
+        if fx == 0:
+            return responder(True, x, f"{x} es raíz de f(x)")
+        
+        for i in range(1, niter + 1):
+            # Newton se rechaza si sale del intervalo (también cubre f'(x) = 0) o si no reduce el paso a la mitad
+            fuera = ((x - positivo) * dfx - fx) * ((x - negativo) * dfx - fx) > 0
+            if fuera or abs(2 * fx) > abs(paso_anterior * dfx):
+                paso_anterior, paso = paso, 0.5 * (positivo - negativo)
+                x_nuevo = negativo + paso
+                observacion = "Bisección (Newton fuera del intervalo)" if fuera else "Bisección (Newton lento)"
+                pasos["pasos_biseccion"] += 1
+            else:
+                paso_anterior, paso = paso, fx / dfx
+                x_nuevo = x - paso
+                observacion = "Newton"
+                pasos["pasos_newton"] += 1
+            
+            error_absoluto = abs(x_nuevo - x)
+            error_relativo = error_absoluto / abs(x_nuevo) if abs(x_nuevo) > 1e-12 else error_absoluto
+            error = self._calcular_error(x_nuevo, x, tipo_error)
+            x = x_nuevo
+            try:
+                fx, dfx = evaluar_f_df(x)
+            except (LimiteExcedidoError, MemoryError):
+                raise
+            except ValueError as e:
+                return responder(False, x, f"Error en la iteración {i}: {str(e)}")
+            if fx < 0:
+                negativo = x
+            else:
+                positivo = x
+            
+            convergencia.registrar(error, i)
+            iteraciones.append(IteracionData(
+                iteracion=i,
+                valores={
+                    "xi": min(negativo, positivo),
+                    "xs": max(negativo, positivo),
+                    "xm": x,
+                    "fm": fx,
+                    "dfm": dfx,
+                    "error_absoluto": error_absoluto,
+                    "error_relativo": error_relativo
+                },
+                error=error,
+                observacion=observacion
+            ))
+            
+            if fx == 0:
+                return responder(True, x, f"{x} es raíz de f(x)")
+            if abs(fx) <= tolerancia or error <= tolerancia:
+                return responder(True, x, f"{x} es una aproximación de una raíz de f(x) con tolerancia {tolerancia}")
+        
+        return responder(False, x, f"Fracaso en {niter} iteraciones")
+    
+    @staticmethod
+    def _extrapolar_aitken(x0: float, x1: float, x2: float) -> float | None:
+        """Extrapolación Δ² de Aitken de x0, x1 = g(x0), x2 = g(x1); None si Δ² se anula"""
+        segunda_diferencia = x2 - 2 * x1 + x0
+        if segunda_diferencia == 0 or not math.isfinite(segunda_diferencia):
+            return None
+        return x2 - (x2 - x1) ** 2 / segunda_diferencia
     
     def punto_fijo(self, x0: float, tolerancia: float, niter: int, 
-                   funcion_f: str, funcion_g: str, tipo_error: str = "absoluto") -> Dict[str, Any]:
-        """Implementa el método de punto fijo basado en el código original"""
+                   funcion_f: str, funcion_g: str, tipo_error: str = "absoluto",
+                   aceleracion: str = "ninguna") -> Dict[str, Any]:
+        """
+        Implementa el método de punto fijo basado en el código original.
+
+        ``aceleracion`` puede ser 'ninguna', 'aitken' (extrapola Δ² sobre las
+        iteraciones de g sin alterarlas) o 'steffensen' (reinicia cada paso desde
+        el valor extrapolado). En ambos casos xi es el iterado acelerado y la
+        tabla muestra también los valores de g sin acelerar.
+        """
+        aceleracion = aceleracion.strip().lower()
+        if aceleracion not in ACELERACIONES_PUNTO_FIJO:
+            raise ValueError(
+                f"Aceleración no válida: '{aceleracion}'. "
+                f"Opciones: {', '.join(ACELERACIONES_PUNTO_FIJO)}"
+            )
         iteraciones = []
+        f = self._funcion_memorizada(funcion_f)
+        g = self._funcion_memorizada(funcion_g)
         
         x_actual = x0
         error = float('inf')
         i = 0
         
         # Primera evaluación
-        f_actual = self._evaluar_funcion(funcion_f, x_actual)
+        f_actual = f(x_actual)
         
         iteraciones.append(IteracionData(
             iteracion=i,
@@ -402,11 +860,33 @@ class EcuacionesService:
             observacion="Valor inicial"
         ))
         
+        # Iteraciones de g sin acelerar (solo Aitken las conserva aparte de xi)
+        sin_acelerar = [x0]
+        convergencia = MonitorConvergencia(tolerancia, niter, orden=2.0 if aceleracion == "steffensen" else 1.0)
+        detencion = None
+        
         # Algoritmo de punto fijo
         while error > tolerancia and abs(f_actual) > tolerancia and i < niter:
             x_anterior = x_actual
-            x_actual = self._evaluar_funcion(funcion_g, x_anterior)
-            f_actual = self._evaluar_funcion(funcion_f, x_actual)
+            observacion = "Iteración punto fijo"
+            if aceleracion == "steffensen":
+                g_x = g(x_anterior)
+                g_g_x = g(g_x)
+                extrapolado = self._extrapolar_aitken(x_anterior, g_x, g_g_x)
+                x_actual = g_g_x if extrapolado is None else extrapolado
+                columnas_g = {"g_xi_anterior": g_x, "g_g_xi_anterior": g_g_x}
+                observacion = "Paso de Steffensen" if extrapolado is not None else "Δ² = 0: se usa g(g(x))"
+            elif aceleracion == "aitken":
+                sin_acelerar = (sin_acelerar + [g(sin_acelerar[-1])])[-3:]
+                extrapolado = self._extrapolar_aitken(*sin_acelerar) if len(sin_acelerar) == 3 else None
+                x_actual = sin_acelerar[-1] if extrapolado is None else extrapolado
+                columnas_g = {"x_sin_acelerar": sin_acelerar[-1]}
+                if extrapolado is not None:
+                    observacion = "Extrapolación Δ² de Aitken"
+            else:
+                x_actual = g(x_anterior)
+                columnas_g = {"g_xi_anterior": x_actual}
+            f_actual = f(x_actual)
             i += 1
             
             # Calcular ambos tipos de error
@@ -421,13 +901,17 @@ class EcuacionesService:
                 valores={
                     "xi": x_actual,
                     "f_xi": f_actual,
-                    "g_xi_anterior": self._evaluar_funcion(funcion_g, x_anterior),
+                    **columnas_g,
                     "error_absoluto": error_absoluto,
                     "error_relativo": error_relativo
                 },
                 error=error,
-                observacion="Iteración punto fijo"
+                observacion=observacion
             ))
+            if error > tolerancia and abs(f_actual) > tolerancia:
+                detencion = convergencia.registrar(error, i)
+                if detencion is not None:
+                    break
         
         if abs(f_actual) <= tolerancia:
             mensaje = f"Raíz encontrada: x = {x_actual:.6f}"
@@ -435,6 +919,9 @@ class EcuacionesService:
         elif error <= tolerancia:
             mensaje = f"Punto fijo encontrado: x = {x_actual:.6f}"
             exito = True
+        elif detencion is not None:
+            mensaje = f"Detención temprana en la iteración {i}: {detencion}"
+            exito = False
         else:
             mensaje = f"Método falló después de {niter} iteraciones"
             exito = False
@@ -451,16 +938,47 @@ class EcuacionesService:
                 "Verifique que la función g(x) cumpla |g'(x)| < 1 alrededor de la raíz "
                 "para garantizar convergencia. Use la variable x y funciones disponibles (sin, cos, exp)."
             ),
+            resumen={"aceleracion": aceleracion, "nfev_g": g.nfev, "convergencia": convergencia.estado},
+            evaluaciones=f,
         )
     
+    def _factor_regla_falsa(self, variante: str, f_reemplazado: float, f_nuevo: float) -> float:
+        """
+        Factor por el que se multiplica f en el extremo conservado cuando el mismo
+        extremo se reemplaza dos veces seguidas (f_reemplazado y f_nuevo tienen el mismo signo).
+        """
+        if variante == "illinois":
+            return 0.5
+        if variante == "pegasus":
+            return f_reemplazado / (f_reemplazado + f_nuevo)
+        if variante == "anderson-bjorck":
+            m = 1 - f_nuevo / f_reemplazado
+            return m if m > 0 else 0.5
+        return 1.0
+    
     def regla_falsa(self, x0: float, x1: float, tolerancia: float, 
-                    niter: int, funcion: str, tipo_error: str = "absoluto") -> Dict[str, Any]:
-        """Implementa el método de regla falsa basado en el código original"""
+                    niter: int, funcion: str, tipo_error: str = "absoluto",
+                    variante: str = "clasica") -> Dict[str, Any]:
+        """
+        Implementa el método de regla falsa basado en el código original.
+
+        ``variante`` elige la corrección para el estancamiento de un extremo:
+        'clasica' (sin corrección), 'illinois', 'pegasus' o 'anderson-bjorck'.
+        Las variantes escalan f en el extremo que se conserva, de modo que la
+        convergencia pasa a ser superlineal sin perder el cambio de signo.
+        """
+        variante = variante.strip().lower().replace("_", "-").replace("á", "a")
+        if variante not in VARIANTES_REGLA_FALSA:
+            raise ValueError(
+                f"Variante de regla falsa no válida: '{variante}'. "
+                f"Opciones: {', '.join(VARIANTES_REGLA_FALSA)}"
+            )
         iteraciones = []
+        f = self._funcion_memorizada(funcion)
         
         # Evaluación inicial
-        f0 = self._evaluar_funcion(funcion, x0)
-        f1 = self._evaluar_funcion(funcion, x1)
+        f0 = f(x0)
+        f1 = f(x1)
         
         print(f"Evaluación inicial:")
         print(f"f({x0}) = {f0}")
@@ -490,6 +1008,7 @@ class EcuacionesService:
                 claves_grafica=["x0", "x1", "x2"],
                 titulo_grafica="Método de Regla Falsa",
                 ayuda=ayuda_rf,
+                evaluaciones=f,
             )
             
         if f1 == 0:
@@ -510,6 +1029,7 @@ class EcuacionesService:
                 claves_grafica=["x0", "x1", "x2"],
                 titulo_grafica="Método de Regla Falsa",
                 ayuda=ayuda_rf,
+                evaluaciones=f,
             )
             
         if f0 * f1 >= 0:
@@ -529,6 +1049,7 @@ class EcuacionesService:
                 claves_grafica=["x0", "x1"],
                 titulo_grafica="Método de Regla Falsa",
                 ayuda=ayuda_rf,
+                evaluaciones=f,
             )
         
         # Variables para el método
@@ -538,6 +1059,11 @@ class EcuacionesService:
         f1_actual = f1
         error = float('inf')
         c = 0
+        extremo_anterior = None
+        # La variante clásica (orden 1) puede estancarse en un extremo: se corta si la convergencia es
+        # lineal lenta; las variantes modificadas son superlineales y solo informan
+        convergencia = MonitorConvergencia(tolerancia, niter, acotado=True, orden=1.0 if variante == "clasica" else 1.4)
+        detencion = None
         
         while error > tolerancia and c < niter:
             # Calcular X2 usando la fórmula de interpolación lineal
@@ -545,7 +1071,7 @@ class EcuacionesService:
                 break
                 
             x2 = x0_actual - f0_actual * (x1_actual - x0_actual) / (f1_actual - f0_actual)
-            f2 = self._evaluar_funcion(funcion, x2)
+            f2 = f(x2)
             
             # Calcular ambos tipos de error
             if c > 0:
@@ -566,6 +1092,18 @@ class EcuacionesService:
             elif f2 * f1_actual < 0:
                 observacion = "Raíz en [X2, X1] → X0 = X2"
             
+            # Extremo que se reemplaza; si se repite, la variante escala f en el que se conserva
+            extremo = "x1" if f0_actual * f2 < 0 else "x0" if f2 * f1_actual < 0 else None
+            factor = 1.0
+            if extremo is not None and extremo == extremo_anterior:
+                if extremo == "x1":
+                    factor = self._factor_regla_falsa(variante, f1_actual, f2)
+                else:
+                    factor = self._factor_regla_falsa(variante, f0_actual, f2)
+                if factor != 1.0:
+                    conservado = "X0" if extremo == "x1" else "X1"
+                    observacion += f" · f({conservado}) × {factor:.4g} ({variante})"
+            
             iteraciones.append(IteracionData(
                 iteracion=c + 1,
                 valores={
@@ -607,22 +1145,36 @@ class EcuacionesService:
                     claves_grafica=["x0", "x1", "x2"],
                     titulo_grafica="Método de Regla Falsa",
                     ayuda=ayuda_rf,
+                    resumen={"variante": variante, "convergencia": convergencia.estado},
+                    evaluaciones=f,
                 )
                 
             # Actualizar intervalo
-            if f0_actual * f2 < 0:
+            if extremo == "x1":
                 x1_actual = x2
                 f1_actual = f2
-            elif f2 * f1_actual < 0:
+                f0_actual *= factor
+            elif extremo == "x0":
                 x0_actual = x2
                 f0_actual = f2
+                f1_actual *= factor
             else:
                 break
                 
+            extremo_anterior = extremo
             x2_anterior = x2
             c += 1
+            if error > tolerancia:
+                detencion = convergencia.registrar(error, c)
+                if detencion is not None:
+                    break
         
-        if c >= niter:
+        if detencion is not None:
+            mensaje = f"Detención temprana en la iteración {c}: {detencion}"
+            if variante == "clasica":
+                mensaje += " Pruebe la variante 'illinois' o 'pegasus'."
+            exito = False
+        elif c >= niter:
             mensaje = f"Método terminó por límite de iteraciones ({niter})"
             exito = False
         elif error <= tolerancia:
@@ -641,15 +1193,25 @@ class EcuacionesService:
             claves_grafica=["x0", "x1", "x2"],
             titulo_grafica="Método de Regla Falsa",
             ayuda=ayuda_rf,
+            resumen={"variante": variante, "convergencia": convergencia.estado},
+            evaluaciones=f,
         )
     
     def busqueda_incremental(self, x0: float, delta: float, niter: int, 
-                           funcion: str) -> Dict[str, Any]:
-        """Implementa la búsqueda incremental basada en el código original"""
+                           funcion: str, todos: bool = False, adaptativo: bool = False) -> Dict[str, Any]:
+        """
+        Implementa la búsqueda incremental basada en el código original.
+
+        Con ``todos`` se recorre la malla completa x0 + k·delta (k = 0..niter) y se
+        devuelven todos los intervalos con cambio de signo en lugar del primero.
+        """
+        if todos:
+            return self._buscar_todos_los_cambios(x0, delta, niter, funcion, adaptativo)
         iteraciones = []
+        f = self._funcion_memorizada(funcion)
         
         x = x0
-        f0 = self._evaluar_funcion(funcion, x)
+        f0 = f(x)
         
         if f0 == 0:
             iteraciones.append(IteracionData(
@@ -669,11 +1231,12 @@ class EcuacionesService:
                     "Utilice este método para encontrar un intervalo adecuado antes de aplicar Bisección o Regla Falsa. "
                     "Ingrese incrementos positivos y un número de iteraciones razonable."
                 ),
+                evaluaciones=f,
             )
         
         x1 = x0 + delta
         c = 1
-        f1 = self._evaluar_funcion(funcion, x1)
+        f1 = f(x1)
         
         # Registrar la primera iteración
         iteraciones.append(IteracionData(
@@ -690,11 +1253,45 @@ class EcuacionesService:
             observacion="Mismo signo" if f0 * f1 > 0 else "Cambio de signo"
         ))
         
+        # Pasos que se intentan descartar de una vez con aritmética de intervalos;
+        # crece mientras las regiones resulten libres de raíces y se reduce si no
+        salto = 2
+        pasos_descartados = 0
+        cotas_intervalo = 0
+        
         while f0 * f1 > 0 and c < niter:
+            pasos = min(salto, niter - c)
+            if pasos >= 2:
+                cotas_intervalo += 1
+                if self._region_sin_raices(funcion, x1, x1 + pasos * delta):
+                    x0 = x1
+                    f0 = f1
+                    x1 = x0 + pasos * delta
+                    f1 = f(x1)
+                    c = c + pasos
+                    pasos_descartados += pasos
+                    salto *= 2
+                    
+                    iteraciones.append(IteracionData(
+                        iteracion=c,
+                        valores={
+                            "x0": x0,
+                            "x1": x1,
+                            "f0": f0,
+                            "f1": f1,
+                            "producto": f0 * f1,
+                            "error_absoluto": "",
+                            "error_relativo": ""
+                        },
+                        observacion=f"Sin raíces en el intervalo (aritmética de intervalos): {pasos} pasos en una evaluación"
+                    ))
+                    continue
+                salto = max(2, salto // 2)
+            
             x0 = x1
             f0 = f1
             x1 = x0 + delta
-            f1 = self._evaluar_funcion(funcion, x1)
+            f1 = f(x1)
             c = c + 1
             
             iteraciones.append(IteracionData(
@@ -736,73 +1333,382 @@ class EcuacionesService:
                 "Utilice este método para encontrar un intervalo adecuado antes de aplicar Bisección o Regla Falsa. "
                 "Ingrese incrementos positivos y un número de iteraciones razonable."
             ),
+            resumen={"pasos_descartados": pasos_descartados, "cotas_intervalo": cotas_intervalo},
+            evaluaciones=f,
         )
     
-    def newton_raphson(self, x0: float, tolerancia: float, niter: int, 
-                      funcion_f: str, funcion_df: str, incluir_error: bool = True,
-                      tipo_error: str = "absoluto", tipo_precision: str = "decimales", precision: int = 6) -> Dict[str, Any]:
-        """Implementa el método de Newton-Raphson según el procedimiento de las imágenes"""
-        iteraciones = []
-        
-        xi = x0
+    def _escanear_malla(self, x0: float, delta: float, niter: int, funcion: str,
+                        adaptativo: bool) -> Dict[str, Any]:
+        """
+        Evalúa la malla x0 + k·delta (k = 0..niter) por bloques con NumPy y
+        devuelve cada intervalo con cambio de signo y cada raíz exacta, en orden.
+
+        Con ``adaptativo`` cada bloque se intenta descartar antes con aritmética de
+        intervalos: el bloque se duplica mientras f no se anule (regiones planas) y
+        se divide a la mitad cuando no se puede descartar, hasta evaluarse en la
+        malla. Los intervalos encontrados son los mismos que sin el modo adaptativo.
+        """
+        compilada = compilar_expresion(funcion)
+        intervalos: List[Dict[str, float]] = []
+        raices_exactas: List[Dict[str, float]] = []
+        hallazgos: List[Dict[str, Any]] = []
+        evaluaciones = 0
+        pasos_descartados = 0
+        cotas_intervalo = 0
+        truncado = False
         
-        # Verificar que la derivada no sea cero en x0
-        try:
-            dfx0 = self._evaluar_funcion(funcion_df, x0)
-            if abs(dfx0) < 1e-12:
-                iteraciones.append(IteracionData(
-                    iteracion=0,
-                    valores={
-                        "xi": x0,
-                        "fxi": self._evaluar_funcion(funcion_f, x0),
-                        "dfxi": dfx0,
-                        "error_absoluto": "",
-                        "error_relativo": ""
-                    },
-                    observacion="Derivada casi nula en el punto inicial"
-                ))
-                ayuda_newton = (
-                    "Seleccione un valor inicial donde la derivada no sea cero y la función sea suave. "
-                    "Revise las derivadas simbólicas para confirmar la elección."
-                )
-                return self._construir_respuesta_metodo(
-                    exito=False,
-                    resultado=None,
-                    iteraciones=iteraciones,
-                    mensaje=f"Error: f'({x0}) ≈ 0. El método no converge con este valor inicial.",
-                    funcion=funcion_f,
-                    claves_grafica=["xi"],
-                    titulo_grafica="Método de Newton-Raphson",
-                    ayuda=ayuda_newton,
-                )
-        except Exception as e:
-            ayuda_newton = (
-                "Verifique la sintaxis de la derivada f'(x). Recuerde usar la variable x y operadores como ** para potencias."
-            )
-            return self._construir_respuesta_metodo(
-                exito=False,
-                resultado=None,
-                iteraciones=[],
-                mensaje=f"Error evaluando la derivada en x0: {str(e)}",
-                funcion=funcion_f,
-                claves_grafica=None,
-                titulo_grafica="Método de Newton-Raphson",
-                ayuda=ayuda_newton,
+        bloque = BLOQUE_ADAPTATIVO_MINIMO if adaptativo else BLOQUE_VECTORIAL
+        k = 0
+        while k < niter and not truncado:
+            pasos = min(bloque, niter - k)
+            if adaptativo:
+                cotas_intervalo += 1
+                if self._region_sin_raices(funcion, x0 + k * delta, x0 + (k + pasos) * delta):
+                    k += pasos
+                    pasos_descartados += pasos
+                    bloque *= 2
+                    continue
+                if pasos > BLOQUE_ADAPTATIVO_MINIMO:
+                    bloque = max(BLOQUE_ADAPTATIVO_MINIMO, pasos // 2)
+                    continue
+            
+            indices = np.arange(k, k + pasos + 1)
+            xs = x0 + indices * delta
+            ys = compilada.evaluar_vector(xs)
+            evaluaciones += len(xs)
+            # Cambios de signo entre puntos consecutivos y ceros exactos, en orden de x
+            candidatos = sorted(
+                [(i, "cambio") for i in np.flatnonzero(ys[:-1] * ys[1:] < 0)]
+                + [(i, "raiz") for i in np.flatnonzero(ys == 0)]
             )
+            for i, tipo in candidatos:
+                if tipo == "raiz":
+                    # El último punto de un bloque es el primero del siguiente
+                    if raices_exactas and raices_exactas[-1]["x"] == xs[i]:
+                        continue
+                    hallazgo = {"paso": int(indices[i]), "tipo": tipo, "xi": float(xs[i]), "xs": float(xs[i]),
+                                "fi": 0.0, "fs": 0.0}
+                    raices_exactas.append({"x": float(xs[i])})
+                else:
+                    hallazgo = {"paso": int(indices[i]) + 1, "tipo": tipo, "xi": float(xs[i]), "xs": float(xs[i + 1]),
+                                "fi": float(ys[i]), "fs": float(ys[i + 1])}
+                    intervalos.append(hallazgo)
+                hallazgos.append(hallazgo)
+                if len(hallazgos) >= MAX_INTERVALOS_BUSQUEDA:
+                    truncado = True
+                    break
+            k += pasos
         
-        # Variables para el algoritmo
-        xi_anterior = None
+        return {
+            "hallazgos": hallazgos,
+            "intervalos": intervalos,
+            "raices_exactas": [r["x"] for r in raices_exactas],
+            "truncado": truncado,
+            "adaptativo": adaptativo,
+            "pasos_descartados": pasos_descartados,
+            "cotas_intervalo": cotas_intervalo,
+            "nfev": evaluaciones,
+        }
+    
+    def _buscar_todos_los_cambios(self, x0: float, delta: float, niter: int,
+                                  funcion: str, adaptativo: bool) -> Dict[str, Any]:
+        """Búsqueda incremental que registra todos los cambios de signo de la malla"""
+        x_fin = x0 + niter * delta
+        escaneo = self._escanear_malla(x0, delta, niter, funcion, adaptativo)
+        iteraciones = [IteracionData(
+            iteracion=0,
+            valores={"x0": x0, "x1": x_fin, "f0": "", "f1": "", "producto": "",
+                     "error_absoluto": "", "error_relativo": ""},
+            observacion=f"Rango de búsqueda ({niter + 1} puntos de malla)"
+        )]
+        for hallazgo in escaneo["hallazgos"]:
+            iteraciones.append(IteracionData(
+                iteracion=hallazgo["paso"],
+                valores={
+                    "x0": hallazgo["xi"],
+                    "x1": hallazgo["xs"],
+                    "f0": hallazgo["fi"],
+                    "f1": hallazgo["fs"],
+                    "producto": hallazgo["fi"] * hallazgo["fs"],
+                    "error_absoluto": "",
+                    "error_relativo": ""
+                },
+                observacion="Raíz exacta" if hallazgo["tipo"] == "raiz" else "Cambio de signo"
+            ))
         
-        ayuda_newton = (
-            "Asegúrese de que f(x) y f'(x) estén correctamente definidas. "
-            "El método requiere un punto inicial cercano a la raíz y derivadas bien calculadas."
-        )
-
-        for i in range(niter + 1):
+        intervalos = [[h["xi"], h["xs"]] for h in escaneo["intervalos"]]
+        raices_exactas = escaneo["raices_exactas"]
+        if escaneo["hallazgos"]:
+            primero = escaneo["hallazgos"][0]
+            resultado = (primero["xi"] + primero["xs"]) / 2
+            mensaje = (
+                f"Se encontraron {len(intervalos)} intervalos con cambio de signo y "
+                f"{len(raices_exactas)} raíces exactas en [{x0}, {x_fin}]"
+            )
+            if escaneo["truncado"]:
+                mensaje += f" (búsqueda detenida al llegar a {MAX_INTERVALOS_BUSQUEDA} resultados)"
+        else:
+            resultado = None
+            mensaje = f"No hay cambios de signo de f(x) en la malla de [{x0}, {x_fin}]"
+            
+        return self._construir_respuesta_metodo(
+            exito=bool(escaneo["hallazgos"]),
+            resultado=resultado,
+            iteraciones=iteraciones,
+            mensaje=mensaje,
+            funcion=funcion,
+            claves_grafica=["x0", "x1"],
+            titulo_grafica="Búsqueda Incremental",
+            ayuda=(
+                "Cada intervalo con cambio de signo puede refinarse con Bisección o Regla Falsa. "
+                "Un delta más pequeño separa raíces cercanas; los polos también producen cambios de signo."
+            ),
+            resumen={
+                "intervalos": intervalos,
+                "raices_exactas": raices_exactas,
+                "truncado": escaneo["truncado"],
+                "adaptativo": adaptativo,
+                "pasos_descartados": escaneo["pasos_descartados"],
+                "cotas_intervalo": escaneo["cotas_intervalo"],
+                "nfev": escaneo["nfev"],
+            },
+        )
+    
+    # --- Todas las raíces de un intervalo: escaneo, refinamiento en paralelo y resumen ---
+    
+    def escanear_cambios_signo(self, xi: float, xs: float, subintervalos: int, funcion: str,
+                               adaptativo: bool = True) -> Dict[str, Any]:
+        """Primera etapa de todas_las_raices: intervalos con cambio de signo de [xi, xs]"""
+        if not xi < xs:
+            raise ValueError("El extremo izquierdo xi debe ser menor que xs")
+        return self._escanear_malla(xi, (xs - xi) / subintervalos, subintervalos, funcion, adaptativo)
+    
+    def refinar_intervalos(self, intervalos: List[Dict[str, float]], tolerancia: float, niter: int,
+                           funcion: str) -> List[Dict[str, Any]]:
+        """
+        Segunda etapa de todas_las_raices: aplica Brent a cada intervalo con cambio
+        de signo. Los routers reparten los intervalos entre varios trabajadores.
+        """
+        refinados = []
+        for intervalo in intervalos:
+            f = self._funcion_memorizada(funcion)
+            raiz, f_raiz, convergio = self._nucleo_brent(f, intervalo["xi"], intervalo["xs"], tolerancia, niter)
+            refinados.append({**intervalo, "raiz": raiz, "f_raiz": f_raiz, "convergio": convergio, "nfev": f.nfev})
+        return refinados
+    
+    def resumir_todas_las_raices(self, xi: float, xs: float, funcion: str, tolerancia: float,
+                                 escaneo: Dict[str, Any], refinados: List[Dict[str, Any]],
+                                 tareas: int = 1) -> Dict[str, Any]:
+        """
+        Última etapa de todas_las_raices: descarta polos y raíces duplicadas y
+        arma la respuesta con la tabla y el gráfico de todas las raíces.
+        """
+        candidatos = [
+            {"xi": x, "xs": x, "fi": 0.0, "fs": 0.0, "raiz": x, "f_raiz": 0.0, "convergio": True, "nfev": 0}
+            for x in escaneo["raices_exactas"]
+        ] + list(refinados)
+        candidatos.sort(key=lambda candidato: candidato["raiz"])
+        
+        iteraciones = []
+        raices: List[float] = []
+        polos = duplicadas = 0
+        for candidato in candidatos:
+            raiz, f_raiz = candidato["raiz"], candidato["f_raiz"]
+            if not candidato["convergio"]:
+                observacion = "Brent no convergió en el intervalo"
+            elif abs(f_raiz) > max(abs(candidato["fi"]), abs(candidato["fs"])):
+                # |f| crece hacia el "cero": el cambio de signo es una discontinuidad
+                observacion = "Discontinuidad (polo): descartada"
+                polos += 1
+            elif raices and abs(raiz - raices[-1]) <= 2 * tolerancia + 4 * np.finfo(float).eps * abs(raiz):
+                observacion = "Duplicada: descartada"
+                duplicadas += 1
+            else:
+                raices.append(raiz)
+                observacion = "Raíz exacta en la malla" if candidato["xi"] == candidato["xs"] else "Refinada con Brent"
+            iteraciones.append(IteracionData(
+                iteracion=len(iteraciones) + 1,
+                valores={
+                    "xi": candidato["xi"],
+                    "xs": candidato["xs"],
+                    "raiz": raiz,
+                    "f_raiz": f_raiz,
+                    "nfev": candidato["nfev"],
+                },
+                observacion=observacion
+            ))
+        
+        if raices:
+            mensaje = f"Se encontraron {len(raices)} raíces de f(x) en [{xi}, {xs}]"
+            if escaneo["truncado"]:
+                mensaje += f" (escaneo detenido al llegar a {MAX_INTERVALOS_BUSQUEDA} intervalos)"
+        else:
+            mensaje = f"No se encontraron raíces de f(x) en [{xi}, {xs}]"
+        
+        nfev_refinamiento = sum(candidato["nfev"] for candidato in refinados)
+        return self._construir_respuesta_metodo(
+            exito=bool(raices),
+            resultado=raices[0] if raices else None,
+            iteraciones=iteraciones,
+            mensaje=mensaje,
+            funcion=funcion,
+            claves_grafica=["xi", "xs", "raiz"],
+            titulo_grafica="Todas las raíces",
+            ayuda=(
+                "Solo se detectan raíces donde f(x) cambia de signo entre dos puntos de la malla. "
+                "Aumente los subintervalos si sospecha raíces muy cercanas o de multiplicidad par."
+            ),
+            resumen={
+                "raices": raices,
+                "intervalos_refinados": len(refinados),
+                "polos_descartados": polos,
+                "duplicadas_descartadas": duplicadas,
+                "tareas_paralelas": tareas,
+                "nfev_escaneo": escaneo["nfev"],
+                "nfev_refinamiento": nfev_refinamiento,
+                "nfev": escaneo["nfev"] + nfev_refinamiento,
+                "pasos_descartados": escaneo["pasos_descartados"],
+            },
+            otras_raices=raices[1:],
+        )
+    
+    def raices_polinomio(self, funcion: str, tolerancia: float = 1e-12, niter: int = 50) -> Dict[str, Any]:
+        """
+        Calcula todas las raíces (reales y complejas) de un polinomio.
+
+        Las raíces son los valores propios de la matriz compañera, pulidos con
+        Newton; ``niter`` limita los pasos de Newton por raíz. Lanza ValueError
+        si la función no es un polinomio en x.
+        """
+        expresion = compilar_expresion(funcion)
+        if expresion.coeficientes is None:
+            raise ValueError(
+                f"La función '{expresion.fuente}' no es un polinomio en x de grado a lo sumo {GRADO_MAXIMO}"
+            )
+        coeficientes = expresion.coeficientes
+        grado = len(coeficientes) - 1
+        raices = calcular_raices(coeficientes, tolerancia, niter)
+        
+        iteraciones = []
+        for i, raiz in enumerate(raices, start=1):
+            iteraciones.append(IteracionData(
+                iteracion=i,
+                valores={
+                    "real": raiz["raiz"].real,
+                    "imaginaria": raiz["raiz"].imag,
+                    "residuo": raiz["residuo"],
+                    "pasos_newton": raiz["pasos_newton"],
+                },
+                observacion="Raíz real" if raiz["real"] else "Raíz compleja"
+            ))
+        
+        reales = [raiz["raiz"].real for raiz in raices if raiz["real"]]
+        complejas = [[raiz["raiz"].real, raiz["raiz"].imag] for raiz in raices if not raiz["real"]]
+        return self._construir_respuesta_metodo(
+            exito=True,
+            resultado=reales[0] if reales else None,
+            iteraciones=iteraciones,
+            mensaje=(
+                f"El polinomio de grado {grado} tiene {len(reales)} raíces reales "
+                f"y {len(complejas)} complejas (contadas con multiplicidad)"
+            ),
+            funcion=funcion,
+            claves_grafica=["real"],
+            titulo_grafica="Raíces del polinomio",
+            ayuda=(
+                "Solo se aceptan polinomios en x con exponentes enteros no negativos. "
+                "Las raíces múltiples se obtienen con menos precisión que las simples."
+            ),
+            resumen={
+                "grado": grado,
+                "coeficientes": coeficientes.tolist(),
+                "raices_reales": reales,
+                "raices_complejas": complejas,
+                "evaluacion_horner": expresion.usa_horner,
+            },
+            otras_raices=reales[1:],
+        )
+    
+    def newton_raphson(self, x0: float, tolerancia: float, niter: int, 
+                      funcion_f: str, funcion_df: str | None = None, incluir_error: bool = True,
+                      tipo_error: str = "absoluto", tipo_precision: str = "decimales", precision: int = 6) -> Dict[str, Any]:
+        """
+        Implementa el método de Newton-Raphson según el procedimiento de las imágenes.
+
+        Si no se envía ``funcion_df`` se usa la derivada simbólica de ``funcion_f``.
+        """
+        iteraciones = []
+        
+        funcion_df, df_automatica = self._resolver_derivada(funcion_f, funcion_df)
+        resumen = {"funcion_df": funcion_df, "derivada_automatica": df_automatica}
+        convergencia = MonitorConvergencia(tolerancia, niter, orden=2.0)
+        resumen["convergencia"] = convergencia.estado
+        evaluar_f_df = self._evaluador_con_derivadas(funcion_f, [funcion_df], df_automatica)
+        
+        xi = x0
+        
+        # Verificar que la derivada no sea cero en x0
+        try:
+            fx0, dfx0 = evaluar_f_df(x0)
+            if abs(dfx0) < 1e-12:
+                iteraciones.append(IteracionData(
+                    iteracion=0,
+                    valores={
+                        "xi": x0,
+                        "fxi": fx0,
+                        "dfxi": dfx0,
+                        "error_absoluto": "",
+                        "error_relativo": ""
+                    },
+                    observacion="Derivada casi nula en el punto inicial"
+                ))
+                ayuda_newton = (
+                    "Seleccione un valor inicial donde la derivada no sea cero y la función sea suave. "
+                    "Revise las derivadas simbólicas para confirmar la elección."
+                )
+                return self._construir_respuesta_metodo(
+                    exito=False,
+                    resultado=None,
+                    iteraciones=iteraciones,
+                    mensaje=f"Error: f'({x0}) ≈ 0. El método no converge con este valor inicial.",
+                    funcion=funcion_f,
+                    claves_grafica=["xi"],
+                    titulo_grafica="Método de Newton-Raphson",
+                    ayuda=ayuda_newton,
+                    resumen=resumen,
+                    evaluaciones=evaluar_f_df,
+                )
+        except (LimiteExcedidoError, MemoryError):
+            raise
+        except Exception as e:
+            ayuda_newton = (
+                "Verifique la sintaxis de la derivada f'(x). Recuerde usar la variable x y operadores como ** para potencias."
+            )
+            return self._construir_respuesta_metodo(
+                exito=False,
+                resultado=None,
+                iteraciones=[],
+                mensaje=f"Error evaluando la derivada en x0: {str(e)}",
+                funcion=funcion_f,
+                claves_grafica=None,
+                titulo_grafica="Método de Newton-Raphson",
+                ayuda=ayuda_newton,
+                resumen=resumen,
+                evaluaciones=evaluar_f_df,
+            )
+        
+        # Variables para el algoritmo
+        xi_anterior = None
+        
+        ayuda_newton = (
+            "Asegúrese de que f(x) y f'(x) estén correctamente definidas. "
+            "El método requiere un punto inicial cercano a la raíz y derivadas bien calculadas."
+        )
+
+        for i in range(niter + 1):
             try:
                 # PASO 1: Evaluar f(xi) y f'(xi)
-                fxi = self._evaluar_funcion(funcion_f, xi)
-                dfxi = self._evaluar_funcion(funcion_df, xi)
+                fxi, dfxi = evaluar_f_df(xi)
 
                 # Preparar valores para la iteración
                 valores = {
@@ -831,6 +1737,8 @@ class EcuacionesService:
                         claves_grafica=["xi"],
                         titulo_grafica="Método de Newton-Raphson",
                         ayuda=ayuda_newton,
+                        resumen=resumen,
+                        evaluaciones=evaluar_f_df,
                     )
                 
                 # PASO 3: Calcular error si no es la primera iteración
@@ -863,6 +1771,8 @@ class EcuacionesService:
                         claves_grafica=["xi"],
                         titulo_grafica="Método de Newton-Raphson",
                         ayuda=ayuda_newton,
+                        resumen=resumen,
+                        evaluaciones=evaluar_f_df,
                     )
                 
                 # Verificar convergencia por error
@@ -882,6 +1792,8 @@ class EcuacionesService:
                         claves_grafica=["xi"],
                         titulo_grafica="Método de Newton-Raphson",
                         ayuda=ayuda_newton,
+                        resumen=resumen,
+                        evaluaciones=evaluar_f_df,
                     )
                 
                 # Agregar iteración actual
@@ -891,12 +1803,28 @@ class EcuacionesService:
                     error=error,
                     observacion="Newton-Raphson"
                 ))
+                detencion = convergencia.registrar(error, i)
+                if detencion is not None:
+                    return self._construir_respuesta_metodo(
+                        exito=False,
+                        resultado=xi,
+                        iteraciones=iteraciones,
+                        mensaje=f"Detención temprana en la iteración {i}: {detencion}",
+                        funcion=funcion_f,
+                        claves_grafica=["xi"],
+                        titulo_grafica="Método de Newton-Raphson",
+                        ayuda=ayuda_newton,
+                        resumen=resumen,
+                        evaluaciones=evaluar_f_df,
+                    )
                 
                 # PASO 2: Calcular la siguiente aproximación (si no es la última iteración)
                 if i < niter:
                     xi_anterior = xi
                     xi = xi - fxi / dfxi
                 
+            except (LimiteExcedidoError, MemoryError):
+                raise
             except Exception as e:
                 return self._construir_respuesta_metodo(
                     exito=False,
@@ -907,6 +1835,8 @@ class EcuacionesService:
                     claves_grafica=["xi"],
                     titulo_grafica="Método de Newton-Raphson",
                     ayuda=ayuda_newton,
+                    resumen=resumen,
+                    evaluaciones=evaluar_f_df,
                 )
         
         # Si llegamos aquí, se alcanzó el límite de iteraciones
@@ -919,6 +1849,8 @@ class EcuacionesService:
             claves_grafica=["xi"],
             titulo_grafica="Método de Newton-Raphson",
             ayuda=ayuda_newton,
+            resumen=resumen,
+            evaluaciones=evaluar_f_df,
         )
     
     def secante(self, x0: float, x1: float, tolerancia: float, niter: int, 
@@ -939,6 +1871,7 @@ class EcuacionesService:
             precision: Número de decimales o cifras significativas
         """
         iteraciones = []
+        f = self._funcion_memorizada(funcion)
         
         # Verificar que los valores iniciales sean diferentes
         ayuda_secante = (
@@ -956,6 +1889,7 @@ class EcuacionesService:
                 claves_grafica=None,
                 titulo_grafica="Método de la Secante",
                 ayuda=ayuda_secante,
+                evaluaciones=f,
             )
         
         # Variables para el algoritmo
@@ -964,8 +1898,10 @@ class EcuacionesService:
         
         # Evaluaciones iniciales
         try:
-            fxi_anterior = self._evaluar_funcion(funcion, xi_anterior)
-            fxi = self._evaluar_funcion(funcion, xi)
+            fxi_anterior = f(xi_anterior)
+            fxi = f(xi)
+        except (LimiteExcedidoError, MemoryError):
+            raise
         except Exception as e:
             return self._construir_respuesta_metodo(
                 exito=False,
@@ -976,8 +1912,12 @@ class EcuacionesService:
                 claves_grafica=None,
                 titulo_grafica="Método de la Secante",
                 ayuda=ayuda_secante,
+                evaluaciones=f,
             )
         
+        convergencia = MonitorConvergencia(tolerancia, niter, orden=1.618)
+        resumen = {"convergencia": convergencia.estado}
+        
         # Orden de columnas para la tabla
         orden_columnas = ["Iteración", "x(i-1)", "x(i)", "f(x(i-1))", "f(x(i))", "Error Absoluto", "Error Relativo", "Observación"]
         
@@ -1040,6 +1980,8 @@ class EcuacionesService:
                         claves_grafica=["xi", "xi_anterior"],
                         titulo_grafica="Método de la Secante",
                         ayuda=ayuda_secante,
+                        resumen=resumen,
+                        evaluaciones=f,
                     )
                     respuesta["tabla_html"] = tabla_html
                     return respuesta
@@ -1069,6 +2011,8 @@ class EcuacionesService:
                         claves_grafica=["xi", "xi_anterior"],
                         titulo_grafica="Método de la Secante",
                         ayuda=ayuda_secante,
+                        resumen=resumen,
+                        evaluaciones=f,
                     )
                     respuesta["tabla_html"] = tabla_html
                     return respuesta
@@ -1099,6 +2043,8 @@ class EcuacionesService:
                         claves_grafica=["xi", "xi_anterior"],
                         titulo_grafica="Método de la Secante",
                         ayuda=ayuda_secante,
+                        resumen=resumen,
+                        evaluaciones=f,
                     )
                     respuesta["tabla_html"] = tabla_html
                     return respuesta
@@ -1111,6 +2057,27 @@ class EcuacionesService:
                     observacion="Secante"
                 ))
                 
+                detencion = convergencia.registrar(error, i)
+                if detencion is not None:
+                    respuesta = self._construir_respuesta_metodo(
+                        exito=False,
+                        resultado=xi,
+                        iteraciones=iteraciones,
+                        mensaje=f"Detención temprana en la iteración {i}: {detencion}",
+                        funcion=funcion,
+                        claves_grafica=["xi", "xi_anterior"],
+                        titulo_grafica="Método de la Secante",
+                        ayuda=ayuda_secante,
+                        resumen=resumen,
+                        evaluaciones=f,
+                    )
+                    respuesta["tabla_html"] = self._iteraciones_a_tabla_html(
+                        iteraciones,
+                        orden_columnas=orden_columnas,
+                        nombre_columnas=nombre_columnas
+                    )
+                    return respuesta
+                
                 # Calcular la siguiente aproximación (si no es la última iteración)
                 if i < niter:
                     xi_nuevo = xi - fxi * (xi - xi_anterior) / denominador
@@ -1119,8 +2086,10 @@ class EcuacionesService:
                     xi_anterior = xi
                     xi = xi_nuevo
                     fxi_anterior = fxi
-                    fxi = self._evaluar_funcion(funcion, xi)
+                    fxi = f(xi)
                 
+            except (LimiteExcedidoError, MemoryError):
+                raise
             except Exception as e:
                 # Generar tabla HTML con nombres de columnas
                 tabla_html = self._iteraciones_a_tabla_html(
@@ -1138,6 +2107,8 @@ class EcuacionesService:
                     claves_grafica=["xi", "xi_anterior"],
                     titulo_grafica="Método de la Secante",
                     ayuda=ayuda_secante,
+                    resumen=resumen,
+                    evaluaciones=f,
                 )
                 if tabla_html:
                     respuesta["tabla_html"] = tabla_html
@@ -1160,10 +2131,978 @@ class EcuacionesService:
             claves_grafica=["xi", "xi_anterior"],
             titulo_grafica="Método de la Secante",
             ayuda=ayuda_secante,
+            resumen=resumen,
+            evaluaciones=f,
         )
         respuesta["tabla_html"] = tabla_html
         return respuesta
     
+    def muller(self, x0: float, x1: float, x2: float, tolerancia: float, niter: int,
+               funcion: str, tipo_error: str = "absoluto") -> Dict[str, Any]:
+        """
+        Implementa el método de Muller en aritmética compleja.
+
+        Cada paso ajusta una parábola por los tres últimos puntos y toma la raíz
+        de la parábola más cercana al último; cuando el discriminante es negativo
+        la iteración pasa al plano complejo, de modo que encuentra también raíces
+        complejas sin usar derivadas (orden de convergencia ≈ 1.84).
+        """
+        iteraciones = []
+        expresion = compilar_expresion(funcion)
+        nfev = 0
+        convergencia = MonitorConvergencia(tolerancia, niter, orden=1.84)
+        
+        ayuda_muller = (
+            "Elija tres valores iniciales distintos cerca de la raíz buscada. "
+            "Con valores reales el método puede converger a una raíz compleja."
+        )
+        
+        def f(x: complex) -> complex:
+            nonlocal nfev
+            nfev += 1
+            try:
+                valor = expresion.evaluar_complejo(x)
+            except ExpresionInvalidaError:
+                raise
+            except (LimiteExcedidoError, MemoryError):
+                raise
+            except Exception as e:
+                raise ValueError(f"Error evaluando función '{expresion.fuente}' en x={x}: {str(e)}")
+            if not cmath.isfinite(valor):
+                raise ValueError(f"La función no es finita en x={x}")
+            return valor
+        
+        def registrar(i, x, fx, dx, observacion):
+            error = None
+            valores = {"xi_real": x.real, "xi_imag": x.imag, "fxi_abs": abs(fx),
+                       "error_absoluto": "", "error_relativo": ""}
+            if dx is not None:
+                valores["error_absoluto"] = abs(dx)
+                valores["error_relativo"] = abs(dx) / abs(x) if abs(x) > 1e-12 else abs(dx)
+                error = valores["error_relativo"] if tipo_error == "relativo" else valores["error_absoluto"]
+            iteraciones.append(IteracionData(iteracion=i, valores=valores, error=error, observacion=observacion))
+            return error
+        
+        def responder(exito: bool, x: complex | None, mensaje: str) -> Dict[str, Any]:
+            real = x is not None and abs(x.imag) <= tolerancia * max(1.0, abs(x))
+            return self._construir_respuesta_metodo(
+                exito=exito,
+                resultado=x.real if real else None,
+                iteraciones=iteraciones,
+                mensaje=mensaje,
+                funcion=funcion,
+                claves_grafica=["xi_real"],
+                titulo_grafica="Método de Muller",
+                ayuda=ayuda_muller,
+                resumen={
+                    "raiz": None if x is None else [x.real, 0.0 if real else x.imag],
+                    "raiz_real": real,
+                    "nfev": nfev,
+                    "convergencia": convergencia.estado,
+                },
+            )
+        
+        puntos = [complex(x0), complex(x1), complex(x2)]
+        if min(abs(puntos[0] - puntos[1]), abs(puntos[1] - puntos[2]), abs(puntos[0] - puntos[2])) < 1e-12:
+            return responder(False, None, "Error: Los valores iniciales x0, x1 y x2 deben ser distintos.")
+        try:
+            valores_f = [f(x) for x in puntos]
+        except (LimiteExcedidoError, MemoryError):
+            raise
+        except Exception as e:
+            return responder(False, None, f"Error evaluando función en valores iniciales: {str(e)}")
+        
+        for i, (x, fx) in enumerate(zip(puntos, valores_f)):
+            registrar(i, x, fx, None, "Valor inicial")
+        x0, x1, x2 = puntos
+        f0, f1, f2 = valores_f
+        if f2 == 0:
+            return responder(True, x2, f"{x2.real if x2.imag == 0 else x2} es raíz de f(x)")
+        
+        for i in range(3, niter + 3):
+            try:
+                h1, h2 = x1 - x0, x2 - x1
+                d1, d2 = (f1 - f0) / h1, (f2 - f1) / h2
+                a = (d2 - d1) / (h2 + h1)
+                b = a * h2 + d2
+                discriminante = cmath.sqrt(b * b - 4 * a * f2)
+                # Se elige el signo que da el denominador de mayor módulo (paso más corto)
+                denominador = b + discriminante if abs(b + discriminante) >= abs(b - discriminante) else b - discriminante
+                if denominador == 0:
+                    registrar(i, x2, f2, None, "Error: parábola degenerada")
+                    return responder(False, x2, f"Error: la parábola es degenerada en la iteración {i - 2}.")
+                dx = -2 * f2 / denominador
+                x0, x1, x2 = x1, x2, x2 + dx
+                f0, f1, f2 = f1, f2, f(x2)
+            except (LimiteExcedidoError, MemoryError):
+                raise
+            except Exception as e:
+                return responder(False, x2, f"Error en iteración {i - 2}: {str(e)}")
+            
+            error = registrar(i, x2, f2, dx, "Muller" if x2.imag == 0 else "Muller (complejo)")
+            if f2 == 0 or error <= tolerancia:
+                raiz = x2.real if abs(x2.imag) <= tolerancia * max(1.0, abs(x2)) else x2
+                return responder(
+                    True, x2,
+                    f"{raiz} es una aproximación de una raíz de f(x) con tolerancia {tolerancia} "
+                    f"en {i - 2} iteraciones"
+                )
+            detencion = convergencia.registrar(error, i - 2)
+            if detencion is not None:
+                return responder(False, x2, f"Detención temprana en la iteración {i - 2}: {detencion}")
+        
+        return responder(False, x2, f"Fracaso en {niter} iteraciones. Última aproximación: {x2}")
+    
+    # --- Arranques múltiples vectorizados -------------------------------------------------
+    
+    @staticmethod
+    def _valores_iniciales(*valores: float | List[float]) -> tuple[np.ndarray, ...]:
+        arreglos = [np.atleast_1d(np.asarray(v, dtype=float)) for v in valores]
+        try:
+            arreglos = np.broadcast_arrays(*arreglos)
+        except ValueError:
+            raise ValueError("Las listas de valores iniciales deben tener la misma longitud")
+        if arreglos[0].size == 0:
+            raise ValueError("Debe indicar al menos un valor inicial")
+        if arreglos[0].size > MAX_ARRANQUES:
+            raise ValueError(f"Se admiten como máximo {MAX_ARRANQUES} valores iniciales por solicitud")
+        if not all(np.all(np.isfinite(a)) for a in arreglos):
+            raise ValueError("Los valores iniciales deben ser números finitos")
+        return tuple(np.array(a, dtype=float) for a in arreglos)
+    
+    @staticmethod
+    def _error_vectorial(x: np.ndarray, x_anterior: np.ndarray, tipo_error: str) -> np.ndarray:
+        """Versión vectorial de _calcular_error"""
+        error = np.abs(x - x_anterior)
+        if tipo_error == "relativo":
+            grandes = np.abs(x) >= 1e-12
+            error[grandes] /= np.abs(x[grandes])
+        return error
+    
+    def _respuesta_arranques_multiples(self, metodo: str, x0: np.ndarray, raices: np.ndarray,
+                                       pasos: np.ndarray, estados: np.ndarray, tolerancia: float,
+                                       nfev: int, resumen: Dict[str, Any] | None = None) -> Dict[str, Any]:
+        """
+        Respuesta compacta de un lote de arranques: una fila por raíz distinta en
+        la tabla y, en el resumen, listas paralelas con la raíz, las iteraciones y
+        el código de estado de cada valor inicial (ver ``leyenda_estados``).
+        """
+        convergidos = estados == _CONVERGIO
+        distintas: List[Dict[str, Any]] = []
+        for indice in np.argsort(raices, kind="stable"):
+            if not convergidos[indice]:
+                continue
+            raiz = raices[indice]
+            if distintas and abs(raiz - distintas[-1]["raiz"]) <= 10 * tolerancia * max(1.0, abs(raiz)):
+                grupo = distintas[-1]
+            else:
+                grupo = {"raiz": float(raiz), "arranques": 0, "pasos": 0}
+                distintas.append(grupo)
+            grupo["arranques"] += 1
+            grupo["pasos"] += int(pasos[indice])
+        
+        iteraciones = [
+            IteracionData(
+                iteracion=i,
+                valores={
+                    "raiz": grupo["raiz"],
+                    "arranques": grupo["arranques"],
+                    "iteraciones_promedio": grupo["pasos"] / grupo["arranques"],
+                },
+                observacion=f"{grupo['arranques']} de {len(x0)} arranques"
+            )
+            for i, grupo in enumerate(distintas, start=1)
+        ]
+        conteo = {nombre: int(np.count_nonzero(estados == codigo)) for codigo, nombre in enumerate(ESTADOS_ARRANQUE)}
+        primero = np.flatnonzero(convergidos)
+        return self._construir_respuesta_metodo(
+            exito=bool(len(primero)),
+            resultado=float(raices[primero[0]]) if len(primero) else None,
+            iteraciones=iteraciones,
+            mensaje=(
+                f"{metodo}: {conteo['convergio']} de {len(x0)} arranques convergieron "
+                f"a {len(distintas)} raíces distintas"
+            ),
+            resumen={
+                **(resumen or {}),
+                "x0": x0.tolist(),
+                "raices": [float(r) if ok else None for r, ok in zip(raices, convergidos)],
+                "iteraciones": pasos.tolist(),
+                "estados": estados.tolist(),
+                "leyenda_estados": list(ESTADOS_ARRANQUE),
+                "conteo_estados": conteo,
+                "raices_distintas": [grupo["raiz"] for grupo in distintas],
+                "nfev": nfev,
+            },
+        )
+    
+    def newton_raphson_multiple(self, x0: List[float], tolerancia: float, niter: int,
+                                funcion_f: str, funcion_df: str | None = None, incluir_error: bool = True,
+                                tipo_error: str = "absoluto") -> Dict[str, Any]:
+        """
+        Newton-Raphson desde muchos valores iniciales a la vez.
+
+        Todos los arranques avanzan juntos como una sola operación de NumPy; una
+        máscara deja de actualizar los que ya terminaron. Los criterios de parada
+        son los de ``newton_raphson``.
+        """
+        (x,) = self._valores_iniciales(x0)
+        inicial = x.copy()
+        funcion_df, df_automatica = self._resolver_derivada(funcion_f, funcion_df)
+        conjunto = compilar_conjunto([funcion_f, funcion_df])
+        
+        estados = np.full(len(x), _NO_CONVERGIO, dtype=np.int8)
+        pasos = np.zeros(len(x), dtype=np.int32)
+        error = np.full(len(x), np.inf)
+        activos = np.arange(len(x))
+        nfev = 0
+        for i in range(niter + 1):
+            if len(activos) == 0:
+                break
+            fx, dfx = conjunto.evaluar_vector(x[activos])
+            nfev += len(activos)
+            pasos[activos] = i
+            
+            terminados = np.full(len(activos), _NO_CONVERGIO, dtype=np.int8)
+            convergido = np.abs(fx) <= tolerancia
+            if incluir_error and i > 0:
+                convergido |= error[activos] <= tolerancia
+            terminados[np.abs(dfx) < 1e-12] = _DERIVADA_NULA
+            terminados[convergido & (terminados == _NO_CONVERGIO)] = _CONVERGIO
+            terminados[np.isnan(fx) | np.isnan(dfx)] = _FUERA_DE_DOMINIO
+            
+            fin = terminados != _NO_CONVERGIO
+            estados[activos[fin]] = terminados[fin]
+            activos, fx, dfx = activos[~fin], fx[~fin], dfx[~fin]
+            if i == niter:
+                break
+            
+            x_nuevo = x[activos] - fx / dfx
+            error[activos] = self._error_vectorial(x_nuevo, x[activos], tipo_error)
+            x[activos] = x_nuevo
+        
+        return self._respuesta_arranques_multiples(
+            "Newton-Raphson", inicial, x, pasos, estados, tolerancia, nfev,
+            resumen={"funcion_df": funcion_df, "derivada_automatica": df_automatica},
+        )
+    
+    def secante_multiple(self, x0: List[float], x1: float | List[float], tolerancia: float, niter: int,
+                         funcion: str, incluir_error: bool = True, tipo_error: str = "absoluto") -> Dict[str, Any]:
+        """
+        Método de la secante desde muchos pares de valores iniciales a la vez.
+
+        ``x1`` puede ser una lista de la misma longitud que ``x0`` o un solo valor
+        compartido. Los criterios de parada son los de ``secante``.
+        """
+        x_anterior, x = self._valores_iniciales(x0, x1)
+        inicial = x_anterior.copy()
+        expresion = compilar_expresion(funcion)
+        
+        estados = np.full(len(x), _NO_CONVERGIO, dtype=np.int8)
+        pasos = np.zeros(len(x), dtype=np.int32)
+        f_anterior = expresion.evaluar_vector(x_anterior)
+        fx = expresion.evaluar_vector(x)
+        nfev = 2 * len(x)
+        # Pares iniciales iguales: la secante no está definida
+        estados[np.abs(x - x_anterior) < 1e-12] = _DERIVADA_NULA
+        activos = np.flatnonzero(estados == _NO_CONVERGIO)
+        for i in range(niter + 1):
+            if len(activos) == 0:
+                break
+            if i > 0:
+                fx[activos] = expresion.evaluar_vector(x[activos])
+                nfev += len(activos)
+            pasos[activos] = i
+            f_activos = fx[activos]
+            denominador = f_activos - f_anterior[activos]
+            
+            terminados = np.full(len(activos), _NO_CONVERGIO, dtype=np.int8)
+            convergido = np.abs(f_activos) <= tolerancia
+            if incluir_error and i > 0:
+                convergido |= self._error_vectorial(x[activos], x_anterior[activos], tipo_error) <= tolerancia
+            terminados[convergido] = _CONVERGIO
+            terminados[~convergido & (np.abs(denominador) < 1e-12)] = _DERIVADA_NULA
+            terminados[np.isnan(f_activos) | np.isnan(f_anterior[activos])] = _FUERA_DE_DOMINIO
+            
+            fin = terminados != _NO_CONVERGIO
+            estados[activos[fin]] = terminados[fin]
+            activos, f_activos, denominador = activos[~fin], f_activos[~fin], denominador[~fin]
+            if i == niter:
+                break
+            
+            x_nuevo = x[activos] - f_activos * (x[activos] - x_anterior[activos]) / denominador
+            x_anterior[activos] = x[activos]
+            f_anterior[activos] = f_activos
+            x[activos] = x_nuevo
+        
+        return self._respuesta_arranques_multiples("Secante", inicial, x, pasos, estados, tolerancia, nfev)
+    
+    # --- Cuencas de atracción de Newton en el plano complejo -----------------------------
+    
+    @staticmethod
+    def _agrupar_raices_complejas(raices: np.ndarray, tolerancia: float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Agrupa raíces complejas convergidas: devuelve los centros ordenados
+        (por parte real y luego imaginaria) y, para cada raíz, el índice de su centro.
+        """
+        escala = max(100 * tolerancia, 1e-8) * max(1.0, float(np.max(np.abs(raices))))
+        claves = np.round(raices.real / escala) + 1j * np.round(raices.imag / escala)
+        _, representantes, etiquetas = np.unique(claves, return_index=True, return_inverse=True)
+        centros = raices[representantes]
+        
+        # Fusiona centros que el redondeo separó por caer en celdas vecinas
+        union = np.arange(len(centros))
+        for i in range(len(centros)):
+            cercanos = np.flatnonzero(np.abs(centros[:i] - centros[i]) <= 2 * escala)
+            if len(cercanos):
+                union[i] = union[cercanos[0]]
+        _, representantes, union = np.unique(union, return_index=True, return_inverse=True)
+        centros = centros[representantes]
+        etiquetas = union[etiquetas.ravel()]
+        
+        orden = np.lexsort((np.round(centros.imag / escala), np.round(centros.real / escala)))
+        posicion = np.empty_like(orden)
+        posicion[orden] = np.arange(len(orden))
+        return centros[orden], posicion[etiquetas]
+    
+    def _imagen_cuenca(self, mapa: np.ndarray, iteraciones: np.ndarray, raices: np.ndarray,
+                       limites: tuple[float, float, float, float], niter: int, titulo: str) -> str:
+        """PNG de la cuenca: un color por raíz, más oscuro cuantas más iteraciones tomó"""
+        if len(raices) <= 10:
+            colores = plt.get_cmap("tab10")(np.arange(10))[:, :3]
+        else:
+            colores = plt.get_cmap("hsv")(np.arange(len(raices)) / len(raices))[:, :3]
+        imagen = np.zeros(mapa.shape + (3,))
+        convergidos = mapa > 0
+        sombra = 1 - 0.7 * np.log1p(iteraciones[convergidos]) / np.log1p(max(niter, 1))
+        imagen[convergidos] = colores[mapa[convergidos].astype(np.intp) - 1] * sombra[:, None]
+        
+        re_min, re_max, im_min, im_max = limites
+        plt.figure(figsize=(6, 6 * (im_max - im_min) / (re_max - re_min) if re_max > re_min else 6))
+        plt.imshow(imagen, extent=(re_min, re_max, im_min, im_max), origin="upper",
+                   interpolation="nearest", aspect="auto")
+        if len(raices):
+            plt.scatter(raices.real, raices.imag, color="white", edgecolors="black", marker="o", s=30,
+                        zorder=5, label=f"Raíces ({len(raices)})")
+            plt.legend(loc="upper right")
+        plt.title(titulo)
+        plt.xlabel("Re(z)")
+        plt.ylabel("Im(z)")
+        
+        buffer = io.BytesIO()
+        plt.tight_layout()
+        plt.savefig(buffer, format="png", dpi=150)
+        plt.close()
+        buffer.seek(0)
+        imagen_base64 = base64.b64encode(buffer.read()).decode("utf-8")
+        return f"data:image/png;base64,{imagen_base64}"
+    
+    def cuenca_newton(self, funcion_f: str, re_min: float, re_max: float, im_min: float, im_max: float,
+                      ancho: int, alto: int, tolerancia: float, niter: int, funcion_df: str | None = None,
+                      formato: str = "ambos") -> Dict[str, Any]:
+        """
+        Cuencas de atracción de Newton sobre una malla de valores iniciales complejos.
+
+        Cada píxel de la malla ``alto`` x ``ancho`` (fila 0 en ``im_max``, columna 0
+        en ``re_min``) es un arranque; todos avanzan juntos como en
+        ``newton_raphson_multiple`` pero en aritmética compleja. Un arranque
+        converge cuando el paso de Newton es menor que ``tolerancia·max(1, |z|)``.
+
+        El resultado es un mapa por píxel con el número de la raíz alcanzada
+        (1..k, 0 si no convergió) y otro con las iteraciones empleadas, en
+        base64 (uint8 o uint16, orden C) y/o como imagen PNG según ``formato``.
+        """
+        formato = (formato or "ambos").lower()
+        if formato not in FORMATOS_CUENCA:
+            raise ValueError(f"Formato desconocido '{formato}'. Use uno de: {', '.join(FORMATOS_CUENCA)}")
+        if ancho < 1 or alto < 1:
+            raise ValueError("El ancho y el alto de la malla deben ser al menos 1")
+        if ancho * alto > MAX_PIXELES_CUENCA:
+            raise ValueError(f"La malla admite como máximo {MAX_PIXELES_CUENCA} píxeles (ancho x alto)")
+        limites = (re_min, re_max, im_min, im_max)
+        if not all(np.isfinite(limites)) or re_min >= re_max or im_min >= im_max:
+            raise ValueError("La región debe cumplir re_min < re_max e im_min < im_max con valores finitos")
+        
+        funcion_df, df_automatica = self._resolver_derivada(funcion_f, funcion_df)
+        conjunto = compilar_conjunto([funcion_f, funcion_df])
+        
+        reales = np.linspace(re_min, re_max, ancho)
+        imaginarias = np.linspace(im_max, im_min, alto)
+        z = (reales[None, :] + 1j * imaginarias[:, None]).ravel()
+        
+        estados = np.full(z.size, _NO_CONVERGIO, dtype=np.int8)
+        pasos = np.zeros(z.size, dtype=np.int32)
+        activos = np.arange(z.size)
+        nfev = 0
+        for i in range(1, niter + 1):
+            if len(activos) == 0:
+                break
+            fz, dfz = conjunto.evaluar_complejo(z[activos])
+            nfev += len(activos)
+            with np.errstate(all="ignore"):
+                paso = fz / dfz
+            
+            terminados = np.full(len(activos), _NO_CONVERGIO, dtype=np.int8)
+            terminados[fz == 0] = _CONVERGIO
+            terminados[(terminados == _NO_CONVERGIO) & (np.abs(dfz) < 1e-12)] = _DERIVADA_NULA
+            terminados[np.isnan(fz) | np.isnan(dfz)] = _FUERA_DE_DOMINIO
+            z_nuevo = z[activos] - paso
+            seguir = terminados == _NO_CONVERGIO
+            terminados[seguir & ~np.isfinite(z_nuevo)] = _FUERA_DE_DOMINIO
+            seguir = terminados == _NO_CONVERGIO
+            z[activos[seguir]] = z_nuevo[seguir]
+            pasos[activos[seguir]] = i
+            terminados[seguir & (np.abs(paso) <= tolerancia * np.maximum(1.0, np.abs(z_nuevo)))] = _CONVERGIO
+            
+            fin = terminados != _NO_CONVERGIO
+            estados[activos[fin]] = terminados[fin]
+            activos = activos[~fin]
+        
+        convergidos = estados == _CONVERGIO
+        if np.any(convergidos):
+            raices, etiquetas = self._agrupar_raices_complejas(z[convergidos], tolerancia)
+        else:
+            raices, etiquetas = np.array([], dtype=complex), np.array([], dtype=np.intp)
+        
+        mapa = np.zeros(z.size, dtype=np.uint8 if len(raices) < 255 else np.uint16)
+        mapa[convergidos] = etiquetas + 1
+        mapa = mapa.reshape(alto, ancho)
+        iteraciones_mapa = np.minimum(pasos, np.iinfo(np.uint16).max).astype(
+            np.uint8 if niter <= np.iinfo(np.uint8).max else np.uint16
+        ).reshape(alto, ancho)
+        
+        pixeles = np.bincount(mapa.ravel(), minlength=len(raices) + 1)
+        suma_pasos = np.bincount(mapa.ravel(), weights=pasos, minlength=len(raices) + 1)
+        iteraciones = [
+            IteracionData(
+                iteracion=k,
+                valores={
+                    "real": float(raiz.real),
+                    "imaginaria": float(raiz.imag),
+                    "pixeles": int(pixeles[k]),
+                    "iteraciones_promedio": float(suma_pasos[k] / pixeles[k]),
+                },
+                observacion=f"Cuenca {k}: {100 * pixeles[k] / z.size:.1f}% de la malla"
+            )
+            for k, raiz in enumerate(raices, start=1)
+        ]
+        
+        resumen = {
+            "forma": [alto, ancho],
+            "limites": {"re_min": re_min, "re_max": re_max, "im_min": im_min, "im_max": im_max},
+            "raices": [[float(r.real), float(r.imag)] for r in raices],
+            "conteo_estados": {
+                nombre: int(np.count_nonzero(estados == codigo)) for codigo, nombre in enumerate(ESTADOS_ARRANQUE)
+            },
+            "funcion_df": funcion_df,
+            "derivada_automatica": df_automatica,
+            "nfev": nfev,
+        }
+        if formato in ("arreglo", "ambos"):
+            resumen.update({
+                "leyenda_mapa": "0 = no convergió; k = raíz raices[k-1]",
+                "dtype_mapa": mapa.dtype.name,
+                "mapa": base64.b64encode(mapa.tobytes()).decode("ascii"),
+                "dtype_iteraciones": iteraciones_mapa.dtype.name,
+                "iteraciones_mapa": base64.b64encode(iteraciones_mapa.tobytes()).decode("ascii"),
+            })
+        
+        respuesta = self._construir_respuesta_metodo(
+            exito=bool(len(raices)),
+            resultado=None,
+            iteraciones=iteraciones,
+            mensaje=(
+                f"Newton: {int(np.count_nonzero(convergidos))} de {z.size} arranques complejos "
+                f"convergieron a {len(raices)} raíces distintas"
+            ),
+            ayuda=(
+                "Los mapas del resumen están en base64, en orden de filas (la fila 0 corresponde a im_max). "
+                "Los píxeles oscuros necesitaron más iteraciones."
+            ),
+            resumen=resumen,
+        )
+        if formato in ("png", "ambos"):
+            try:
+                respuesta["grafico"] = self._imagen_cuenca(
+                    mapa, iteraciones_mapa, raices, limites, niter, f"Cuencas de Newton: f(z) = {funcion_f}"
+                )
+            except (LimiteExcedidoError, MemoryError):
+                raise
+            except Exception:
+                respuesta["grafico"] = None
+        return respuesta
+    
+    # --- Métodos de orden superior (Halley y Householder) --------------------------------
+    
+    def _iterar_orden_superior(self, metodo: str, paso: Callable[..., tuple[float, float]], x0: float,
+                               tolerancia: float, niter: int, funcion_f: str, funcion_df: str | None,
+                               funcion_ddf: str | None, tipo_error: str, tercera_derivada: bool) -> Dict[str, Any]:
+        """
+        Iteración común de los métodos que usan f'' (y opcionalmente f''').
+        
+        ``paso(f, f', f''[, f'''])`` devuelve (numerador, denominador) de la
+        corrección x_{i+1} = x_i - numerador / denominador. Los criterios de
+        parada son los de ``raices_multiples``: |f(x)| <= tolerancia o error <= tolerancia.
+        """
+        iteraciones = []
+        funcion_df, df_automatica = self._resolver_derivada(funcion_f, funcion_df, 1)
+        funcion_ddf, ddf_automatica = self._resolver_derivada(funcion_f, funcion_ddf, 2)
+        derivadas = [funcion_df, funcion_ddf]
+        resumen = {
+            "funcion_df": funcion_df,
+            "funcion_ddf": funcion_ddf,
+            "derivada_automatica": df_automatica,
+            "segunda_derivada_automatica": ddf_automatica,
+        }
+        if tercera_derivada:
+            # f''' se obtiene derivando la f'' en uso (la enviada o la automática)
+            derivadas.append(derivar_expresion(funcion_ddf).fuente)
+            resumen["funcion_dddf"] = derivadas[-1]
+        convergencia = MonitorConvergencia(tolerancia, niter, orden=4.0 if tercera_derivada else 3.0)
+        resumen["convergencia"] = convergencia.estado
+        evaluar_derivadas = self._evaluador_con_derivadas(
+            funcion_f, derivadas, df_automatica and ddf_automatica
+        )
+        claves = ["f_xi", "df_xi", "ddf_xi", "dddf_xi"][:len(derivadas) + 1]
+        
+        ayuda = (
+            f"El método de {metodo} converge más rápido que Newton en raíces simples usando "
+            f"{'f′′(x) y f′′′(x)' if tercera_derivada else 'f′′(x)'}. "
+            "Si omite las derivadas se calculan simbólicamente."
+        )
+        
+        def responder(exito: bool, resultado: float | None, mensaje: str) -> Dict[str, Any]:
+            return self._construir_respuesta_metodo(
+                exito=exito,
+                resultado=resultado,
+                iteraciones=iteraciones,
+                mensaje=mensaje,
+                funcion=funcion_f,
+                claves_grafica=["xi"] if iteraciones else None,
+                titulo_grafica=f"Método de {metodo}",
+                ayuda=ayuda,
+                resumen=resumen,
+                evaluaciones=evaluar_derivadas,
+            )
+        
+        try:
+            valores = evaluar_derivadas(x0)
+        except (LimiteExcedidoError, MemoryError):
+            raise
+        except Exception as e:
+            return responder(False, None, f"No fue posible evaluar las funciones en el punto inicial X₀. {str(e)}")
+        
+        iteraciones.append(IteracionData(
+            iteracion=0,
+            valores={"xi": x0, **dict(zip(claves, valores)), "error_absoluto": "", "error_relativo": ""},
+            error=None,
+            observacion="Valores iniciales"
+        ))
+        
+        error = float("inf")
+        x_actual = x0
+        i = 0
+        while i < niter and abs(valores[0]) > tolerancia and error > tolerancia:
+            numerador, denominador = paso(*valores)
+            if abs(denominador) < 1e-12:
+                return responder(
+                    False, x_actual,
+                    f"El denominador de la corrección se anuló en la iteración {i + 1}. Pruebe otro valor inicial."
+                )
+            if numerador == 0:
+                # Con f(x) ≠ 0 la corrección nula deja el iterado fijo (en Halley, un punto crítico;
+                # en Householder también donde 2·f'^2 = f·f''): el método se estanca
+                return responder(
+                    False, x_actual,
+                    f"La corrección se anuló con f(x) ≠ 0 en la iteración {i + 1}: el método no avanza. "
+                    "Pruebe otro valor inicial."
+                )
+            x_siguiente = x_actual - numerador / denominador
+            try:
+                valores = evaluar_derivadas(x_siguiente)
+            except (LimiteExcedidoError, MemoryError):
+                raise
+            except Exception as e:
+                return responder(False, x_actual, f"No fue posible evaluar las funciones en la iteración {i + 1}. {str(e)}")
+            
+            error_absoluto = abs(x_siguiente - x_actual)
+            error_relativo = error_absoluto / abs(x_siguiente) if abs(x_siguiente) > 1e-12 else error_absoluto
+            error = self._calcular_error(x_siguiente, x_actual, tipo_error)
+            x_actual = x_siguiente
+            i += 1
+            iteraciones.append(IteracionData(
+                iteracion=i,
+                valores={
+                    "xi": x_actual,
+                    **dict(zip(claves, valores)),
+                    "error_absoluto": error_absoluto,
+                    "error_relativo": error_relativo
+                },
+                error=error,
+                observacion=f"Iteración de {metodo}"
+            ))
+            if abs(valores[0]) > tolerancia and error > tolerancia:
+                detencion = convergencia.registrar(error, i)
+                if detencion is not None:
+                    return responder(False, x_actual, f"Detención temprana en la iteración {i}: {detencion}")
+        
+        if abs(valores[0]) <= tolerancia:
+            return responder(True, x_actual, f"{x_actual:.10f} es raíz de f(x) con |f(x)| <= {tolerancia}.")
+        if error <= tolerancia:
+            return responder(True, x_actual, f"{x_actual:.10f} es una aproximación de una raíz con tolerancia {tolerancia}.")
+        return responder(False, x_actual, f"Se alcanzó el máximo de {niter} iteraciones sin cumplir la tolerancia solicitada.")
+    
+    def halley(self, x0: float, tolerancia: float, niter: int, funcion_f: str,
+               funcion_df: str | None = None, funcion_ddf: str | None = None,
+               tipo_error: str = "absoluto") -> Dict[str, Any]:
+        """
+        Implementa el método de Halley (convergencia cúbica en raíces simples).
+        
+        Fórmula: x_{n+1} = x_n - 2·f·f' / (2·f'^2 - f·f'')
+        """
+        return self._iterar_orden_superior(
+            "Halley",
+            lambda f, df, ddf: (2 * f * df, 2 * df * df - f * ddf),
+            x0, tolerancia, niter, funcion_f, funcion_df, funcion_ddf, tipo_error, tercera_derivada=False,
+        )
+    
+    def householder(self, x0: float, tolerancia: float, niter: int, funcion_f: str,
+                    funcion_df: str | None = None, funcion_ddf: str | None = None,
+                    tipo_error: str = "absoluto") -> Dict[str, Any]:
+        """
+        Implementa el método de Householder de orden 3 (convergencia de orden 4
+        en raíces simples); f''' se obtiene derivando simbólicamente f''.
+        
+        Fórmula: x_{n+1} = x_n - (6·f·f'^2 - 3·f^2·f'') / (6·f'^3 - 6·f·f'·f'' + f^2·f''')
+        """
+        return self._iterar_orden_superior(
+            "Householder",
+            lambda f, df, ddf, dddf: (
+                6 * f * df * df - 3 * f * f * ddf,
+                6 * df ** 3 - 6 * f * df * ddf + f * f * dddf,
+            ),
+            x0, tolerancia, niter, funcion_f, funcion_df, funcion_ddf, tipo_error, tercera_derivada=True,
+        )
+    
+    # --- Sistemas de ecuaciones no lineales (Newton y Broyden) --------------------------
+    
+    @staticmethod
+    def _resolver_paso_lineal(jacobiano: np.ndarray, F: np.ndarray, tipo_pivoteo: int) -> np.ndarray:
+        """Resuelve J·Δx = -F con la eliminación de Gauss del módulo de sistemas lineales"""
+        n = len(F)
+        delta, marcador = GaussPiv(jacobiano, -F, n, tipo_pivoteo)
+        if tipo_pivoteo == 2:
+            # El pivoteo total intercambia columnas: se deshace la permutación de variables
+            ordenado = np.zeros(n)
+            ordenado[marcador] = delta
+            delta = ordenado
+        return delta
+    
+    def sistema_no_lineal(self, funciones: List[str], variables: List[str], x0: List[float],
+                          tolerancia: float, niter: int, metodo: str = "newton",
+                          jacobiano: str = "automatico", tipo_pivoteo: int = 1,
+                          tipo_error: str = "absoluto") -> Dict[str, Any]:
+        """
+        Resuelve F(x) = 0 para un vector x con Newton o Broyden.
+        
+        Cada paso resuelve J·Δx = -F con ``GaussPiv``. El jacobiano se obtiene
+        con derivadas parciales simbólicas (compiladas junto a F como un único
+        DAG) o por diferencias hacia adelante. En modo Broyden el jacobiano se
+        calcula solo al inicio y luego se corrige con actualizaciones de rango
+        uno; se recalcula únicamente si la aproximación se vuelve singular.
+        Se detiene cuando ||F||∞ <= tolerancia o ||Δx||∞ <= tolerancia.
+        """
+        metodo = (metodo or "newton").lower()
+        jacobiano = (jacobiano or "automatico").lower()
+        if metodo not in METODOS_SISTEMA:
+            raise ValueError(f"Método desconocido '{metodo}'. Use uno de: {', '.join(METODOS_SISTEMA)}")
+        if jacobiano not in MODOS_JACOBIANO:
+            raise ValueError(f"Jacobiano desconocido '{jacobiano}'. Use uno de: {', '.join(MODOS_JACOBIANO)}")
+        if tipo_pivoteo not in (0, 1, 2):
+            raise ValueError("El tipo de pivoteo debe ser 0 (sin pivoteo), 1 (parcial) o 2 (total)")
+        variables = validar_variables(variables)
+        n = len(variables)
+        if len(funciones) != n or len(x0) != n:
+            raise ValueError(
+                f"El sistema debe ser cuadrado: {len(funciones)} funciones, {n} variables y {len(x0)} valores iniciales"
+            )
+        if n > MAX_ECUACIONES_SISTEMA:
+            raise ValueError(f"Se admiten como máximo {MAX_ECUACIONES_SISTEMA} ecuaciones")
+        
+        conjunto_F = compilar_conjunto(funciones, variables)
+        parciales: List[str] = []
+        if jacobiano == "automatico":
+            parciales = [
+                derivar_expresion(funcion, 1, variable, variables).fuente
+                for funcion in funciones for variable in variables
+            ]
+            conjunto_FJ = compilar_conjunto([*funciones, *parciales], variables)
+        contadores = {"nfev": 0, "evaluaciones_jacobiano": 0}
+        convergencia = MonitorConvergencia(tolerancia, niter, orden=2.0 if metodo == "newton" else 1.6)
+        
+        def evaluar(conjunto, x: np.ndarray) -> np.ndarray:
+            try:
+                valores = np.array(conjunto.evaluar(*x), dtype=float)
+            except (LimiteExcedidoError, MemoryError):
+                raise
+            except Exception as e:
+                raise ValueError(f"Error evaluando el sistema en {self._punto_sistema(variables, x)}: {str(e)}")
+            if not np.all(np.isfinite(valores)):
+                raise ValueError(f"El sistema no es finito en {self._punto_sistema(variables, x)}")
+            return valores
+        
+        def F(x: np.ndarray) -> np.ndarray:
+            contadores["nfev"] += 1
+            return evaluar(conjunto_F, x)
+        
+        def F_y_J(x: np.ndarray, Fx: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+            """F(x) y el jacobiano exacto (o por diferencias) en x"""
+            contadores["evaluaciones_jacobiano"] += 1
+            if jacobiano == "automatico":
+                contadores["nfev"] += 1
+                valores = evaluar(conjunto_FJ, x)
+                return valores[:n], valores[n:].reshape(n, n)
+            Fx = F(x) if Fx is None else Fx
+            J = np.empty((n, n))
+            for j in range(n):
+                h = math.sqrt(np.finfo(float).eps) * max(1.0, abs(x[j]))
+                desplazado = x.copy()
+                desplazado[j] += h
+                J[:, j] = (F(desplazado) - Fx) / h
+            return Fx, J
+        
+        iteraciones = []
+        ayuda = (
+            "Escriba una función por ecuación usando los nombres de variables indicados. "
+            "Si Newton no converge, pruebe otro valor inicial o el pivoteo total."
+        )
+        
+        def registrar(i: int, x: np.ndarray, Fx: np.ndarray, delta: np.ndarray | None, observacion: str):
+            error = None
+            valores = {**dict(zip(variables, x.tolist())), "norma_F": float(np.max(np.abs(Fx))),
+                       "error_absoluto": "", "error_relativo": ""}
+            if delta is not None:
+                norma_delta = float(np.max(np.abs(delta)))
+                norma_x = float(np.max(np.abs(x)))
+                valores["error_absoluto"] = norma_delta
+                valores["error_relativo"] = norma_delta / norma_x if norma_x > 1e-12 else norma_delta
+                error = valores["error_relativo"] if tipo_error == "relativo" else norma_delta
+            iteraciones.append(IteracionData(iteracion=i, valores=valores, error=error, observacion=observacion))
+            return error
+        
+        def responder(exito: bool, x: np.ndarray, mensaje: str) -> Dict[str, Any]:
+            resumen = {
+                "solucion": dict(zip(variables, x.tolist())),
+                "metodo": metodo,
+                "jacobiano": jacobiano,
+                "tipo_pivoteo": tipo_pivoteo,
+                **contadores,
+                "convergencia": convergencia.estado,
+            }
+            if parciales:
+                resumen["derivadas_parciales"] = [parciales[i * n:(i + 1) * n] for i in range(n)]
+            return self._construir_respuesta_metodo(
+                exito=exito, resultado=None, iteraciones=iteraciones, mensaje=mensaje, ayuda=ayuda, resumen=resumen,
+            )
+        
+        x = np.array(x0, dtype=float)
+        try:
+            Fx, J = F_y_J(x)
+        except (LimiteExcedidoError, MemoryError):
+            raise
+        except ValueError as e:
+            return responder(False, x, f"No fue posible evaluar el sistema en el punto inicial. {str(e)}")
+        registrar(0, x, Fx, None, "Valores iniciales")
+        if np.max(np.abs(Fx)) <= tolerancia:
+            return responder(True, x, f"El punto inicial {self._punto_sistema(variables, x)} ya es solución del sistema")
+        
+        nombre = "Newton" if metodo == "newton" else "Broyden"
+        jacobiano_exacto = True
+        for i in range(1, niter + 1):
+            observacion = nombre
+            try:
+                try:
+                    delta = self._resolver_paso_lineal(J, Fx, tipo_pivoteo)
+                except (LimiteExcedidoError, MemoryError):
+                    raise
+                except ValueError:
+                    if jacobiano_exacto:
+                        raise
+                    # La aproximación de Broyden se volvió singular: se recalcula el jacobiano
+                    Fx, J = F_y_J(x, Fx)
+                    observacion = "Broyden (jacobiano recalculado)"
+                    delta = self._resolver_paso_lineal(J, Fx, tipo_pivoteo)
+            except (LimiteExcedidoError, MemoryError):
+                raise
+            except ValueError as e:
+                return responder(False, x, f"El jacobiano es singular en la iteración {i}: {str(e)}")
+            
+            x_nuevo = x + delta
+            try:
+                if metodo == "newton":
+                    F_nuevo, J = F_y_J(x_nuevo)
+                else:
+                    F_nuevo = F(x_nuevo)
+                    # Actualización de rango uno: J_nuevo·Δx = F_nuevo - F
+                    J = J + np.outer(F_nuevo - Fx - J @ delta, delta) / (delta @ delta)
+                    jacobiano_exacto = False
+            except (LimiteExcedidoError, MemoryError):
+                raise
+            except ValueError as e:
+                return responder(False, x, f"Error en la iteración {i}: {str(e)}")
+            x, Fx = x_nuevo, F_nuevo
+            
+            error = registrar(i, x, Fx, delta, observacion)
+            if np.max(np.abs(Fx)) <= tolerancia or error <= tolerancia:
+                return responder(
+                    True, x,
+                    f"{nombre} convergió en {i} iteraciones: {self._punto_sistema(variables, x)}"
+                )
+            detencion = convergencia.registrar(error, i)
+            if detencion is not None:
+                return responder(
+                    False, x,
+                    f"Detención temprana en la iteración {i}: {detencion} "
+                    f"Última aproximación: {self._punto_sistema(variables, x)}"
+                )
+        
+        return responder(
+            False, x,
+            f"Se alcanzó el máximo de {niter} iteraciones sin convergencia. "
+            f"Última aproximación: {self._punto_sistema(variables, x)}"
+        )
+    
+    @staticmethod
+    def _punto_sistema(variables: Iterable[str], x: Iterable[float]) -> str:
+        return "(" + ", ".join(f"{v} = {valor:.10g}" for v, valor in zip(variables, x)) + ")"
+    
+    # --- Continuación paramétrica: barridos de f(x; p) con arranque en caliente ---------
+    
+    def continuacion_parametrica(self, funcion: str, valores_parametro: List[float], x0: float,
+                                 tolerancia: float, niter: int, parametro: str = "p",
+                                 predictor: str = "ninguno", tipo_error: str = "absoluto") -> Dict[str, Any]:
+        """
+        Resuelve f(x; p) = 0 para una sucesión de valores del parámetro.
+
+        Los valores se recorren en el orden enviado y cada resolución (Newton en
+        x, con los criterios de ``newton_raphson``) parte de la raíz anterior. Con
+        ``predictor`` el punto de partida se extrapola: 'secante' prolonga la
+        recta por las dos últimas raíces y 'tangente' sigue la curva con
+        dx/dp = -f_p / f_x. Si el corrector no converge desde el punto predicho
+        se reintenta desde la raíz anterior. La respuesta es compacta: listas
+        paralelas en el resumen y una fila de la tabla por cada valor que falló.
+        """
+        predictor = (predictor or "ninguno").strip().lower()
+        if predictor not in PREDICTORES_CONTINUACION:
+            raise ValueError(
+                f"Predictor no válido: '{predictor}'. Opciones: {', '.join(PREDICTORES_CONTINUACION)}"
+            )
+        variables = validar_variables(("x", parametro))
+        parametro = variables[1]
+        p = np.asarray(valores_parametro, dtype=float)
+        if p.ndim != 1 or p.size == 0:
+            raise ValueError("Debe indicar al menos un valor del parámetro")
+        if p.size > MAX_VALORES_CONTINUACION:
+            raise ValueError(f"Se admiten como máximo {MAX_VALORES_CONTINUACION} valores del parámetro por solicitud")
+        if not np.all(np.isfinite(p)) or not math.isfinite(x0):
+            raise ValueError("Los valores del parámetro y x0 deben ser números finitos")
+        
+        # f, f_x y f_p se compilan como un único DAG: f_p sale casi gratis para el predictor tangente
+        funcion_dx = derivar_expresion(funcion, 1, "x", variables).fuente
+        funcion_dp = derivar_expresion(funcion, 1, parametro, variables).fuente
+        evaluar = compilar_conjunto([funcion, funcion_dx, funcion_dp], variables).evaluar
+        nfev = 0
+        
+        def corregir(x: float, valor_p: float) -> tuple[float, int, int, float | None]:
+            """Newton en x con p fijo: (x, iteraciones, estado, dx/dp en la raíz)"""
+            nonlocal nfev
+            error = math.inf
+            for paso in range(niter + 1):
+                try:
+                    fx, dfx, dfp = evaluar(x, valor_p)
+                except (LimiteExcedidoError, MemoryError):
+                    raise
+                except (ArithmeticError, ValueError):
+                    return x, paso, _FUERA_DE_DOMINIO, None
+                nfev += 1
+                if not (math.isfinite(fx) and math.isfinite(dfx) and math.isfinite(dfp)):
+                    return x, paso, _FUERA_DE_DOMINIO, None
+                if abs(fx) <= tolerancia or error <= tolerancia:
+                    return x, paso, _CONVERGIO, -dfp / dfx if abs(dfx) >= 1e-12 else None
+                if abs(dfx) < 1e-12:
+                    return x, paso, _DERIVADA_NULA, None
+                if paso == niter:
+                    break
+                x_nuevo = x - fx / dfx
+                error = self._calcular_error(x_nuevo, x, tipo_error)
+                x = x_nuevo
+            return x, niter, _NO_CONVERGIO, None
+        
+        raices = np.full(p.size, np.nan)
+        pasos = np.zeros(p.size, dtype=np.int32)
+        estados = np.full(p.size, _NO_CONVERGIO, dtype=np.int8)
+        iteraciones = []
+        # Últimas dos soluciones aceptadas: (p, x, dx/dp)
+        anterior = penultima = None
+        for k, valor_p in enumerate(p.tolist()):
+            inicio = x0 if anterior is None else anterior[1]
+            prediccion = inicio
+            if anterior is not None:
+                delta_p = valor_p - anterior[0]
+                if predictor == "tangente" and anterior[2] is not None:
+                    prediccion = anterior[1] + anterior[2] * delta_p
+                elif predictor == "secante" and penultima is not None and anterior[0] != penultima[0]:
+                    pendiente = (anterior[1] - penultima[1]) / (anterior[0] - penultima[0])
+                    prediccion = anterior[1] + pendiente * delta_p
+                if not math.isfinite(prediccion):
+                    prediccion = inicio
+            
+            x, usados, estado, pendiente = corregir(prediccion, valor_p)
+            if estado != _CONVERGIO and prediccion != inicio:
+                x, reintento, estado, pendiente = corregir(inicio, valor_p)
+                usados += reintento
+            pasos[k] = usados
+            estados[k] = estado
+            if estado == _CONVERGIO:
+                raices[k] = x
+                penultima, anterior = anterior, (valor_p, x, pendiente)
+            else:
+                iteraciones.append(IteracionData(
+                    iteracion=k,
+                    valores={parametro: valor_p, "x_inicial": prediccion, "x_final": x, "iteraciones": usados},
+                    observacion=ESTADOS_ARRANQUE[estado]
+                ))
+        
+        convergidos = estados == _CONVERGIO
+        conteo = {nombre: int(np.count_nonzero(estados == codigo)) for codigo, nombre in enumerate(ESTADOS_ARRANQUE)}
+        return self._construir_respuesta_metodo(
+            exito=bool(np.all(convergidos)),
+            resultado=float(raices[-1]) if convergidos[-1] else None,
+            iteraciones=iteraciones,
+            mensaje=(
+                f"Continuación en {parametro}: {conteo['convergio']} de {p.size} valores convergieron "
+                f"con {int(pasos.sum())} iteraciones de Newton en total"
+            ),
+            ayuda=(
+                f"Escriba f en función de x y de {parametro}. Ordene los valores del parámetro de modo que "
+                "las raíces cambien poco entre valores consecutivos; cerca de un punto de retorno "
+                "(f_x = 0) la rama deja de existir y el método falla."
+            ),
+            resumen={
+                "parametro": parametro,
+                "predictor": predictor,
+                "funcion_dx": funcion_dx,
+                "funcion_dp": funcion_dp,
+                "valores_parametro": p.tolist(),
+                "raices": [float(r) if ok else None for r, ok in zip(raices, convergidos)],
+                "iteraciones": pasos.tolist(),
+                "estados": estados.tolist(),
+                "leyenda_estados": list(ESTADOS_ARRANQUE),
+                "conteo_estados": conteo,
+                "nfev": nfev,
+            },
+        )
+    
     def _formatear_numero(self, numero: float, tipo_precision: str, precision: int) -> str:
         """Formatea un número según el tipo de precisión especificado"""
         if tipo_precision == "significativas":
@@ -1187,7 +3126,7 @@ class EcuacionesService:
             return f"{numero:.{precision}f}"
     
     def raices_multiples(self, x0: float, tolerancia: float, niter: int, 
-                        funcion_f: str, funcion_df: str, funcion_ddf: str,
+                        funcion_f: str, funcion_df: str | None = None, funcion_ddf: str | None = None,
                         tipo_error: str = "absoluto", modo: str = "dc") -> Dict[str, Any]:
         """
         Implementa el método de raíces múltiples mejorado con validaciones robustas.
@@ -1199,13 +3138,27 @@ class EcuacionesService:
             tolerancia: Tolerancia para convergencia
             niter: Número máximo de iteraciones
             funcion_f: Función f(x) como string
-            funcion_df: Primera derivada f'(x) como string
-            funcion_ddf: Segunda derivada f''(x) como string
+            funcion_df: Primera derivada f'(x) como string (opcional, se deriva f si se omite)
+            funcion_ddf: Segunda derivada f''(x) como string (opcional, se deriva f si se omite)
             tipo_error: 'absoluto' o 'relativo'
             modo: "cs" para cifras significativas o "dc" para decimales correctos
         """
         iteraciones = []
         
+        funcion_df, df_automatica = self._resolver_derivada(funcion_f, funcion_df, 1)
+        funcion_ddf, ddf_automatica = self._resolver_derivada(funcion_f, funcion_ddf, 2)
+        resumen = {
+            "funcion_df": funcion_df,
+            "funcion_ddf": funcion_ddf,
+            "derivada_automatica": df_automatica,
+            "segunda_derivada_automatica": ddf_automatica,
+        }
+        convergencia = MonitorConvergencia(tolerancia, niter, orden=2.0)
+        resumen["convergencia"] = convergencia.estado
+        evaluar_derivadas = self._evaluador_con_derivadas(
+            funcion_f, [funcion_df, funcion_ddf], df_automatica and ddf_automatica
+        )
+        
         # Validar tolerancia
         ayuda_rm = (
             "Use funciones válidas en Python (sin, cos, exp, log). "
@@ -1222,6 +3175,8 @@ class EcuacionesService:
                 claves_grafica=None,
                 titulo_grafica="Método de Raíces Múltiples",
                 ayuda=ayuda_rm,
+                resumen=resumen,
+                evaluaciones=evaluar_derivadas,
             )
         
         # Validar número de iteraciones
@@ -1235,13 +3190,15 @@ class EcuacionesService:
                 claves_grafica=None,
                 titulo_grafica="Método de Raíces Múltiples",
                 ayuda=ayuda_rm,
+                resumen=resumen,
+                evaluaciones=evaluar_derivadas,
             )
         
         # Evaluación inicial
         try:
-            f_value = self._evaluar_funcion(funcion_f, x0)
-            df_value = self._evaluar_funcion(funcion_df, x0)
-            ddf_value = self._evaluar_funcion(funcion_ddf, x0)
+            f_value, df_value, ddf_value = evaluar_derivadas(x0)
+        except (LimiteExcedidoError, MemoryError):
+            raise
         except Exception as e:
             return self._construir_respuesta_metodo(
                 exito=False,
@@ -1252,6 +3209,8 @@ class EcuacionesService:
                 claves_grafica=None,
                 titulo_grafica="Método de Raíces Múltiples",
                 ayuda=ayuda_rm,
+                resumen=resumen,
+                evaluaciones=evaluar_derivadas,
             )
         
         # Primera iteración (iteración 0)
@@ -1274,6 +3233,7 @@ class EcuacionesService:
         error = float("inf")
         iter_count = 0
         x_actual = x0
+        detencion = None
         
         # Algoritmo iterativo
         while iter_count < niter and abs(f_value) > tolerancia and error > tolerancia:
@@ -1306,11 +3266,15 @@ class EcuacionesService:
                     claves_grafica=["xi"],
                     titulo_grafica="Método de Raíces Múltiples",
                     ayuda=ayuda_rm,
+                    resumen=resumen,
+                    evaluaciones=evaluar_derivadas,
                 )
             
             # Calcular siguiente aproximación
             try:
                 x_siguiente = x_actual - (f_value * df_value) / denominador
+            except (LimiteExcedidoError, MemoryError):
+                raise
             except Exception as e:
                 return self._construir_respuesta_metodo(
                     exito=False,
@@ -1321,6 +3285,8 @@ class EcuacionesService:
                     claves_grafica=["xi"],
                     titulo_grafica="Método de Raíces Múltiples",
                     ayuda=ayuda_rm,
+                    resumen=resumen,
+                    evaluaciones=evaluar_derivadas,
                 )
             
             # Calcular ambos tipos de error
@@ -1332,9 +3298,9 @@ class EcuacionesService:
             
             # Evaluar funciones en el nuevo punto
             try:
-                f_value = self._evaluar_funcion(funcion_f, x_siguiente)
-                df_value = self._evaluar_funcion(funcion_df, x_siguiente)
-                ddf_value = self._evaluar_funcion(funcion_ddf, x_siguiente)
+                f_value, df_value, ddf_value = evaluar_derivadas(x_siguiente)
+            except (LimiteExcedidoError, MemoryError):
+                raise
             except Exception as e:
                 return self._construir_respuesta_metodo(
                     exito=False,
@@ -1345,6 +3311,8 @@ class EcuacionesService:
                     claves_grafica=["xi"],
                     titulo_grafica="Método de Raíces Múltiples",
                     ayuda=ayuda_rm,
+                    resumen=resumen,
+                    evaluaciones=evaluar_derivadas,
                 )
             
             iter_count += 1
@@ -1366,6 +3334,10 @@ class EcuacionesService:
                 error=error,
                 observacion="Iteración de raíces múltiples"
             ))
+            if abs(f_value) > tolerancia and error > tolerancia:
+                detencion = convergencia.registrar(error, iter_count)
+                if detencion is not None:
+                    break
         
         # Determinar el resultado final
         if abs(f_value) <= tolerancia:
@@ -1374,6 +3346,9 @@ class EcuacionesService:
         elif error <= tolerancia:
             mensaje = f"{x_actual:.10f} es una aproximación de una raíz múltiple con tolerancia {tolerancia}."
             exito = True
+        elif detencion is not None:
+            mensaje = f"Detención temprana en la iteración {iter_count}: {detencion}"
+            exito = False
         else:
             mensaje = f"Se alcanzó el máximo de {niter} iteraciones sin cumplir la tolerancia solicitada."
             exito = False
@@ -1387,4 +3362,6 @@ class EcuacionesService:
             claves_grafica=["xi"],
             titulo_grafica="Método de Raíces Múltiples",
             ayuda=ayuda_rm,
+            resumen=resumen,
+            evaluaciones=evaluar_derivadas,
         )
\ No newline at end of file
@@ -0,0 +1,363 @@
+"""
+Ejecución aislada de los métodos que evalúan funciones enviadas por el usuario.
+
+Los métodos se ejecutan en un pool de procesos pre-calentados en lugar de en el
+event loop de uvicorn. Cada proceso tiene un tope de memoria (RLIMIT_AS) y cada
+tarea un presupuesto de tiempo de CPU (RLIMIT_CPU + SIGXCPU); una tarea que lo
+excede falla con LimiteExcedidoError sin afectar a las demás. Como respaldo, si
+una tarea supera además el tiempo de reloj máximo, el pool se recicla.
+
+Las tareas marcadas como lentas (funciones de costo estimado alto, ver
+services.complejidad) comparten el pool pero tienen su propio cupo de tareas
+simultáneas, de modo que no pueden acaparar los trabajadores.
+
+Configuración por variables de entorno:
+    ANALISIS_POOL_TRABAJADORES   número de procesos (0 = ejecutar en el proceso actual)
+    ANALISIS_POOL_COLA_MAXIMA    tareas en espera admitidas antes de rechazar
+    ANALISIS_POOL_CARRIL_LENTO   tareas costosas (carril lento) admitidas a la vez
+    ANALISIS_LIMITE_CPU_S        segundos de CPU por tarea
+    ANALISIS_LIMITE_MEMORIA_MB   memoria máxima por proceso trabajador
+"""
+
+import asyncio
+import importlib
+import math
+import multiprocessing
+import os
+import signal
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List
+
+try:
+    import resource
+except ImportError:  # Windows: solo se aplica el tiempo de reloj máximo
+    resource = None
+
+
+class LimiteExcedidoError(ValueError):
+    """La evaluación superó el tiempo de CPU o la memoria permitidos"""
+
+
+class EjecutorSaturadoError(RuntimeError):
+    """Todos los trabajadores están ocupados y la cola de espera está llena"""
+
+
+# Servicios que pueden ejecutarse en los trabajadores: nombre -> (módulo, clase)
+SERVICIOS: Dict[str, tuple[str, str]] = {
+    "ecuaciones": ("services.ecuaciones_service", "EcuacionesService"),
+}
+
+_instancias: Dict[str, Any] = {}
+
+
+def _al_exceder_cpu(signum, frame):
+    raise LimiteExcedidoError("La evaluación superó el tiempo de CPU permitido")
+
+
+def _inicializar_trabajador(limite_memoria_mb: int) -> None:
+    """Pre-calienta el proceso (importa los servicios) y fija el tope de memoria"""
+    for nombre in SERVICIOS:
+        _obtener_servicio(nombre)
+    if resource is None:
+        return
+    signal.signal(signal.SIGXCPU, _al_exceder_cpu)
+    if limite_memoria_mb > 0:
+        limite = limite_memoria_mb * 1024 * 1024
+        _, duro = resource.getrlimit(resource.RLIMIT_AS)
+        if duro != resource.RLIM_INFINITY:
+            limite = min(limite, duro)
+        resource.setrlimit(resource.RLIMIT_AS, (limite, duro))
+
+
+def _obtener_servicio(nombre: str) -> Any:
+    servicio = _instancias.get(nombre)
+    if servicio is None:
+        modulo, clase = SERVICIOS[nombre]
+        servicio = getattr(importlib.import_module(modulo), clase)()
+        _instancias[nombre] = servicio
+    return servicio
+
+
+def _ejecutar_en_trabajador(servicio: str, metodo: str, argumentos: Dict[str, Any], limite_cpu_s: float) -> Any:
+    """Punto de entrada dentro del proceso trabajador"""
+    funcion = getattr(_obtener_servicio(servicio), metodo)
+    if resource is None or limite_cpu_s <= 0:
+        return funcion(**argumentos)
+
+    # RLIMIT_CPU es acumulativo por proceso: el límite blando se fija relativo
+    # al consumo actual y se restablece al terminar la tarea
+    uso = resource.getrusage(resource.RUSAGE_SELF)
+    consumido = uso.ru_utime + uso.ru_stime
+    _, duro = resource.getrlimit(resource.RLIMIT_CPU)
+    blando = math.ceil(consumido + limite_cpu_s)
+    if duro != resource.RLIM_INFINITY:
+        blando = min(blando, duro)
+    resource.setrlimit(resource.RLIMIT_CPU, (blando, duro))
+    sin_memoria = False
+    try:
+        return funcion(**argumentos)
+    except (MemoryError, SystemError):
+        # Al agotar RLIMIT_AS el intérprete puede fallar con SystemError en lugar
+        # de MemoryError; el error se lanza fuera del except para liberar antes
+        # los marcos (y los datos) de la tarea fallida
+        sin_memoria = True
+    finally:
+        resource.setrlimit(resource.RLIMIT_CPU, (resource.RLIM_INFINITY, duro))
+    if sin_memoria:
+        raise LimiteExcedidoError("La evaluación superó la memoria permitida")
+
+
+def _entero_entorno(nombre: str, defecto: int) -> int:
+    try:
+        return int(os.environ.get(nombre, defecto))
+    except ValueError:
+        return defecto
+
+
+class EjecutorAislado:
+    """Pool de procesos con límites por tarea y métricas de saturación"""
+
+    def __init__(self, trabajadores: int = 2, cola_maxima: int = 16,
+                 limite_cpu_s: float = 10.0, limite_memoria_mb: int = 1024,
+                 capacidad_lenta: int | None = None):
+        self.trabajadores = max(0, trabajadores)
+        self.cola_maxima = max(0, cola_maxima)
+        if capacidad_lenta is None:
+            capacidad_lenta = max(1, self.trabajadores // 2)
+        self.capacidad_lenta = max(1, capacidad_lenta)
+        self.limite_cpu_s = limite_cpu_s
+        self.limite_memoria_mb = limite_memoria_mb
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self.activas = 0
+        self.activas_lentas = 0
+        self.completadas = 0
+        self.rechazadas = 0
+        self.rechazadas_lentas = 0
+        self.limites_excedidos = 0
+        self.descartadas = 0
+        self.reinicios = 0
+
+    @classmethod
+    def desde_entorno(cls) -> "EjecutorAislado":
+        return cls(
+            trabajadores=_entero_entorno("ANALISIS_POOL_TRABAJADORES", max(1, min(4, os.cpu_count() or 1))),
+            cola_maxima=_entero_entorno("ANALISIS_POOL_COLA_MAXIMA", 16),
+            limite_cpu_s=_entero_entorno("ANALISIS_LIMITE_CPU_S", 10),
+            limite_memoria_mb=_entero_entorno("ANALISIS_LIMITE_MEMORIA_MB", 1024),
+            capacidad_lenta=_entero_entorno("ANALISIS_POOL_CARRIL_LENTO", 0) or None,
+        )
+
+    @property
+    def capacidad(self) -> int:
+        return self.trabajadores + self.cola_maxima
+
+    @property
+    def tiempo_maximo_s(self) -> float:
+        # Respaldo de reloj: el límite de CPU normalmente actúa antes
+        return self.limite_cpu_s * 2 + 5
+
+    def iniciar(self) -> None:
+        """Crea el pool y pre-calienta todos los trabajadores"""
+        if self.trabajadores == 0:
+            return
+        with self._lock:
+            if self._pool is not None:
+                return
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.trabajadores,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_inicializar_trabajador,
+                initargs=(self.limite_memoria_mb,),
+            )
+            pool = self._pool
+        for futuro in [pool.submit(os.getpid) for _ in range(self.trabajadores)]:
+            futuro.result()
+
+    def cerrar(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _reciclar(self, pool: ProcessPoolExecutor) -> None:
+        """Termina los procesos de un pool bloqueado y deja que se cree uno nuevo"""
+        with self._lock:
+            if self._pool is not pool:
+                return
+            self._pool = None
+            self.reinicios += 1
+        for proceso in list(getattr(pool, "_processes", {}).values()):
+            proceso.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _pool_actual(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self.iniciar()
+        return self._pool
+
+    async def ejecutar(self, servicio: str, metodo: str, /, lento: bool = False, **argumentos: Any) -> Any:
+        """
+        Ejecuta ``servicio.metodo(**argumentos)`` en un trabajador aislado.
+
+        Con ``lento=True`` la tarea ocupa además un cupo del carril lento.
+        """
+        with self._lock:
+            if self.activas >= self.capacidad and self.trabajadores > 0:
+                self.rechazadas += 1
+                raise EjecutorSaturadoError(
+                    "El servidor está procesando demasiadas solicitudes. Intente de nuevo en unos segundos."
+                )
+            if lento and self.activas_lentas >= self.capacidad_lenta and self.trabajadores > 0:
+                self.rechazadas_lentas += 1
+                raise EjecutorSaturadoError(
+                    "El servidor está procesando demasiadas funciones costosas. Intente de nuevo en unos segundos."
+                )
+            self.activas += 1
+            if lento:
+                self.activas_lentas += 1
+
+        en_curso: List[Future] = []
+        diferida = False
+        try:
+            if self.trabajadores == 0:
+                # Sin pool (desarrollo): se ejecuta en el proceso actual, sin límites
+                return getattr(_obtener_servicio(servicio), metodo)(**argumentos)
+            return await self._ejecutar_en_pool(servicio, metodo, argumentos, en_curso, reintentar=True)
+        except asyncio.CancelledError:
+            # Cancelada mientras corre en un trabajador: el proceso sigue ocupado hasta
+            # que la tarea termine (o agote su CPU), así que el cupo se libera entonces
+            if en_curso and not en_curso[-1].done():
+                diferida = True
+                with self._lock:
+                    self.descartadas += 1
+                en_curso[-1].add_done_callback(lambda _: self._liberar(lento))
+            raise
+        except LimiteExcedidoError:
+            with self._lock:
+                self.limites_excedidos += 1
+            raise
+        finally:
+            if not diferida:
+                self._liberar(lento)
+
+    def _liberar(self, lento: bool) -> None:
+        with self._lock:
+            self.activas -= 1
+            if lento:
+                self.activas_lentas -= 1
+            self.completadas += 1
+
+    def numero_de_lotes(self, elementos: int, lento: bool = False) -> int:
+        """Lotes en que ``repartir`` divide ``elementos`` tareas (uno por trabajador)"""
+        lotes = max(1, min(elementos, self.trabajadores or 1))
+        return min(lotes, self.capacidad_lenta) if lento else lotes
+
+    async def repartir(self, servicio: str, metodo: str, parametro: str, elementos: List[Any], /,
+                       lento: bool = False, **argumentos: Any) -> List[Any]:
+        """
+        Reparte ``elementos`` en lotes entre los trabajadores y ejecuta en paralelo
+        ``servicio.metodo(parametro=lote, **argumentos)``, que debe devolver una
+        lista por lote. Devuelve los resultados concatenados en el orden original.
+        """
+        if not elementos:
+            return []
+        lotes = self.numero_de_lotes(len(elementos), lento)
+        cortes = [len(elementos) * i // lotes for i in range(lotes + 1)]
+        resultados = await asyncio.gather(*(
+            self.ejecutar(servicio, metodo, lento=lento, **{parametro: elementos[inicio:fin]}, **argumentos)
+            for inicio, fin in zip(cortes, cortes[1:])
+        ))
+        return [resultado for lote in resultados for resultado in lote]
+
+    async def competir(self, participantes: Dict[str, tuple[str, str, Dict[str, Any]]],
+                       aceptar: Callable[[Any], bool], lento: bool = False
+                       ) -> tuple[str | None, Dict[str, Any], Dict[str, str]]:
+        """
+        Lanza a la vez ``servicio.metodo(**argumentos)`` de cada participante
+        (nombre -> (servicio, metodo, argumentos)) y se queda con el primero cuyo
+        resultado cumple ``aceptar``; los que siguen pendientes se cancelan.
+
+        Las tareas que aún esperan en la cola del pool no llegan a ejecutarse; las
+        que ya están en un trabajador terminan allí (dentro de su presupuesto de
+        CPU), su resultado se descarta y conservan su cupo hasta terminar.
+
+        Devuelve el nombre del ganador (None si ninguno cumple), los resultados
+        obtenidos y el estado de cada participante: 'ganador', 'convergio',
+        'no_convergio', 'cancelado', 'rechazado' (pool saturado) o 'error: ...'.
+        """
+        tareas = {
+            asyncio.ensure_future(self.ejecutar(servicio, metodo, lento=lento, **argumentos)): nombre
+            for nombre, (servicio, metodo, argumentos) in participantes.items()
+        }
+        orden = list(participantes)
+        estados = {nombre: "cancelado" for nombre in participantes}
+        resultados: Dict[str, Any] = {}
+        ganador = None
+        pendientes = set(tareas)
+        try:
+            while pendientes and ganador is None:
+                terminadas, pendientes = await asyncio.wait(pendientes, return_when=asyncio.FIRST_COMPLETED)
+                for tarea in sorted(terminadas, key=lambda t: orden.index(tareas[t])):
+                    nombre = tareas[tarea]
+                    try:
+                        resultados[nombre] = tarea.result()
+                    except EjecutorSaturadoError:
+                        estados[nombre] = "rechazado"
+                        continue
+                    except Exception as e:
+                        estados[nombre] = f"error: {e}"
+                        continue
+                    estados[nombre] = "convergio" if aceptar(resultados[nombre]) else "no_convergio"
+                    if ganador is None and estados[nombre] == "convergio":
+                        ganador = nombre
+                        estados[nombre] = "ganador"
+        finally:
+            for tarea in pendientes:
+                tarea.cancel()
+        return ganador, resultados, estados
+
+    async def _ejecutar_en_pool(self, servicio: str, metodo: str, argumentos: Dict[str, Any],
+                                en_curso: List[Future], reintentar: bool) -> Any:
+        """``en_curso`` recibe el futuro del pool de cada intento (para saber si sigue ejecutándose)"""
+        loop = asyncio.get_running_loop()
+        pool = await loop.run_in_executor(None, self._pool_actual)
+        try:
+            futuro = pool.submit(_ejecutar_en_trabajador, servicio, metodo, argumentos, self.limite_cpu_s)
+            en_curso.append(futuro)
+            return await asyncio.wait_for(asyncio.wrap_future(futuro), timeout=self.tiempo_maximo_s)
+        except asyncio.TimeoutError:
+            self._reciclar(pool)
+            raise LimiteExcedidoError("La evaluación superó el tiempo máximo permitido")
+        except BrokenProcessPool:
+            # El pool fue reciclado por culpa de otra tarea: se reintenta una vez
+            self._reciclar(pool)
+            if not reintentar:
+                raise LimiteExcedidoError("El trabajador terminó inesperadamente (posible exceso de memoria)")
+            return await self._ejecutar_en_pool(servicio, metodo, argumentos, en_curso, reintentar=False)
+
+    def estadisticas(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "trabajadores": self.trabajadores,
+                "activas": self.activas,
+                "en_cola": max(0, self.activas - self.trabajadores),
+                "capacidad": self.capacidad,
+                "saturado": self.trabajadores > 0 and self.activas >= self.capacidad,
+                "completadas": self.completadas,
+                "rechazadas": self.rechazadas,
+                "activas_lentas": self.activas_lentas,
+                "capacidad_lenta": self.capacidad_lenta,
+                "rechazadas_lentas": self.rechazadas_lentas,
+                "limites_excedidos": self.limites_excedidos,
+                "descartadas": self.descartadas,
+                "reinicios": self.reinicios,
+                "limite_cpu_s": self.limite_cpu_s,
+                "limite_memoria_mb": self.limite_memoria_mb,
+            }
+
+
+# Ejecutor global usado por los routers
+ejecutor = EjecutorAislado.desde_entorno()
@@ -0,0 +1,716 @@
+import ast
+import cmath
+import keyword
+import math
+import struct
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from services.derivadas import derivar
+from services.duales import construir_jet
+from services.intervalos import FUNCIONES_INTERVALO, Intervalo, como_intervalo
+from services.polinomios import arbol_horner, conviene_horner, extraer_coeficientes
+
+
+class ExpresionInvalidaError(ValueError):
+    """La función enviada contiene una construcción no permitida o no se puede compilar"""
+
+
+# Funciones permitidas en las expresiones del usuario: nombre -> (implementación escalar, aridad)
+FUNCIONES_ESCALARES: Dict[str, Tuple[Callable[..., float], int]] = {
+    'sin': (math.sin, 1),
+    'cos': (math.cos, 1),
+    'tan': (math.tan, 1),
+    'exp': (math.exp, 1),
+    'log10': (math.log10, 1),
+    'ln': (math.log, 1),
+    'sqrt': (math.sqrt, 1),
+    'abs': (abs, 1),
+    'pow': (pow, 2),
+}
+
+# Equivalentes vectorizados (ufuncs de NumPy) para evaluar arreglos completos
+FUNCIONES_VECTORIALES: Dict[str, Callable[..., Any]] = {
+    'sin': np.sin,
+    'cos': np.cos,
+    'tan': np.tan,
+    'exp': np.exp,
+    'log10': np.log10,
+    'ln': np.log,
+    'sqrt': np.sqrt,
+    'abs': np.abs,
+    'pow': np.power,
+}
+
+# Equivalentes en aritmética compleja (rama principal) para los métodos que buscan raíces complejas
+FUNCIONES_COMPLEJAS: Dict[str, Callable[..., Any]] = {
+    'sin': cmath.sin,
+    'cos': cmath.cos,
+    'tan': cmath.tan,
+    'exp': cmath.exp,
+    'log10': cmath.log10,
+    'ln': cmath.log,
+    'sqrt': cmath.sqrt,
+    'abs': abs,
+    'pow': pow,
+}
+
+_IMPLEMENTACIONES_ESCALARES: Dict[str, Callable[..., float]] = {
+    nombre: implementacion for nombre, (implementacion, _) in FUNCIONES_ESCALARES.items()
+}
+
+CONSTANTES: Dict[str, float] = {
+    'pi': math.pi,
+    'e': math.e,
+}
+
+# Nombres alternativos aceptados por compatibilidad (log = logaritmo natural, math.fabs, np.power, ...)
+ALIAS_FUNCIONES: Dict[str, str] = {
+    'log': 'ln',
+    'fabs': 'abs',
+    'power': 'pow',
+}
+
+# Módulos que se aceptan únicamente como prefijo de una función o constante permitida (math.sin, np.pi)
+MODULOS_PERMITIDOS = ('math', 'np')
+
+_OPERADORES_BINARIOS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod)
+_OPERADORES_UNARIOS = (ast.USub, ast.UAdd)
+
+_APLICAR_BINARIO: Dict[type, Callable[[float, float], float]] = {
+    ast.Add: lambda a, b: a + b,
+    ast.Sub: lambda a, b: a - b,
+    ast.Mult: lambda a, b: a * b,
+    ast.Div: lambda a, b: a / b,
+    ast.Pow: lambda a, b: a ** b,
+    ast.Mod: lambda a, b: a % b,
+}
+
+
+def normalizar_expresion(funcion: str) -> str:
+    """Normaliza el texto de una función: elimina espacios externos y reemplaza ^ por **"""
+    return funcion.strip().replace('^', '**')
+
+
+def _nombre_canonico(nombre: str) -> str:
+    return ALIAS_FUNCIONES.get(nombre, nombre)
+
+
+def _constante(valor: float) -> ast.Constant:
+    return ast.Constant(value=float(valor))
+
+
+def _es_constante(nodo: ast.AST) -> bool:
+    return isinstance(nodo, ast.Constant)
+
+
+def _plegar(operacion: Callable[[], Any], descripcion: str) -> ast.Constant:
+    """Evalúa en tiempo de compilación una subexpresión constante"""
+    try:
+        valor = operacion()
+    except (ArithmeticError, ValueError) as e:
+        raise ExpresionInvalidaError(f"Operación constante inválida en '{descripcion}': {str(e)}")
+    if isinstance(valor, complex):
+        raise ExpresionInvalidaError(f"La operación constante '{descripcion}' produce un número complejo")
+    return _constante(valor)
+
+
+class _Validador:
+    """
+    Recorre el AST de una expresión y construye uno canónico y seguro.
+
+    Solo se admiten números, las variables indicadas, las constantes y funciones
+    de la lista blanca y los operadores aritméticos. Los literales se convierten a
+    float (así ``10**10**10`` desborda de inmediato en lugar de construir un entero
+    gigante) y las subexpresiones constantes se pliegan, de modo que errores como
+    ``1/0`` se detectan antes de iterar.
+    """
+
+    def __init__(self, variables: Sequence[str]):
+        self.variables = tuple(variables)
+
+    def transformar(self, nodo: ast.AST) -> ast.expr:
+        metodo = getattr(self, f"_visitar_{type(nodo).__name__}", None)
+        if metodo is None:
+            raise ExpresionInvalidaError(
+                f"Construcción no permitida en la función: {type(nodo).__name__}"
+            )
+        return metodo(nodo)
+
+    def _visitar_Constant(self, nodo: ast.Constant) -> ast.expr:
+        if isinstance(nodo.value, bool) or not isinstance(nodo.value, (int, float)):
+            raise ExpresionInvalidaError(f"Literal no permitido en la función: {nodo.value!r}")
+        return _constante(nodo.value)
+
+    def _visitar_Name(self, nodo: ast.Name) -> ast.expr:
+        if nodo.id in self.variables:
+            return ast.Name(id=nodo.id, ctx=ast.Load())
+        if nodo.id in CONSTANTES:
+            return _constante(CONSTANTES[nodo.id])
+        raise ExpresionInvalidaError(
+            f"Nombre no permitido en la función: '{nodo.id}'. "
+            f"Variables disponibles: {', '.join(self.variables)}"
+        )
+
+    def _visitar_Attribute(self, nodo: ast.Attribute) -> ast.expr:
+        # Solo math.<constante> o np.<constante>; las funciones se resuelven en _visitar_Call
+        if isinstance(nodo.value, ast.Name) and nodo.value.id in MODULOS_PERMITIDOS and nodo.attr in CONSTANTES:
+            return _constante(CONSTANTES[nodo.attr])
+        raise ExpresionInvalidaError("No se permite el acceso a atributos en la función")
+
+    def _visitar_UnaryOp(self, nodo: ast.UnaryOp) -> ast.expr:
+        if not isinstance(nodo.op, _OPERADORES_UNARIOS):
+            raise ExpresionInvalidaError(f"Operador no permitido en la función: {type(nodo.op).__name__}")
+        operando = self.transformar(nodo.operand)
+        if isinstance(nodo.op, ast.UAdd):
+            return operando
+        if _es_constante(operando):
+            return _plegar(lambda: -operando.value, f"-{operando.value}")
+        return ast.UnaryOp(op=ast.USub(), operand=operando)
+
+    def _visitar_BinOp(self, nodo: ast.BinOp) -> ast.expr:
+        if not isinstance(nodo.op, _OPERADORES_BINARIOS):
+            raise ExpresionInvalidaError(f"Operador no permitido en la función: {type(nodo.op).__name__}")
+        izquierdo = self.transformar(nodo.left)
+        derecho = self.transformar(nodo.right)
+        if _es_constante(izquierdo) and _es_constante(derecho):
+            aplicar = _APLICAR_BINARIO[type(nodo.op)]
+            return _plegar(
+                lambda: aplicar(izquierdo.value, derecho.value),
+                ast.unparse(nodo),
+            )
+        return ast.BinOp(left=izquierdo, op=type(nodo.op)(), right=derecho)
+
+    def _visitar_Call(self, nodo: ast.Call) -> ast.expr:
+        if nodo.keywords:
+            raise ExpresionInvalidaError("No se permiten argumentos con nombre en las funciones")
+
+        if isinstance(nodo.func, ast.Name):
+            nombre = nodo.func.id
+        elif (isinstance(nodo.func, ast.Attribute) and isinstance(nodo.func.value, ast.Name)
+              and nodo.func.value.id in MODULOS_PERMITIDOS):
+            nombre = nodo.func.attr
+        else:
+            raise ExpresionInvalidaError("Llamada a función no permitida")
+
+        nombre = _nombre_canonico(nombre)
+        if nombre not in FUNCIONES_ESCALARES:
+            raise ExpresionInvalidaError(
+                f"Función no permitida: '{nombre}'. "
+                f"Funciones disponibles: {', '.join(sorted(FUNCIONES_ESCALARES))}"
+            )
+
+        implementacion, aridad = FUNCIONES_ESCALARES[nombre]
+        if len(nodo.args) != aridad:
+            raise ExpresionInvalidaError(f"La función '{nombre}' recibe {aridad} argumento(s)")
+
+        argumentos = [self.transformar(arg) for arg in nodo.args]
+        if all(_es_constante(arg) for arg in argumentos):
+            return _plegar(
+                lambda: implementacion(*(arg.value for arg in argumentos)),
+                ast.unparse(nodo),
+            )
+        return ast.Call(func=ast.Name(id=nombre, ctx=ast.Load()), args=argumentos, keywords=[])
+
+
+def analizar_expresion(funcion: str, variables: Sequence[str] = ("x",)) -> ast.expr:
+    """
+    Analiza y valida una función string, devolviendo su AST canónico.
+
+    Lanza ExpresionInvalidaError si la sintaxis es incorrecta o si usa
+    construcciones fuera de la lista blanca.
+    """
+    fuente = normalizar_expresion(funcion)
+    if not fuente:
+        raise ExpresionInvalidaError("La función está vacía")
+    try:
+        arbol = ast.parse(fuente, mode="eval")
+    except SyntaxError as e:
+        raise ExpresionInvalidaError(f"Sintaxis inválida en la función '{fuente}': {e.msg}")
+    except (RecursionError, MemoryError):
+        raise ExpresionInvalidaError("La función es demasiado larga o está demasiado anidada")
+
+    try:
+        return _Validador(variables).transformar(arbol.body)
+    except RecursionError:
+        raise ExpresionInvalidaError("La función está demasiado anidada")
+
+
+_SIMBOLOS_BINARIOS: Dict[type, str] = {
+    ast.Add: "+",
+    ast.Sub: "-",
+    ast.Mult: "*",
+    ast.Div: "/",
+    ast.Pow: "**",
+    ast.Mod: "%",
+}
+
+
+class _GeneradorDAG:
+    """
+    Emite código en línea recta para uno o varios ASTs validados.
+
+    Cada subexpresión se identifica por el texto que la calcula a partir de
+    los temporales de sus hijos, así que los subárboles estructuralmente
+    iguales (dentro de una misma expresión o entre f, f' y f'') se
+    calculan una sola vez (eliminación de subexpresiones comunes).
+    """
+
+    def __init__(self):
+        self.lineas: List[str] = []
+        self.funciones: set[str] = set()
+        self.constantes: Dict[str, float] = {}
+        self.nodos_totales = 0
+        self._memo: Dict[str, str] = {}
+
+    def _operando(self, codigo: str) -> str:
+        # Los literales negativos se agrupan para no alterar la precedencia de **
+        return f"({codigo})" if codigo.startswith("-") else codigo
+
+    def _literal(self, valor: float) -> str:
+        if math.isfinite(valor):
+            return repr(valor)
+        nombre = f"_k{len(self.constantes)}"
+        self.constantes[nombre] = valor
+        return nombre
+
+    def emitir(self, nodo: ast.expr) -> str:
+        self.nodos_totales += 1
+        if isinstance(nodo, ast.Constant):
+            return self._literal(nodo.value)
+        if isinstance(nodo, ast.Name):
+            return nodo.id
+        if isinstance(nodo, ast.UnaryOp):
+            codigo = f"-{self._operando(self.emitir(nodo.operand))}"
+        elif isinstance(nodo, ast.BinOp):
+            izquierdo = self._operando(self.emitir(nodo.left))
+            derecho = self._operando(self.emitir(nodo.right))
+            codigo = f"{izquierdo} {_SIMBOLOS_BINARIOS[type(nodo.op)]} {derecho}"
+        elif isinstance(nodo, ast.Call):
+            self.funciones.add(nodo.func.id)
+            codigo = f"{nodo.func.id}({', '.join(self.emitir(arg) for arg in nodo.args)})"
+        else:
+            raise ExpresionInvalidaError(f"Construcción no permitida en la función: {type(nodo).__name__}")
+
+        temporal = self._memo.get(codigo)
+        if temporal is None:
+            temporal = f"_c{len(self._memo)}"
+            self._memo[codigo] = temporal
+            self.lineas.append(f"{temporal} = {codigo}")
+        return temporal
+
+    @property
+    def nodos_unicos(self) -> int:
+        return len(self._memo)
+
+
+def _compilar_dag(
+    cuerpos: Sequence[ast.expr],
+    variables: Sequence[str],
+    funciones: Dict[str, Callable[..., Any]],
+    como_tupla: bool,
+) -> Tuple[Callable[..., Any], _GeneradorDAG]:
+    generador = _GeneradorDAG()
+    resultados = [generador.emitir(cuerpo) for cuerpo in cuerpos]
+    retorno = f"({', '.join(resultados)},)" if como_tupla else resultados[0]
+
+    # Funciones y constantes no finitas quedan como celdas de clausura:
+    # la evaluación no hace búsquedas en diccionarios de namespace
+    cierres = sorted(generador.funciones) + sorted(generador.constantes)
+    cuerpo_codigo = "".join(f"        {linea}\n" for linea in generador.lineas)
+    codigo = (
+        f"def _fabrica({', '.join(cierres)}):\n"
+        f"    def _funcion({', '.join(variables)}):\n"
+        f"{cuerpo_codigo}"
+        f"        return {retorno}\n"
+        f"    return _funcion\n"
+    )
+    espacio: Dict[str, Any] = {"__builtins__": {}}
+    exec(compile(codigo, "<funcion>", "exec"), espacio)
+    valores = {**funciones, **generador.constantes}
+    return espacio["_fabrica"](*(valores[nombre] for nombre in cierres)), generador
+
+
+def construir_callable(
+    cuerpo: ast.expr,
+    variables: Sequence[str],
+    funciones: Dict[str, Callable[..., Any]],
+) -> Callable[..., Any]:
+    """
+    Genera un callable a partir de un AST ya validado.
+
+    Las funciones usadas quedan capturadas como celdas de clausura y las
+    subexpresiones repetidas se calculan una sola vez.
+    """
+    funcion, _ = _compilar_dag([cuerpo], variables, funciones, como_tupla=False)
+    return funcion
+
+
+class ExpresionCompilada:
+    """
+    Función del usuario validada y compilada una sola vez a un callable de Python.
+
+    ``evaluar`` es el callable escalar crudo (un argumento por variable), útil
+    en bucles calientes; ``evaluar_vector`` evalúa arreglos completos con NumPy
+    y ``evaluar_intervalo`` acota la función sobre una región. Las derivadas simbólicas se calculan bajo demanda y quedan guardadas en la
+    propia expresión, de modo que se compilan una sola vez.
+
+    Si la expresión es un polinomio en una variable, ``coeficientes`` guarda sus
+    coeficientes (orden creciente de grado) y, cuando no agrega operaciones, la
+    evaluación escalar y vectorial usa la forma de Horner.
+    """
+
+    __slots__ = ("fuente", "variables", "arbol", "coeficientes", "evaluar", "_cuerpo_evaluacion",
+                 "_funcion_vectorial", "_funcion_intervalo", "_funcion_compleja", "_derivadas", "_jets")
+
+    def __init__(self, fuente: str, variables: Sequence[str] = ("x",), arbol: ast.expr | None = None):
+        self.variables = tuple(variables)
+        if arbol is None:
+            self.fuente = normalizar_expresion(fuente)
+            self.arbol = analizar_expresion(self.fuente, self.variables)
+        else:
+            # Árbol ya validado (por ejemplo, una derivada generada internamente)
+            self.fuente = fuente
+            self.arbol = arbol
+        self.coeficientes = extraer_coeficientes(self.arbol, self.variables[0]) if len(self.variables) == 1 else None
+        self._cuerpo_evaluacion = self.arbol
+        if self.coeficientes is not None and conviene_horner(self.coeficientes, self.arbol, self.variables[0]):
+            self._cuerpo_evaluacion = arbol_horner(self.coeficientes, self.variables[0])
+        self.evaluar: Callable[..., float] = construir_callable(
+            self._cuerpo_evaluacion, self.variables, _IMPLEMENTACIONES_ESCALARES
+        )
+        self._funcion_vectorial: Callable[..., Any] | None = None
+        self._funcion_intervalo: Callable[..., Intervalo] | None = None
+        self._funcion_compleja: Callable[..., complex] | None = None
+        self._derivadas: Dict[str, ExpresionCompilada] = {}
+        self._jets: Dict[Tuple[int, str], Callable[..., tuple]] = {}
+
+    def __call__(self, *valores: float) -> float:
+        return self.evaluar(*valores)
+
+    @property
+    def usa_horner(self) -> bool:
+        return self._cuerpo_evaluacion is not self.arbol
+
+    def jet(self, orden: int = 1, variable: str | None = None) -> Callable[..., tuple]:
+        """
+        Devuelve un callable que calcula ``(f, f')`` (orden 1) o ``(f, f', f'')``
+        (orden 2) en una sola pasada mediante diferenciación automática.
+        """
+        variable = variable or self.variables[0]
+        clave = (orden, variable)
+        jet = self._jets.get(clave)
+        if jet is None:
+            jet = construir_jet(self.arbol, self.variables, _IMPLEMENTACIONES_ESCALARES, orden, variable)
+            self._jets[clave] = jet
+        return jet
+
+    def derivada(self, orden: int = 1, variable: str | None = None) -> "ExpresionCompilada":
+        """Devuelve la derivada simbólica de orden ``orden`` respecto a ``variable`` (compilada y cacheada)"""
+        if orden < 0:
+            raise ValueError("El orden de la derivada debe ser no negativo")
+        if orden == 0:
+            return self
+        variable = variable or self.variables[0]
+        if variable not in self.variables:
+            raise ValueError(f"La variable '{variable}' no pertenece a la expresión")
+
+        primera = self._derivadas.get(variable)
+        if primera is None:
+            arbol = derivar(self.arbol, variable)
+            primera = ExpresionCompilada(ast.unparse(arbol), self.variables, arbol=arbol)
+            self._derivadas[variable] = primera
+        return primera.derivada(orden - 1, variable)
+
+    def evaluar_vector(self, *valores: Any) -> np.ndarray:
+        """
+        Evalúa la expresión sobre arreglos completos en una sola llamada.
+
+        Las funciones se resuelven a sus ufuncs de NumPy; los puntos fuera del
+        dominio (o con resultado infinito) se devuelven como NaN. Si la
+        evaluación vectorial falla se recurre a la escalar punto a punto.
+        """
+        arreglos = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in valores))
+        forma = arreglos[0].shape
+        if self._funcion_vectorial is None:
+            self._funcion_vectorial = construir_callable(self._cuerpo_evaluacion, self.variables, FUNCIONES_VECTORIALES)
+
+        try:
+            with np.errstate(all="ignore"):
+                ys = np.asarray(self._funcion_vectorial(*arreglos), dtype=float)
+            ys = np.array(np.broadcast_to(ys, forma), dtype=float)
+        except Exception:
+            ys = np.empty(forma, dtype=float)
+            for indice in np.ndindex(forma):
+                try:
+                    ys[indice] = self.evaluar(*(float(a[indice]) for a in arreglos))
+                except Exception:
+                    ys[indice] = np.nan
+
+        ys[~np.isfinite(ys)] = np.nan
+        return ys
+
+    def evaluar_complejo(self, *valores: complex) -> complex:
+        """
+        Evalúa la expresión en un punto complejo (rama principal de ln, sqrt y
+        las potencias fraccionarias). Los errores de dominio se propagan igual
+        que en la evaluación escalar.
+        """
+        if self._funcion_compleja is None:
+            self._funcion_compleja = construir_callable(self._cuerpo_evaluacion, self.variables, FUNCIONES_COMPLEJAS)
+        try:
+            return complex(self._funcion_compleja(*(complex(v) for v in valores)))
+        except TypeError:
+            raise ExpresionInvalidaError(
+                "La función usa operaciones no definidas para números complejos (por ejemplo %)"
+            )
+
+    def evaluar_intervalo(self, *valores: Intervalo | Tuple[float, float] | float) -> Intervalo:
+        """
+        Devuelve un intervalo que contiene con garantía f sobre la región indicada.
+
+        Cada argumento puede ser un Intervalo, un par ``(a, b)`` o un número.
+        Lanza FueraDeDominioError si la función no está definida en ningún
+        punto de la región.
+        """
+        if self._funcion_intervalo is None:
+            self._funcion_intervalo = construir_callable(self.arbol, self.variables, FUNCIONES_INTERVALO)
+        intervalos = [
+            Intervalo(min(v), max(v)) if isinstance(v, tuple) else como_intervalo(v) for v in valores
+        ]
+        return como_intervalo(self._funcion_intervalo(*intervalos))
+
+
+class ConjuntoCompilado:
+    """
+    Varias expresiones sobre las mismas variables compiladas como un único DAG.
+
+    Pensado para evaluar f, f' y f'' (u otras funciones relacionadas) en el
+    mismo punto: los subtérminos compartidos, como ``exp(-x)*sin(x)``, se
+    calculan una sola vez y el resultado es una tupla con un valor por
+    expresión. ``evaluar_vector`` hace lo mismo sobre arreglos de NumPy.
+    """
+
+    __slots__ = ("fuentes", "variables", "arboles", "evaluar", "nodos_totales", "nodos_unicos",
+                 "_funcion_vectorial")
+
+    def __init__(self, fuentes: Sequence[str], variables: Sequence[str] = ("x",)):
+        self.variables = tuple(variables)
+        self.fuentes = tuple(normalizar_expresion(f) for f in fuentes)
+        if not self.fuentes:
+            raise ValueError("Debe indicar al menos una función")
+        self.arboles = [compilar_expresion(f, self.variables).arbol for f in self.fuentes]
+        self.evaluar, generador = _compilar_dag(
+            self.arboles, self.variables, _IMPLEMENTACIONES_ESCALARES, como_tupla=True
+        )
+        self.nodos_totales = generador.nodos_totales
+        self.nodos_unicos = generador.nodos_unicos
+        self._funcion_vectorial: Callable[..., tuple] | None = None
+
+    def __call__(self, *valores: float) -> tuple:
+        return self.evaluar(*valores)
+
+    def evaluar_vector(self, *valores: Any) -> Tuple[np.ndarray, ...]:
+        """Evalúa todas las expresiones sobre arreglos; NaN donde no están definidas"""
+        arreglos = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in valores))
+        forma = arreglos[0].shape
+        if self._funcion_vectorial is None:
+            self._funcion_vectorial, _ = _compilar_dag(
+                self.arboles, self.variables, FUNCIONES_VECTORIALES, como_tupla=True
+            )
+        with np.errstate(all="ignore"):
+            resultados = self._funcion_vectorial(*arreglos)
+        salida = []
+        for ys in resultados:
+            ys = np.array(np.broadcast_to(np.asarray(ys, dtype=float), forma), dtype=float)
+            ys[~np.isfinite(ys)] = np.nan
+            salida.append(ys)
+        return tuple(salida)
+
+    def evaluar_complejo(self, *valores: Any) -> Tuple[np.ndarray, ...]:
+        """
+        Evalúa todas las expresiones sobre arreglos complejos (rama principal de
+        ln, sqrt y las potencias fraccionarias); NaN donde el resultado no es finito.
+        """
+        arreglos = np.broadcast_arrays(*(np.asarray(v, dtype=complex) for v in valores))
+        forma = arreglos[0].shape
+        if self._funcion_vectorial is None:
+            self._funcion_vectorial, _ = _compilar_dag(
+                self.arboles, self.variables, FUNCIONES_VECTORIALES, como_tupla=True
+            )
+        try:
+            with np.errstate(all="ignore"):
+                resultados = self._funcion_vectorial(*arreglos)
+        except TypeError:
+            raise ExpresionInvalidaError(
+                "La función usa operaciones no definidas para números complejos (por ejemplo %)"
+            )
+        salida = []
+        for zs in resultados:
+            zs = np.array(np.broadcast_to(np.asarray(zs, dtype=complex), forma), dtype=complex)
+            zs[~np.isfinite(zs)] = np.nan
+            salida.append(zs)
+        return tuple(salida)
+
+
+# Las claves del memo son los bits del float: distinguen 0.0 de -0.0 y admiten NaN
+_FLOAT_BITS = struct.Struct("<d")
+
+
+class EvaluacionesMemorizadas:
+    """
+    Memo de evaluaciones válido durante una sola resolución.
+
+    Envuelve un callable de un argumento y guarda cada resultado bajo los bits
+    exactos del punto, de modo que cada punto distinto se evalúa una sola vez
+    aunque el método lo vuelva a pedir (extremos reutilizados, columnas de la
+    tabla, la raíz en el gráfico). ``nfev`` cuenta las evaluaciones reales.
+    """
+
+    __slots__ = ("evaluar", "valores", "nfev", "reutilizadas")
+
+    def __init__(self, evaluar: Callable[[float], Any]):
+        self.evaluar = evaluar
+        self.valores: Dict[bytes, Any] = {}
+        self.nfev = 0
+        self.reutilizadas = 0
+
+    def __call__(self, x: float) -> Any:
+        clave = _FLOAT_BITS.pack(x)
+        valor = self.valores.get(clave)
+        if valor is not None:
+            self.reutilizadas += 1
+            return valor
+        self.nfev += 1
+        valor = self.evaluar(x)
+        self.valores[clave] = valor
+        return valor
+
+    def estadisticas(self) -> Dict[str, int]:
+        return {"nfev": self.nfev, "evaluaciones_reutilizadas": self.reutilizadas}
+
+
+class CacheExpresiones:
+    """
+    Caché LRU acotada de expresiones compiladas, compartida entre peticiones.
+
+    Lleva contadores de aciertos, fallos y desalojos para poder observar
+    su efectividad desde el endpoint de salud.
+    """
+
+    def __init__(self, capacidad: int = 256, fabrica: Callable[..., Any] = ExpresionCompilada):
+        if capacidad <= 0:
+            raise ValueError("La capacidad de la caché debe ser positiva")
+        self.capacidad = capacidad
+        self._fabrica = fabrica
+        self._entradas: "OrderedDict[Tuple[Any, Tuple[str, ...]], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+    def obtener(self, funcion: str | Sequence[str], variables: Sequence[str] = ("x",)) -> Any:
+        """Devuelve la expresión compilada para ``funcion``, compilándola si no está en caché"""
+        if isinstance(funcion, str):
+            clave = (normalizar_expresion(funcion), tuple(variables))
+        else:
+            clave = (tuple(normalizar_expresion(f) for f in funcion), tuple(variables))
+        with self._lock:
+            expresion = self._entradas.get(clave)
+            if expresion is not None:
+                self._entradas.move_to_end(clave)
+                self.aciertos += 1
+                return expresion
+            self.fallos += 1
+
+        # La compilación se hace fuera del lock; si falla no se guarda nada
+        expresion = self._fabrica(*clave)
+
+        with self._lock:
+            self._entradas[clave] = expresion
+            self._entradas.move_to_end(clave)
+            while len(self._entradas) > self.capacidad:
+                self._entradas.popitem(last=False)
+                self.desalojos += 1
+        return expresion
+
+    def registrar(self, expresion: ExpresionCompilada) -> None:
+        """Agrega a la caché una expresión compilada por otra vía (p. ej. una derivada)"""
+        clave = (expresion.fuente, expresion.variables)
+        with self._lock:
+            if clave in self._entradas:
+                return
+            self._entradas[clave] = expresion
+            while len(self._entradas) > self.capacidad:
+                self._entradas.popitem(last=False)
+                self.desalojos += 1
+
+    def limpiar(self) -> None:
+        with self._lock:
+            self._entradas.clear()
+            self.aciertos = 0
+            self.fallos = 0
+            self.desalojos = 0
+
+    def estadisticas(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "tamano": len(self._entradas),
+                "capacidad": self.capacidad,
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "desalojos": self.desalojos,
+            }
+
+
+# Cachés globales compartidas por todos los servicios
+cache_expresiones = CacheExpresiones()
+cache_conjuntos = CacheExpresiones(capacidad=128, fabrica=ConjuntoCompilado)
+
+
+def validar_variables(variables: Sequence[str]) -> Tuple[str, ...]:
+    """
+    Comprueba los nombres de variables enviados por el cliente (sistemas de
+    ecuaciones, parámetros): identificadores distintos que no ocultan una
+    constante, función o módulo permitido. Los nombres que empiezan con '_'
+    se reservan para los temporales y las referencias del código generado.
+    """
+    variables = tuple(v.strip() for v in variables)
+    if not variables:
+        raise ExpresionInvalidaError("Debe indicar al menos una variable")
+    reservados = set(CONSTANTES) | set(FUNCIONES_ESCALARES) | set(ALIAS_FUNCIONES) | set(MODULOS_PERMITIDOS)
+    for variable in variables:
+        if not variable.isidentifier() or keyword.iskeyword(variable):
+            raise ExpresionInvalidaError(f"Nombre de variable inválido: '{variable}'")
+        if variable.startswith("_") or variable in reservados:
+            raise ExpresionInvalidaError(f"El nombre '{variable}' está reservado y no puede usarse como variable")
+    if len(set(variables)) != len(variables):
+        raise ExpresionInvalidaError("Los nombres de las variables deben ser distintos")
+    return variables
+
+
+def compilar_expresion(funcion: str, variables: Sequence[str] = ("x",)) -> ExpresionCompilada:
+    """Obtiene (desde la caché) la versión compilada y validada de una función string"""
+    return cache_expresiones.obtener(funcion, variables)
+
+
+def derivar_expresion(funcion: str, orden: int = 1, variable: str = "x",
+                      variables: Sequence[str] = ("x",)) -> ExpresionCompilada:
+    """
+    Obtiene la derivada simbólica de una función string.
+
+    La derivada se guarda junto a la expresión original y además se registra
+    en la caché bajo su propio texto, de modo que evaluarla por nombre no
+    requiere volver a analizarla.
+    """
+    derivada = compilar_expresion(funcion, variables).derivada(orden, variable)
+    cache_expresiones.registrar(derivada)
+    return derivada
+
+
+def compilar_conjunto(funciones: Sequence[str], variables: Sequence[str] = ("x",)) -> ConjuntoCompilado:
+    """Obtiene (desde la caché) la compilación conjunta con subexpresiones comunes de varias funciones"""
+    return cache_conjuntos.obtener(tuple(funciones), variables)
@@ -0,0 +1,281 @@
+"""
+Aritmética de intervalos para el lenguaje de expresiones de services.expresiones.
+
+Evaluar una expresión compilada con argumentos ``Intervalo`` devuelve un
+intervalo que contiene con garantía todos los valores de la función sobre la
+región de entrada: cada operación redondea hacia afuera (math.nextafter) y las
+funciones no monótonas tienen en cuenta sus extremos interiores. Si el
+resultado no contiene el cero, la función no tiene raíces en esa región.
+
+Las partes de la región fuera del dominio (sqrt de negativos, ln de no
+positivos) se recortan; si la función no está definida en ningún punto se
+lanza FueraDeDominioError.
+"""
+
+import math
+from typing import Callable, Dict
+
+_INF = math.inf
+_DOS_PI = 2.0 * math.pi
+
+
+class FueraDeDominioError(ValueError):
+    """La función no está definida en ningún punto del intervalo"""
+
+
+def _abajo(valor: float) -> float:
+    return math.nextafter(valor, -_INF)
+
+
+def _arriba(valor: float) -> float:
+    return math.nextafter(valor, _INF)
+
+
+def _potencia_float(base: float, exponente: float) -> float:
+    try:
+        return base ** exponente
+    except OverflowError:
+        return _INF if base > 0 or exponente % 2 == 0 else -_INF
+    except ZeroDivisionError:
+        return _INF
+
+
+def _llamar_monotona(funcion: Callable[[float], float], valor: float, desborde: float) -> float:
+    try:
+        return funcion(valor)
+    except OverflowError:
+        return desborde
+
+
+class Intervalo:
+    """Intervalo cerrado [inf, sup] de números reales (los extremos pueden ser ±inf)"""
+
+    __slots__ = ("inf", "sup")
+
+    def __init__(self, inf: float, sup: float | None = None):
+        inf = float(inf)
+        sup = inf if sup is None else float(sup)
+        if math.isnan(inf) or math.isnan(sup):
+            # Formas indeterminadas (inf - inf, inf/inf): no se puede acotar nada
+            inf, sup = -_INF, _INF
+        if inf > sup:
+            raise ValueError("El extremo inferior del intervalo no puede ser mayor que el superior")
+        self.inf = inf
+        self.sup = sup
+
+    @classmethod
+    def real(cls) -> "Intervalo":
+        return cls(-_INF, _INF)
+
+    @classmethod
+    def redondeado(cls, inf: float, sup: float) -> "Intervalo":
+        """Intervalo ensanchado un ulp hacia afuera para cubrir el error de redondeo"""
+        return cls(_abajo(inf), _arriba(sup))
+
+    @property
+    def ancho(self) -> float:
+        return self.sup - self.inf
+
+    def es_punto(self) -> bool:
+        return self.inf == self.sup
+
+    def contiene(self, valor: float) -> bool:
+        return self.inf <= valor <= self.sup
+
+    def __repr__(self) -> str:
+        return f"Intervalo({self.inf!r}, {self.sup!r})"
+
+    # --- aritmética ---------------------------------------------------------------
+
+    def __pos__(self) -> "Intervalo":
+        return self
+
+    def __neg__(self) -> "Intervalo":
+        return Intervalo(-self.sup, -self.inf)
+
+    def __add__(self, otro) -> "Intervalo":
+        otro = como_intervalo(otro)
+        return Intervalo.redondeado(self.inf + otro.inf, self.sup + otro.sup)
+
+    __radd__ = __add__
+
+    def __sub__(self, otro) -> "Intervalo":
+        otro = como_intervalo(otro)
+        return Intervalo.redondeado(self.inf - otro.sup, self.sup - otro.inf)
+
+    def __rsub__(self, otro) -> "Intervalo":
+        return como_intervalo(otro) - self
+
+    def __mul__(self, otro) -> "Intervalo":
+        otro = como_intervalo(otro)
+        # Convención de la aritmética de intervalos: 0·inf = 0 en los extremos
+        productos = [
+            0.0 if math.isnan(p) else p
+            for p in (self.inf * otro.inf, self.inf * otro.sup, self.sup * otro.inf, self.sup * otro.sup)
+        ]
+        return Intervalo.redondeado(min(productos), max(productos))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, otro) -> "Intervalo":
+        otro = como_intervalo(otro)
+        if otro.contiene(0.0):
+            return Intervalo.real()
+        cocientes = [self.inf / otro.inf, self.inf / otro.sup, self.sup / otro.inf, self.sup / otro.sup]
+        if any(math.isnan(c) for c in cocientes):
+            return Intervalo.real()
+        return Intervalo.redondeado(min(cocientes), max(cocientes))
+
+    def __rtruediv__(self, otro) -> "Intervalo":
+        return como_intervalo(otro) / self
+
+    def __pow__(self, otro) -> "Intervalo":
+        return potencia(self, otro)
+
+    def __rpow__(self, otro) -> "Intervalo":
+        return potencia(como_intervalo(otro), self)
+
+    def __mod__(self, otro) -> "Intervalo":
+        otro = como_intervalo(otro)
+        if not otro.es_punto() or not all(map(math.isfinite, (self.inf, self.sup))):
+            return Intervalo.real()
+        divisor = otro.inf
+        if divisor == 0.0:
+            raise FueraDeDominioError("Módulo por cero")
+        cociente = math.floor(self.inf / divisor)
+        if cociente == math.floor(self.sup / divisor):
+            # Sin saltos dentro del intervalo: x % c = x - c·q con q fijo
+            resultado = Intervalo.redondeado(self.inf - divisor * cociente, self.sup - divisor * cociente)
+            return Intervalo(max(resultado.inf, min(0.0, divisor)), min(resultado.sup, max(0.0, divisor)))
+        return Intervalo(min(0.0, divisor), max(0.0, divisor))
+
+    def __rmod__(self, otro) -> "Intervalo":
+        return como_intervalo(otro) % self
+
+
+def como_intervalo(valor) -> Intervalo:
+    if isinstance(valor, Intervalo):
+        return valor
+    return Intervalo(valor)
+
+
+# --- funciones elementales ---------------------------------------------------------
+
+def potencia(base: Intervalo, exponente: Intervalo | float) -> Intervalo:
+    base, exponente = como_intervalo(base), como_intervalo(exponente)
+    if exponente.es_punto():
+        n = exponente.inf
+        if n == 0.0:
+            return Intervalo(1.0)
+        if n.is_integer():
+            if n < 0:
+                return Intervalo(1.0) / potencia(base, -n)
+            a, b = _potencia_float(base.inf, n), _potencia_float(base.sup, n)
+            if n % 2 == 1 or base.inf >= 0:
+                return Intervalo.redondeado(min(a, b), max(a, b))
+            if base.sup <= 0:
+                return Intervalo.redondeado(b, a)
+            return Intervalo(0.0, _arriba(max(a, b)))
+
+        # Exponente fraccionario: solo está definido para bases no negativas
+        if base.sup < 0:
+            raise FueraDeDominioError("Potencia fraccionaria de un número negativo")
+        inferior = max(base.inf, 0.0)
+        a, b = _potencia_float(inferior, n), _potencia_float(base.sup, n)
+        return Intervalo.redondeado(min(a, b), max(a, b))
+
+    # Exponente variable: u^v = exp(v·ln u), solo para bases positivas
+    if base.inf <= 0:
+        return Intervalo.real()
+    return exp(exponente * ln(base))
+
+
+def exp(x: Intervalo) -> Intervalo:
+    x = como_intervalo(x)
+    inferior = _llamar_monotona(math.exp, x.inf, _INF)
+    superior = _llamar_monotona(math.exp, x.sup, _INF)
+    return Intervalo(max(0.0, _abajo(inferior)), _arriba(superior))
+
+
+def _logaritmo(x: Intervalo, funcion: Callable[[float], float]) -> Intervalo:
+    x = como_intervalo(x)
+    if x.sup <= 0:
+        raise FueraDeDominioError("Logaritmo de un número no positivo")
+    inferior = -_INF if x.inf <= 0 else _abajo(funcion(x.inf))
+    superior = _INF if x.sup == _INF else _arriba(funcion(x.sup))
+    return Intervalo(inferior, superior)
+
+
+def ln(x: Intervalo) -> Intervalo:
+    return _logaritmo(x, math.log)
+
+
+def log10(x: Intervalo) -> Intervalo:
+    return _logaritmo(x, math.log10)
+
+
+def sqrt(x: Intervalo) -> Intervalo:
+    x = como_intervalo(x)
+    if x.sup < 0:
+        raise FueraDeDominioError("Raíz cuadrada de un número negativo")
+    inferior = 0.0 if x.inf <= 0 else max(0.0, _abajo(math.sqrt(x.inf)))
+    return Intervalo(inferior, _arriba(math.sqrt(x.sup)))
+
+
+def valor_absoluto(x: Intervalo) -> Intervalo:
+    x = como_intervalo(x)
+    if x.inf >= 0:
+        return x
+    if x.sup <= 0:
+        return -x
+    return Intervalo(0.0, max(-x.inf, x.sup))
+
+
+def _contiene_punto_periodico(x: Intervalo, fase: float, periodo: float) -> bool:
+    """Indica si [inf, sup] contiene algún fase + k·periodo (con holgura a favor de sí)"""
+    holgura = 1e-12 * max(1.0, abs(x.inf), abs(x.sup))
+    k = math.ceil((x.inf - holgura - fase) / periodo)
+    return fase + k * periodo <= x.sup + holgura
+
+
+def _trigonometrica(x: Intervalo, funcion: Callable[[float], float], fase_maximo: float) -> Intervalo:
+    x = como_intervalo(x)
+    if not (math.isfinite(x.inf) and math.isfinite(x.sup)) or x.ancho >= _DOS_PI or abs(x.inf) > 1e8:
+        return Intervalo(-1.0, 1.0)
+    a, b = funcion(x.inf), funcion(x.sup)
+    inferior, superior = _abajo(min(a, b)), _arriba(max(a, b))
+    if _contiene_punto_periodico(x, fase_maximo, _DOS_PI):
+        superior = 1.0
+    if _contiene_punto_periodico(x, fase_maximo + math.pi, _DOS_PI):
+        inferior = -1.0
+    return Intervalo(max(-1.0, inferior), min(1.0, superior))
+
+
+def sin(x: Intervalo) -> Intervalo:
+    return _trigonometrica(x, math.sin, math.pi / 2)
+
+
+def cos(x: Intervalo) -> Intervalo:
+    return _trigonometrica(x, math.cos, 0.0)
+
+
+def tan(x: Intervalo) -> Intervalo:
+    x = como_intervalo(x)
+    if (not (math.isfinite(x.inf) and math.isfinite(x.sup)) or x.ancho >= math.pi
+            or _contiene_punto_periodico(x, math.pi / 2, math.pi)):
+        return Intervalo.real()
+    return Intervalo.redondeado(math.tan(x.inf), math.tan(x.sup))
+
+
+# Implementaciones por intervalos de las funciones de la lista blanca
+FUNCIONES_INTERVALO: Dict[str, Callable[..., Intervalo]] = {
+    'sin': sin,
+    'cos': cos,
+    'tan': tan,
+    'exp': exp,
+    'log10': log10,
+    'ln': ln,
+    'sqrt': sqrt,
+    'abs': valor_absoluto,
+    'pow': potencia,
+}
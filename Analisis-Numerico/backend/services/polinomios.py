@@ -0,0 +1,204 @@
+"""
+Reconocimiento y tratamiento especial de las funciones polinómicas.
+
+Muchas de las funciones enviadas son polinomios (``x**3 - 2*x - 5``). Sobre el
+AST ya validado se extraen sus coeficientes; con ellos la expresión se evalúa
+con el esquema de Horner y se pueden obtener todas sus raíces, reales y
+complejas, como valores propios de la matriz compañera seguidos de unos pasos
+de Newton para pulirlas.
+
+Los coeficientes se representan como arreglos de NumPy en orden creciente de
+grado: ``coeficientes[k]`` multiplica a ``x**k``.
+"""
+
+import ast
+from typing import Dict, List
+
+import numpy as np
+
+# Grado máximo que se trata como polinomio (más allá la matriz compañera y los
+# coeficientes expandidos pierden precisión y no compensan)
+GRADO_MAXIMO = 64
+
+_EPSILON = np.finfo(float).eps
+
+
+class _NoPolinomio(Exception):
+    pass
+
+
+def _sumar(p: np.ndarray, q: np.ndarray) -> np.ndarray:
+    if len(p) < len(q):
+        p, q = q, p
+    resultado = p.copy()
+    resultado[:len(q)] += q
+    return resultado
+
+
+def _coeficientes(nodo: ast.expr, variable: str) -> np.ndarray:
+    if isinstance(nodo, ast.Constant):
+        return np.array([nodo.value], dtype=float)
+    if isinstance(nodo, ast.Name):
+        if nodo.id != variable:
+            raise _NoPolinomio()
+        return np.array([0.0, 1.0])
+    if isinstance(nodo, ast.UnaryOp):
+        return -_coeficientes(nodo.operand, variable)
+    if isinstance(nodo, ast.Call) and nodo.func.id == "pow":
+        base, exponente = nodo.args
+    elif isinstance(nodo, ast.BinOp) and isinstance(nodo.op, ast.Pow):
+        base, exponente = nodo.left, nodo.right
+    elif isinstance(nodo, ast.BinOp):
+        izquierdo = _coeficientes(nodo.left, variable)
+        if isinstance(nodo.op, ast.Div):
+            # Solo la división por una constante conserva el polinomio
+            if not isinstance(nodo.right, ast.Constant) or nodo.right.value == 0:
+                raise _NoPolinomio()
+            return izquierdo / nodo.right.value
+        derecho = _coeficientes(nodo.right, variable)
+        if isinstance(nodo.op, ast.Add):
+            return _sumar(izquierdo, derecho)
+        if isinstance(nodo.op, ast.Sub):
+            return _sumar(izquierdo, -derecho)
+        if isinstance(nodo.op, ast.Mult):
+            if len(izquierdo) + len(derecho) - 2 > GRADO_MAXIMO:
+                raise _NoPolinomio()
+            return np.convolve(izquierdo, derecho)
+        raise _NoPolinomio()
+    else:
+        raise _NoPolinomio()
+
+    # Potencia: exponente entero constante no negativo
+    if not isinstance(exponente, ast.Constant):
+        raise _NoPolinomio()
+    n = exponente.value
+    if n < 0 or not float(n).is_integer():
+        raise _NoPolinomio()
+    base = _coeficientes(base, variable)
+    if (len(base) - 1) * n > GRADO_MAXIMO:
+        raise _NoPolinomio()
+    resultado = np.array([1.0])
+    for _ in range(int(n)):
+        resultado = np.convolve(resultado, base)
+    return resultado
+
+
+def recortar(coeficientes: np.ndarray) -> np.ndarray:
+    """Elimina los coeficientes nulos de mayor grado (deja al menos uno)"""
+    distintos = np.flatnonzero(coeficientes)
+    return coeficientes[:distintos[-1] + 1] if len(distintos) else coeficientes[:1]
+
+
+def extraer_coeficientes(arbol: ast.expr, variable: str = "x") -> np.ndarray | None:
+    """
+    Coeficientes (en orden creciente de grado) de un AST validado si representa
+    un polinomio en ``variable`` de grado a lo sumo GRADO_MAXIMO; None si no.
+    """
+    try:
+        coeficientes = _coeficientes(arbol, variable)
+    except (_NoPolinomio, RecursionError):
+        return None
+    if not np.all(np.isfinite(coeficientes)):
+        return None
+    return recortar(coeficientes)
+
+
+def _nodos(arbol: ast.expr) -> int:
+    return sum(isinstance(nodo, ast.expr) for nodo in ast.walk(arbol))
+
+
+def conviene_horner(coeficientes: np.ndarray, arbol: ast.expr, variable: str = "x") -> bool:
+    """
+    Indica si evaluar la forma de Horner es preferible a la expresión original.
+
+    Solo se usa cuando no agrega operaciones: los polinomios muy dispersos
+    (``x**40 - 1``) o ya factorizados (``(x + 1)**6``) se evalúan más rápido,
+    y en el segundo caso con más precisión cerca de las raíces, tal como están.
+    """
+    return len(coeficientes) > 2 and _nodos(arbol_horner(coeficientes, variable)) <= _nodos(arbol)
+
+
+def arbol_horner(coeficientes: np.ndarray, variable: str = "x") -> ast.expr:
+    """AST equivalente al polinomio en forma de Horner: (((a_n·x + a_{n-1})·x + ...)·x + a_0)"""
+    x = ast.Name(id=variable, ctx=ast.Load())
+    principal = float(coeficientes[-1])
+    arbol: ast.expr = ast.Constant(value=principal)
+    for grado, coeficiente in enumerate(reversed(coeficientes[:-1])):
+        if grado == 0 and principal == 1.0:
+            arbol = x
+        elif grado == 0 and principal == -1.0:
+            arbol = ast.UnaryOp(op=ast.USub(), operand=x)
+        else:
+            arbol = ast.BinOp(left=arbol, op=ast.Mult(), right=x)
+        if coeficiente != 0:
+            operador = ast.Add() if coeficiente > 0 else ast.Sub()
+            arbol = ast.BinOp(left=arbol, op=operador, right=ast.Constant(value=abs(float(coeficiente))))
+    return arbol
+
+
+def horner(coeficientes: np.ndarray, x):
+    """Evalúa el polinomio y su derivada en x (real, complejo o arreglo) con Horner"""
+    p = coeficientes[-1] * np.ones_like(x)
+    dp = np.zeros_like(p)
+    for coeficiente in coeficientes[-2::-1]:
+        dp = dp * x + p
+        p = p * x + coeficiente
+    return p, dp
+
+
+def _cota_redondeo(coeficientes: np.ndarray, x: complex) -> float:
+    """Cota del error de redondeo de Horner en x: ε·Σ|a_k|·|x|^k (con holgura)"""
+    valor, _ = horner(np.abs(coeficientes), abs(x))
+    return 4 * len(coeficientes) * _EPSILON * float(valor)
+
+
+def calcular_raices(coeficientes: np.ndarray, tolerancia: float = 1e-12,
+                     niter: int = 50) -> List[Dict[str, float | int | bool | complex]]:
+    """
+    Todas las raíces de un polinomio (con multiplicidad), ordenadas.
+
+    Las aproximaciones iniciales son los valores propios de la matriz
+    compañera; cada una se pule con Newton (Horner complejo) mientras el
+    residuo disminuya. Una raíz se considera real si al descartar su parte
+    imaginaria el residuo queda al nivel del error de redondeo.
+    """
+    coeficientes = recortar(np.asarray(coeficientes, dtype=float))
+    grado = len(coeficientes) - 1
+    if grado < 1:
+        raise ValueError("El polinomio es constante: no tiene raíces que calcular")
+
+    # Las raíces nulas se separan (coeficientes de menor grado iguales a cero)
+    nulas = int(np.flatnonzero(coeficientes)[0])
+    reducido = coeficientes[nulas:]
+    aproximaciones: List[complex] = [0j] * nulas
+    if len(reducido) > 1:
+        n = len(reducido) - 1
+        companera = np.zeros((n, n))
+        companera[1:, :-1] = np.eye(n - 1)
+        companera[:, -1] = -reducido[:-1] / reducido[-1]
+        aproximaciones += list(np.linalg.eigvals(companera))
+
+    raices = []
+    for z in aproximaciones:
+        z = complex(z)
+        p, dp = horner(coeficientes, z)
+        pasos = 0
+        while pasos < niter and p != 0 and dp != 0:
+            candidato = z - p / dp
+            p_candidato, dp_candidato = horner(coeficientes, candidato)
+            if abs(p_candidato) >= abs(p):
+                break
+            paso = abs(candidato - z)
+            z, p, dp = candidato, p_candidato, dp_candidato
+            pasos += 1
+            if paso <= tolerancia * max(1.0, abs(z)):
+                break
+
+        p_real, _ = horner(coeficientes, complex(z.real))
+        real = z.imag == 0 or abs(p_real) <= abs(p) + _cota_redondeo(coeficientes, z.real)
+        if real:
+            z, p = complex(z.real), p_real
+        raices.append({"raiz": z, "residuo": float(abs(p)), "pasos_newton": pasos, "real": real})
+
+    raices.sort(key=lambda r: (not r["real"], r["raiz"].real, r["raiz"].imag))
+    return raices
@@ -0,0 +1,51 @@
+from services.convergencia import MonitorConvergencia
+from services.ecuaciones_service import EcuacionesService
+
+
+def _errores(respuesta):
+    return [it["error"] for it in respuesta["iteraciones"] if it["error"] is not None]
+
+
+def test_newton_no_se_detiene_en_su_fase_lineal():
+    # Lejos de la raíz Newton avanza con razón ≈ 0.95 antes de volverse cuadrático
+    respuesta = EcuacionesService().newton_raphson(10, 1e-7, 200, "x**20-1")
+
+    assert respuesta["exito"]
+    assert respuesta["iteraciones"][-1]["iteracion"] == 49
+    assert not respuesta["resumen"]["convergencia"]["detencion_temprana"]
+
+
+def test_secante_no_se_detiene_en_su_fase_lineal():
+    respuesta = EcuacionesService().secante(10, 9.9, 1e-7, 200, "x**20-1")
+
+    assert respuesta["exito"]
+    assert respuesta["iteraciones"][-1]["iteracion"] == 70
+
+
+def test_la_misma_traza_detiene_a_un_metodo_lineal():
+    errores = _errores(EcuacionesService().newton_raphson(10, 1e-7, 200, "x**20-1"))
+
+    lineal = MonitorConvergencia(1e-7, 200, orden=1.0)
+    detenciones = [lineal.registrar(e, i) for i, e in enumerate(errores, start=1)]
+    assert any(d is not None and "lineal lenta" in d for d in detenciones)
+
+    cuadratico = MonitorConvergencia(1e-7, 200, orden=2.0)
+    assert all(cuadratico.registrar(e, i) is None for i, e in enumerate(errores, start=1))
+    assert cuadratico.estado["iteraciones_restantes_estimadas"] is not None
+
+
+def test_punto_fijo_lineal_lento_se_detiene():
+    respuesta = EcuacionesService().punto_fijo(0.5, 1e-12, 30, "x-(0.99*x)", "0.99*x")
+
+    assert not respuesta["exito"]
+    assert respuesta["resumen"]["convergencia"]["detencion_temprana"]
+    assert respuesta["resumen"]["convergencia"]["diagnostico"] == "lineal_lenta"
+
+
+def test_divergencia_se_detiene_en_metodos_superlineales():
+    respuesta = EcuacionesService().punto_fijo(1.5, 1e-10, 200, "x**2-x-3", "x**2-3", aceleracion="ninguna")
+    assert respuesta["resumen"]["convergencia"]["diagnostico"] == "divergente"
+
+    monitor = MonitorConvergencia(1e-10, 200, orden=2.0)
+    errores = [1.0 * 3 ** k for k in range(8)]
+    assert any(monitor.registrar(e, i) is not None for i, e in enumerate(errores, start=1))
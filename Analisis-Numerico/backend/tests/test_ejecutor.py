@@ -0,0 +1,55 @@
+import asyncio
+from concurrent.futures import Future
+
+from services.ejecutor import EjecutorAislado
+
+
+def test_perdedor_cancelado_conserva_su_cupo_hasta_terminar():
+    ejecutor = EjecutorAislado(trabajadores=1, cola_maxima=0)
+    en_trabajador = Future()
+    en_trabajador.set_running_or_notify_cancel()
+
+    async def en_pool(servicio, metodo, argumentos, en_curso, reintentar):
+        en_curso.append(en_trabajador)
+        await asyncio.wrap_future(en_trabajador)
+
+    ejecutor._ejecutar_en_pool = en_pool
+
+    async def carrera():
+        tarea = asyncio.ensure_future(ejecutor.ejecutar("ecuaciones", "newton_raphson", lento=True))
+        await asyncio.sleep(0)
+        tarea.cancel()
+        await asyncio.gather(tarea, return_exceptions=True)
+
+    asyncio.run(carrera())
+    estadisticas = ejecutor.estadisticas()
+    assert estadisticas["activas"] == 1
+    assert estadisticas["activas_lentas"] == 1
+    assert estadisticas["descartadas"] == 1
+
+    en_trabajador.set_result(None)
+    estadisticas = ejecutor.estadisticas()
+    assert estadisticas["activas"] == 0
+    assert estadisticas["activas_lentas"] == 0
+    assert estadisticas["completadas"] == 1
+
+
+def test_cancelada_en_cola_libera_su_cupo():
+    ejecutor = EjecutorAislado(trabajadores=1, cola_maxima=0)
+    en_cola = Future()
+
+    async def en_pool(servicio, metodo, argumentos, en_curso, reintentar):
+        en_curso.append(en_cola)
+        await asyncio.wrap_future(en_cola)
+
+    ejecutor._ejecutar_en_pool = en_pool
+
+    async def carrera():
+        tarea = asyncio.ensure_future(ejecutor.ejecutar("ecuaciones", "newton_raphson"))
+        await asyncio.sleep(0)
+        tarea.cancel()
+        await asyncio.gather(tarea, return_exceptions=True)
+
+    asyncio.run(carrera())
+    assert ejecutor.estadisticas()["activas"] == 0
+    assert ejecutor.estadisticas()["descartadas"] == 0
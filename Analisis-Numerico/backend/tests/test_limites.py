@@ -0,0 +1,53 @@
+import pytest
+
+from services.ecuaciones_service import EcuacionesService
+from services.ejecutor import LimiteExcedidoError
+
+
+def _agotar_en(llamada, evaluar):
+    """Envuelve ``evaluar`` para que la llamada número ``llamada`` exceda el límite de CPU"""
+    llamadas = {"n": 0}
+
+    def envuelta(*args, **kwargs):
+        llamadas["n"] += 1
+        if llamadas["n"] >= llamada:
+            raise LimiteExcedidoError("La evaluación superó el tiempo de CPU permitido")
+        return evaluar(*args, **kwargs)
+
+    return envuelta
+
+
+@pytest.fixture
+def servicio(monkeypatch):
+    servicio = EcuacionesService()
+    original_derivadas = servicio._evaluador_con_derivadas
+    original_memo = servicio._funcion_memorizada
+    monkeypatch.setattr(
+        servicio, "_evaluador_con_derivadas",
+        lambda *args: _agotar_en(3, original_derivadas(*args)),
+    )
+    monkeypatch.setattr(servicio, "_funcion_memorizada", lambda *args: _agotar_en(3, original_memo(*args)))
+    return servicio
+
+
+@pytest.mark.parametrize("metodo, argumentos", [
+    ("newton_raphson", dict(x0=10, tolerancia=1e-12, niter=50, funcion_f="x**20-1")),
+    ("raices_multiples", dict(x0=3, tolerancia=1e-12, niter=50, funcion_f="(x-1)**3*exp(x)")),
+    ("halley", dict(x0=10, tolerancia=1e-12, niter=50, funcion_f="x**20-1")),
+    ("secante", dict(x0=10, x1=9.9, tolerancia=1e-12, niter=50, funcion="x**20-1")),
+    ("newton_seguro", dict(xi=0, xs=10, tolerancia=1e-12, niter=50, funcion_f="x**20-1")),
+])
+def test_limite_de_cpu_no_se_convierte_en_respuesta(servicio, metodo, argumentos):
+    with pytest.raises(LimiteExcedidoError):
+        getattr(servicio, metodo)(**argumentos)
+
+
+def test_memoria_agotada_no_se_convierte_en_respuesta(monkeypatch):
+    servicio = EcuacionesService()
+
+    def sin_memoria(*args):
+        raise MemoryError()
+
+    monkeypatch.setattr(servicio, "_evaluador_con_derivadas", lambda *args: sin_memoria)
+    with pytest.raises(MemoryError):
+        servicio.newton_raphson(10, 1e-12, 50, "x**20-1")
@@ -44,7 +44,8 @@ document.getElementById('puntoFijoForm').addEventListener('submit', async functi
         niter: parseInt(document.getElementById('pf_niter').value),
         funcion_f: document.getElementById('pf_funcion_f').value,
         funcion_g: document.getElementById('pf_funcion_g').value,
-        tipo_error: document.getElementById('pf_tipo_error').value
+        tipo_error: document.getElementById('pf_tipo_error').value,
+        aceleracion: document.getElementById('pf_aceleracion').value
     };
     
     try {
@@ -80,7 +81,8 @@ document.getElementById('reglaFalsaForm').addEventListener('submit', async funct
         tolerancia: parseFloat(document.getElementById('rf_tol').value),
         niter: parseInt(document.getElementById('rf_niter').value),
         funcion: document.getElementById('rf_funcion').value,
-        tipo_error: document.getElementById('rf_tipo_error').value
+        tipo_error: document.getElementById('rf_tipo_error').value,
+        variante: document.getElementById('rf_variante').value
     };
     
     try {
@@ -114,7 +116,9 @@ document.getElementById('busquedaForm').addEventListener('submit', async functio
         x0: parseFloat(document.getElementById('bi_x0').value),
         delta: parseFloat(document.getElementById('bi_delta').value),
         niter: parseInt(document.getElementById('bi_niter').value),
-        funcion: document.getElementById('bi_funcion').value
+        funcion: document.getElementById('bi_funcion').value,
+        todos: document.getElementById('bi_todos').checked,
+        adaptativo: document.getElementById('bi_adaptativo').checked
     };
     
     try {